@@ -0,0 +1,90 @@
+"""
+Measure the import time of the CLI entry point against a tracked budget.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters, parses
+the per-module timings, and fails when the median cumulative time exceeds the
+budget in import_budget.json or when a module listed as forbidden (heavy
+dependencies that must load on first use) is imported.
+
+Usage:
+    python benchmarks/import_time.py [--runs 5] [--top 15] [--budget-file PATH]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_budget.json")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+def measure(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Import a module in a fresh interpreter and collect -X importtime output.
+
+    Args:
+        module: Dotted name of the module to import.
+
+    Returns:
+        A mapping of module name to (self_us, cumulative_us).
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=REPO_ROOT
+    )
+    if completed.returncode != 0:
+        sys.exit(f"Importing {module} failed:\n{completed.stderr[-2000:]}")
+
+    timings = {}
+    for line in completed.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            timings[name] = (int(self_us), int(cumulative_us))
+    return timings
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreters to measure")
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest modules to list")
+    parser.add_argument("--budget-file", default=BUDGET_FILE, help="Path to the budget JSON file")
+    args = parser.parse_args()
+
+    with open(args.budget_file) as f:
+        budget = json.load(f)
+    module = budget["module"]
+
+    runs: List[Dict[str, Tuple[int, int]]] = [measure(module) for _ in range(args.runs)]
+    totals_ms = [run[module][1] / 1000 for run in runs]
+    median_ms = statistics.median(totals_ms)
+
+    # Rank by self time in the fastest run, which is the least noisy
+    fastest = min(runs, key=lambda run: run[module][1])
+    slowest_modules = sorted(fastest.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+
+    print(f"{module}: median {median_ms:.1f} ms over {args.runs} runs "
+          f"(min {min(totals_ms):.1f}, max {max(totals_ms):.1f}); budget {budget['budget_ms']} ms")
+    print(f"\n{'self ms':>9}{'cumul ms':>10}  module")
+    for name, (self_us, cumulative_us) in slowest_modules:
+        print(f"{self_us / 1000:>9.1f}{cumulative_us / 1000:>10.1f}  {name}")
+
+    failures = []
+    loaded_forbidden = sorted(name for name in budget.get("forbidden", []) if name in fastest)
+    if loaded_forbidden:
+        failures.append(f"heavy modules imported eagerly: {', '.join(loaded_forbidden)}")
+    if median_ms > budget["budget_ms"]:
+        failures.append(f"median import time {median_ms:.1f} ms exceeds budget of {budget['budget_ms']} ms")
+
+    if failures:
+        print("\nFAIL: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nOK: within budget")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark ToolAgent action selection: compiled intent router vs. the regex cascade it replaced.
+
+The legacy cascade is reproduced below verbatim (one re.search per pattern,
+text pattern dict rebuilt on every call). Both implementations are run over a
+corpus of task strings; the script checks that they pick the same action and
+input for every task and reports the time per decision.
+
+Usage:
+    python benchmarks/intent_router.py [--repeat 2000] [--tools calculator search text code]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from seeker_o1.core.agent.tool_agent import ToolAgent
+
+CORPUS = [
+    "calculate 2 + 2",
+    "Calculate (17 * 3) / 4 - 2 ** 5",
+    "please calculate the total of 19.99 + 5.01",
+    "search for the latest python release notes",
+    "Search machine learning papers on transformers",
+    "find information about the apollo 11 mission",
+    "find restaurants near me",
+    "look up the population of canada",
+    "count characters in 'the quick brown fox'",
+    "count words in \"a journey of a thousand miles begins with a single step\"",
+    "reverse 'stressed'",
+    "uppercase 'make me loud'",
+    "lowercase 'QUIET PLEASE'",
+    "capitalize 'the old man and the sea'",
+    "run code ```python\nprint(sum(range(10)))\n```",
+    "execute ```x = [i * i for i in range(5)]\nprint(x)```",
+    "Evaluate ```python 3 ** 4```",
+    "write a short poem about autumn leaves",
+    "what is the capital of australia?",
+    "summarise the plot of hamlet in two sentences",
+    "explain the difference between a process and a thread in an operating system, "
+    "with examples of when each is the better choice, and mention how the global "
+    "interpreter lock affects multithreaded python programs",
+    "I need to find a way to calculate my taxes",
+    "reverse the order of these words: one two three",
+    "tell me a joke",
+]
+
+def legacy_decide_action(task, available):
+    """The regex cascade ToolAgent._decide_action used before the intent router."""
+    task = task.lower()
+
+    calc_pattern = r'calculate\s+(.+)$'
+    calc_match = re.search(calc_pattern, task, re.IGNORECASE)
+
+    if calc_match and "calculator" in available:
+        expression = calc_match.group(1).strip()
+        return "calculator", {"expression": expression}
+
+    search_patterns = [
+        r'search(?:\s+for)?\s+(.+)',
+        r'find(?:\s+information(?:\s+about)?)?\s+(.+)',
+        r'look\s+up\s+(.+)'
+    ]
+
+    for pattern in search_patterns:
+        search_match = re.search(pattern, task, re.IGNORECASE)
+        if search_match and "search" in available:
+            query = search_match.group(1)
+            return "search", {"query": query}
+
+    text_patterns = {
+        r"count\s+characters\s+in\s+['\"](.+)['\"]": ("count", None),
+        r"count\s+words\s+in\s+['\"](.+)['\"]": ("wordcount", None),
+        r"reverse\s+['\"](.+)['\"]": ("reverse", None),
+        r"uppercase\s+['\"](.+)['\"]": ("uppercase", None),
+        r"lowercase\s+['\"](.+)['\"]": ("lowercase", None),
+        r"capitalize\s+['\"](.+)['\"]": ("capitalize", None),
+    }
+
+    for pattern, (operation, extractor) in text_patterns.items():
+        text_match = re.search(pattern, task, re.IGNORECASE)
+        if text_match and "text" in available:
+            text = text_match.group(1)
+            return "text", {"text": text, "operation": operation}
+
+    code_patterns = [
+        r'run\s+code\s+```(?:python)?\s*(.+?)```',
+        r'execute\s+```(?:python)?\s*(.+?)```',
+        r'evaluate\s+```(?:python)?\s*(.+?)```'
+    ]
+
+    for pattern in code_patterns:
+        code_match = re.search(pattern, task, re.IGNORECASE | re.DOTALL)
+        if code_match and "code" in available:
+            code = code_match.group(1).strip()
+            return "code", {"code": code}
+
+    return "dummy_action", {"query": f"Placeholder action for {task}"}
+
+def time_per_call(func, repeat):
+    """Return the median time in microseconds of one pass over the corpus, per task."""
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for task in CORPUS:
+                func(task)
+        samples.append((time.perf_counter() - start) / (repeat * len(CORPUS)))
+    return statistics.median(samples) * 1e6
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000, help="Passes over the corpus per sample")
+    parser.add_argument("--tools", nargs="*", default=["calculator", "search", "text", "code"],
+                        help="Tools loaded into the agent")
+    args = parser.parse_args()
+
+    agent = ToolAgent(name="benchmark", tools=args.tools)
+    available = set(agent.tools.tools)
+    router_decide = lambda task: agent._decide_action({"task": task})
+    legacy_decide = lambda task: legacy_decide_action(task, available)
+
+    mismatches = [task for task in CORPUS if router_decide(task) != legacy_decide(task)]
+    for task in mismatches:
+        print(f"MISMATCH for {task!r}:\n  router: {router_decide(task)}\n  legacy: {legacy_decide(task)}")
+
+    legacy_us = time_per_call(legacy_decide, args.repeat)
+    router_us = time_per_call(router_decide, args.repeat)
+    print(f"{len(CORPUS)} tasks, tools: {', '.join(sorted(available))}")
+    print(f"legacy cascade : {legacy_us:8.2f} us/decision")
+    print(f"intent router  : {router_us:8.2f} us/decision  ({legacy_us / router_us:.2f}x)")
+
+    if mismatches:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark BLIP captioning latency and memory under different CPU inference profiles.
+
+Each profile runs in its own subprocess so that resident memory is measured
+independently. The "baseline" profile matches the original describe_image
+path (full precision, torch.no_grad, default thread settings).
+
+Usage:
+    python benchmarks/vision_inference.py [--images sample_images] [--repeat 3]
+"""
+
+import argparse
+import glob
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+PROFILES = {
+    "baseline": {"inference_mode": False, "num_threads": None, "quantize": False, "backend": "eager"},
+    "inference_mode": {"inference_mode": True, "num_threads": None, "quantize": False, "backend": "eager"},
+    "threads": {"inference_mode": True, "num_threads": os.cpu_count(), "quantize": False, "backend": "eager"},
+    "int8": {"inference_mode": True, "num_threads": os.cpu_count(), "quantize": True, "backend": "eager"},
+    "int8_torchscript": {"inference_mode": True, "num_threads": os.cpu_count(), "quantize": True, "backend": "torchscript"},
+}
+
+def current_rss_mb() -> float:
+    """Return the current resident set size of this process in MiB."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_profile(profile: dict, image_paths: list, repeat: int) -> dict:
+    """Load the model with a profile and time describe_image over the images."""
+    from seeker_o1.models.vision_model import VisionModel
+
+    load_start = time.perf_counter()
+    model = VisionModel(inference=profile)
+    load_time = time.perf_counter() - load_start
+
+    # Warm-up pass so one-off allocation and graph optimisation are not timed
+    model.describe_image(image_paths[0])
+
+    latencies = []
+    captions = {}
+    for _ in range(repeat):
+        for path in image_paths:
+            start = time.perf_counter()
+            captions[path] = model.describe_image(path)
+            latencies.append(time.perf_counter() - start)
+
+    return {
+        "load_s": load_time,
+        "median_ms": statistics.median(latencies) * 1000,
+        "p90_ms": sorted(latencies)[int(0.9 * (len(latencies) - 1))] * 1000,
+        "rss_mb": current_rss_mb(),
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "captions": captions,
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--images", default="sample_images", help="Directory of images to caption")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed passes over the images")
+    parser.add_argument("--profiles", nargs="*", default=list(PROFILES), help="Profiles to run")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    image_paths = sorted(
+        path for path in glob.glob(os.path.join(args.images, "*"))
+        if path.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif"))
+    )
+    if not image_paths:
+        sys.exit(f"No images found in {args.images}")
+
+    if args.child:
+        print(json.dumps(run_profile(PROFILES[args.child], image_paths, args.repeat)))
+        return
+
+    results = {}
+    for name in args.profiles:
+        completed = subprocess.run(
+            [sys.executable, __file__, "--images", args.images, "--repeat", str(args.repeat), "--child", name],
+            capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            print(f"{name}: failed\n{completed.stderr.strip()[-2000:]}", file=sys.stderr)
+            continue
+        results[name] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    baseline = results.get("baseline")
+    print(f"{'profile':<18}{'load s':>8}{'median ms':>11}{'p90 ms':>9}{'rss MiB':>9}{'peak MiB':>10}{'speedup':>9}")
+    for name, result in results.items():
+        speedup = baseline["median_ms"] / result["median_ms"] if baseline else float("nan")
+        print(f"{name:<18}{result['load_s']:>8.2f}{result['median_ms']:>11.1f}{result['p90_ms']:>9.1f}"
+              f"{result['rss_mb']:>9.0f}{result['peak_rss_mb']:>10.0f}{speedup:>8.2f}x")
+
+    if baseline:
+        for name, result in results.items():
+            changed = [path for path, caption in result["captions"].items() if caption != baseline["captions"].get(path)]
+            if changed:
+                print(f"{name}: captions differ from baseline for {', '.join(changed)}")
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,19 @@ This module contains various agent implementations:
 - ReactAgent: Agent with reasoning capabilities
 - ToolAgent: Agent with tool execution capabilities
 - HybridAgent: Agent that can switch between single and multi-agent modes
+- AgentHistory: Bounded action log with optional disk spill
+- CheckpointStore: Saved progress of runs, for resuming them
+- ExecutionContext: The state of one execute() call
+- AgentMemory: Read-through, write-behind access to an agent's memories
 """
 
+from seeker_o1.core.agent.history import AgentHistory
+from seeker_o1.core.agent.checkpoint import CheckpointStore
+from seeker_o1.core.agent.execution_context import ExecutionContext
+from seeker_o1.core.agent.agent_memory import AgentMemory
 from seeker_o1.core.agent.base_agent import BaseAgent
 from seeker_o1.core.agent.react_agent import ReactAgent
 from seeker_o1.core.agent.tool_agent import ToolAgent
 from seeker_o1.core.agent.hybrid_agent import HybridAgent
 
-__all__ = ["BaseAgent", "ReactAgent", "ToolAgent", "HybridAgent"] 
\ No newline at end of file
+__all__ = ["AgentHistory", "AgentMemory", "CheckpointStore", "ExecutionContext", "BaseAgent", "ReactAgent", "ToolAgent", "HybridAgent"] 
\ No newline at end of file
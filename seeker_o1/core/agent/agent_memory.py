@@ -0,0 +1,377 @@
+"""
+Agent Memory module connecting agents to short-term and long-term memory.
+
+Reads go through the tiers: a task already answered is looked up in
+short-term memory first, then in long-term memory, and a long-term hit is
+copied into short-term memory for next time. Writes go behind: an outcome
+is added to short-term memory at once, so a repeated question is answered
+straight away, and a single background worker persists it to long-term
+memory, so the caller never waits on disk.
+
+Remembered answers expire after max_age, one hour by default, the same as
+the result cache, so memory never serves an answer the cache would consider
+stale.
+
+Besides exact answers, earlier tasks that share enough words with a new one
+are returned as facts, for the agent to put in front of its model.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+import logging
+import re
+import sys
+import threading
+import time
+
+from seeker_o1.core.agent.result_cache import normalize_task
+from seeker_o1.core.memory import BaseMemory
+from seeker_o1.models.base.base_model import is_error_answer
+
+logger = logging.getLogger(__name__)
+
+# Memory items written by agents have this type
+TASK_RESULT_TYPE = "task_result"
+
+_WORDS = re.compile(r"\w{3,}")
+
+def _terms(text: str) -> set:
+    """
+    Get the words of a text that count towards relevance.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The set of lowercased words of three or more characters.
+    """
+    return set(_WORDS.findall(text.lower()))
+
+class AgentMemory:
+    """
+    Read-through, write-behind access to an agent's memories.
+    """
+
+    def __init__(
+        self,
+        short_term: Optional[BaseMemory] = None,
+        long_term: Optional[BaseMemory] = None,
+        recall: bool = True,
+        max_age: Optional[float] = 3600,
+        max_facts: int = 3,
+        min_relevance: float = 0.3,
+        max_candidates: int = 500,
+        min_confidence: float = 0.5,
+        **kwargs
+    ):
+        """
+        Initialize an AgentMemory instance.
+
+        Args:
+            short_term: Memory checked first and written at once.
+            long_term: Persistent memory checked on a short-term miss and
+                written in the background.
+            recall: Whether repeated tasks are answered from memory.
+            max_age: Seconds a remembered answer stays usable; None keeps
+                it forever.
+            max_facts: Maximum number of related earlier tasks returned as facts.
+            min_relevance: Share of words a task must have in common with an
+                earlier one for it to count as a fact (0 to 1).
+            max_candidates: Maximum number of stored outcomes, newest first,
+                considered per tier.
+            min_confidence: Results reporting a lower confidence are not kept.
+            **kwargs: Additional configuration options (ignored).
+        """
+        self.short_term = short_term
+        self.long_term = long_term
+        self.recall_enabled = recall
+        self.max_age = max_age
+        self.max_facts = max_facts
+        self.min_relevance = min_relevance
+        self.max_candidates = max_candidates
+        self.min_confidence = min_confidence
+        # LongTermMemory is not thread safe, and the writer runs in the background
+        self._long_term_lock = threading.Lock()
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._writer_lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "lookups": 0,
+            "short_term_hits": 0,
+            "long_term_hits": 0,
+            "facts_used": 0,
+            "writes": 0,
+            "write_errors": 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether there is any memory to read or write.
+        """
+        return self.short_term is not None or self.long_term is not None
+
+    def recall(self, task: str, mode: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the remembered outcome of a task.
+
+        Args:
+            task: The task description.
+            mode: The execution mode the task was requested in.
+
+        Returns:
+            The stored record, with "task", "answer", "created_at" and
+            "tier" (where it was found), or None.
+        """
+        if not self.enabled or not self.recall_enabled:
+            return None
+        query = {"type": TASK_RESULT_TYPE, "key": normalize_task(task), "mode": mode}
+        self._count("lookups")
+
+        record = self._find(self.short_term, query)
+        if record is not None:
+            self._count("short_term_hits")
+            return {**record, "tier": "short_term"}
+
+        if self.long_term is not None:
+            with self._long_term_lock:
+                record = self._find(self.long_term, query)
+            if record is not None:
+                self._count("long_term_hits")
+                if self.short_term is not None:
+                    self.short_term.add(self._strip_meta(record))
+                return {**record, "tier": "long_term"}
+        return None
+
+    def related(self, task: str) -> List[Dict[str, Any]]:
+        """
+        Find earlier tasks relevant to a new one.
+
+        Args:
+            task: The task description.
+
+        Returns:
+            Up to max_facts records of other tasks, most relevant first,
+            each with a "relevance" score.
+        """
+        if not self.enabled or self.max_facts <= 0:
+            return []
+        terms = _terms(task)
+        if not terms:
+            return []
+        key = normalize_task(task)
+        query = {"type": TASK_RESULT_TYPE}
+
+        candidates = self._search(self.short_term, query)
+        if self.long_term is not None:
+            with self._long_term_lock:
+                candidates.extend(self._search(self.long_term, query))
+
+        facts: Dict[str, Dict[str, Any]] = {}
+        for record in candidates:
+            if record.get("key") == key or record.get("key") in facts or not self._is_fresh(record):
+                continue
+            record_terms = _terms(record.get("task", ""))
+            relevance = len(terms & record_terms) / len(terms | record_terms) if record_terms else 0.0
+            if relevance >= self.min_relevance:
+                facts[record["key"]] = {**self._strip_meta(record), "relevance": relevance}
+        ranked = sorted(facts.values(), key=lambda fact: fact["relevance"], reverse=True)[:self.max_facts]
+        if ranked:
+            self._count("facts_used", len(ranked))
+        return ranked
+
+    def remember(self, task: str, mode: str, result: Dict[str, Any]) -> bool:
+        """
+        Keep the outcome of a task.
+
+        The outcome is added to short-term memory now and to long-term
+        memory by the background writer. Errors, failed model calls, empty
+        answers, low confidence results and answers that came from a cache or from
+        memory are not kept.
+
+        Args:
+            task: The task description.
+            mode: The execution mode the task was requested in.
+            result: The task's result.
+
+        Returns:
+            True if the outcome is being kept.
+        """
+        if not self.enabled or not self._is_worth_keeping(result):
+            return False
+        record = {
+            "type": TASK_RESULT_TYPE,
+            "key": normalize_task(task),
+            "mode": mode,
+            "task": task,
+            "answer": str(result["answer"]),
+            "confidence": result.get("confidence"),
+            "created_at": time.time()
+        }
+        if self.short_term is not None:
+            self.short_term.add(record)
+        if self.long_term is not None:
+            future = self._get_writer().submit(self._write_long_term, record)
+            with self._writer_lock:
+                self._pending = [pending for pending in self._pending if not pending.done()]
+                self._pending.append(future)
+        else:
+            self._count("writes")
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the background writes queued so far.
+
+        Args:
+            timeout: Maximum seconds to wait for each write.
+        """
+        with self._writer_lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                logger.debug(f"Memory write did not finish: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get lookup, hit and write counts.
+
+        Returns:
+            The counts, and "hit_rate", the share of lookups answered from memory.
+        """
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self.stats)
+        hits = stats["short_term_hits"] + stats["long_term_hits"]
+        stats["hit_rate"] = hits / stats["lookups"] if stats["lookups"] else 0.0
+        return stats
+
+    def _write_long_term(self, record: Dict[str, Any]) -> None:
+        """
+        Persist a record, replacing an earlier outcome of the same task.
+
+        Args:
+            record: The record to store.
+        """
+        query = {"type": TASK_RESULT_TYPE, "key": record["key"], "mode": record["mode"]}
+        try:
+            with self._long_term_lock:
+                existing = self.long_term.search(query, limit=1)
+                if existing:
+                    self.long_term.update(existing[0]["id"], record)
+                else:
+                    self.long_term.add(record)
+            self._count("writes")
+        except Exception as e:
+            self._count("write_errors")
+            logger.warning(f"Could not write task outcome to long-term memory: {e}")
+
+    def _find(self, memory: Optional[BaseMemory], query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get the newest fresh record matching a query.
+
+        Args:
+            memory: The memory to search, or None.
+            query: Fields the record must have.
+
+        Returns:
+            The record, or None.
+        """
+        if memory is None:
+            return None
+        records = [record for record in self._search(memory, query) if self._is_fresh(record)]
+        return max(records, key=lambda record: record.get("created_at", 0), default=None)
+
+    def _search(self, memory: Optional[BaseMemory], query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Search a memory for the newest task records.
+
+        Memories stop searching at the limit in insertion order, so every
+        match is fetched and the newest max_candidates are kept.
+
+        Args:
+            memory: The memory to search, or None.
+            query: Fields the records must have.
+
+        Returns:
+            Up to max_candidates matching records, newest first.
+        """
+        if memory is None:
+            return []
+        try:
+            matches = memory.search(query, limit=sys.maxsize)
+        except Exception as e:
+            logger.warning(f"Memory search failed: {e}")
+            return []
+        records = [match["item"] for match in matches if isinstance(match.get("item"), dict)]
+        records.sort(key=lambda record: record.get("created_at", 0), reverse=True)
+        return records[:self.max_candidates]
+
+    def _is_fresh(self, record: Dict[str, Any]) -> bool:
+        """
+        Check whether a record is recent enough to use.
+
+        Args:
+            record: A task record.
+
+        Returns:
+            True if the record has not passed max_age.
+        """
+        return self.max_age is None or time.time() - record.get("created_at", 0) <= self.max_age
+
+    def _is_worth_keeping(self, result: Dict[str, Any]) -> bool:
+        """
+        Check whether a result should be remembered.
+
+        Args:
+            result: A task result.
+
+        Returns:
+            True for a successful, confident, freshly computed answer.
+        """
+        if not isinstance(result, dict) or not result.get("answer") or result.get("error"):
+            return False
+        if is_error_answer(result["answer"]):
+            return False
+        if "cached" in result or "memory" in result:
+            return False
+        confidence = result.get("confidence")
+        return confidence is None or confidence >= self.min_confidence
+
+    @staticmethod
+    def _strip_meta(record: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Drop the storage metadata long-term memory adds to a record.
+
+        Args:
+            record: A stored record.
+
+        Returns:
+            The record without "_meta".
+        """
+        return {key: value for key, value in record.items() if key != "_meta"}
+
+    def _get_writer(self) -> ThreadPoolExecutor:
+        """
+        Get the background writer, creating it on first use.
+
+        Returns:
+            A single-worker ThreadPoolExecutor, so writes happen in order.
+        """
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="memory-writer")
+            return self._writer
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        """
+        Increase one of the counts.
+
+        Args:
+            name: The count to increase.
+            amount: How much to add.
+        """
+        with self._stats_lock:
+            self.stats[name] += amount
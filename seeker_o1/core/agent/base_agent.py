@@ -3,15 +3,25 @@ Base Agent module that defines the common interface for all agents.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Any, Optional
+import threading
 import uuid
 import time
 
+from seeker_o1.core.agent.checkpoint import RunCheckpoint
+from seeker_o1.core.agent.execution_context import ExecutionContext
+from seeker_o1.core.agent.history import AgentHistory
+
 class BaseAgent(ABC):
     """
     Abstract base class for all agents in the SEEKER-O1 framework.
     
     Provides the core functionality and interface that all agent types must implement.
+    
+    An agent may run several tasks at once. Each execute() call keeps its
+    progress in its own ExecutionContext, which is the current_execution of
+    the thread running it; the agent's state only records the latest status.
     """
     
     def __init__(self, name: Optional[str] = None, **kwargs):
@@ -20,14 +30,22 @@ class BaseAgent(ABC):
         
         Args:
             name: Optional name for the agent. If not provided, a UUID will be generated.
-            **kwargs: Additional configuration options for the agent.
+            **kwargs: Additional configuration options for the agent, including
+                history_capacity (entries kept in memory, default 1000) and
+                history_spill_path (a .jsonl.gz file for evicted entries).
         """
         self.id = str(uuid.uuid4())
         self.name = name or f"agent-{self.id[:8]}"
         self.created_at = time.time()
         self.state: Dict[str, Any] = {"status": "initialized"}
-        self.history: List[Dict[str, Any]] = []
+        self.history = AgentHistory(
+            capacity=kwargs.get("history_capacity", 1000),
+            spill_path=kwargs.get("history_spill_path")
+        )
         self.config = kwargs
+        self._state_lock = threading.Lock()
+        self._runs: Dict[str, ExecutionContext] = {}
+        self._local = threading.local()
     
     @abstractmethod
     def execute(self, task: str, **kwargs) -> Dict[str, Any]:
@@ -43,14 +61,110 @@ class BaseAgent(ABC):
         """
         pass
     
+    @contextmanager
+    def execution(
+        self,
+        task: str,
+        run_id: Optional[str] = None,
+        checkpoint: Optional[RunCheckpoint] = None,
+        step: Optional[str] = None
+    ) -> Iterator[ExecutionContext]:
+        """
+        Run a task in its own execution context.
+        
+        The context is the current_execution of this thread until the block
+        ends, and is listed by get_active_runs() meanwhile.
+        
+        Args:
+            task: The task being run.
+            run_id: The checkpointed run it belongs to, if any.
+            checkpoint: The checkpoint the run saves its progress to, if any.
+            step: The step name its progress is saved under; defaults to
+                the agent name.
+            
+        Yields:
+            The new ExecutionContext.
+        """
+        execution = ExecutionContext(self.name, task, run_id=run_id, checkpoint=checkpoint, step=step)
+        with self._state_lock:
+            self._runs[execution.id] = execution
+        previous = self._activate_execution(execution)
+        try:
+            yield execution
+        finally:
+            self._activate_execution(previous)
+            with self._state_lock:
+                self._runs.pop(execution.id, None)
+    
+    @property
+    def current_execution(self) -> Optional[ExecutionContext]:
+        """
+        The run this thread is executing, or None outside of execute().
+        """
+        return getattr(self._local, "execution", None)
+    
+    def _activate_execution(self, execution: Optional[ExecutionContext]) -> Optional[ExecutionContext]:
+        """
+        Make a run the current one on this thread.
+        
+        Args:
+            execution: The run, or None for no run.
+            
+        Returns:
+            The run that was current before.
+        """
+        previous = self.current_execution
+        self._local.execution = execution
+        return previous
+    
+    def _bind_execution(self, function: Callable) -> Callable:
+        """
+        Wrap a function to run in this thread's current run on any thread.
+        
+        Used for work handed to a thread pool, so the worker sees the run
+        that submitted it.
+        
+        Args:
+            function: The function to wrap.
+            
+        Returns:
+            A function taking the same arguments.
+        """
+        execution = self.current_execution
+        
+        def run(*args, **kwargs):
+            previous = self._activate_execution(execution)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._activate_execution(previous)
+        return run
+    
+    def get_active_runs(self) -> List[Dict[str, Any]]:
+        """
+        Describe the runs in progress.
+        
+        Returns:
+            One dictionary per run, oldest first.
+        """
+        with self._state_lock:
+            runs = list(self._runs.values())
+        return [execution.to_dict() for execution in runs]
+    
     def update_state(self, **kwargs) -> None:
         """
         Update the agent's state with new values.
         
+        Inside execute(), the current run's state is updated as well.
+        
         Args:
             **kwargs: Key-value pairs to update in the state.
         """
-        self.state.update(kwargs)
+        execution = self.current_execution
+        if execution is not None:
+            execution.update(**kwargs)
+        with self._state_lock:
+            self.state.update(kwargs)
         
     def log_action(self, action: str, details: Dict[str, Any]) -> None:
         """
@@ -78,6 +192,7 @@ class BaseAgent(ABC):
             "id": self.id,
             "name": self.name,
             "created_at": self.created_at,
-            "state": self.state,
+            "state": dict(self.state),
+            "active_runs": len(self._runs),
             "history_length": len(self.history)
         } 
\ No newline at end of file
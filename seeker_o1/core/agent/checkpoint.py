@@ -0,0 +1,349 @@
+"""
+Checkpoint module for resuming interrupted agent runs.
+
+A run's progress is saved to a local store after every step: each role's
+result in the multi-agent pipeline, and while a role runs, its compacted
+ReactAgent context after each iteration. If the process dies, the run can
+be resumed from its last completed step instead of redoing the model calls
+already made.
+
+Each run is one JSON file, rewritten atomically, under
+~/.seeker-o1/checkpoints by default.
+"""
+
+from typing import Any, Dict, List, Optional
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+def _to_json(value: Any) -> Any:
+    """
+    Convert a value json cannot encode, using its to_dict() if it has one.
+
+    Args:
+        value: The value.
+
+    Returns:
+        A JSON-encodable stand-in.
+    """
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    return str(value)
+
+def _snapshot(value: Any) -> Any:
+    """
+    Copy a value as it would be saved, so later changes to it are not.
+
+    Args:
+        value: The value.
+
+    Returns:
+        A JSON round-tripped copy.
+    """
+    return json.loads(json.dumps(value, default=_to_json))
+
+def compact_result(result: Any) -> Any:
+    """
+    Drop the bulky parts of an agent result before it is checkpointed.
+
+    Args:
+        result: An agent or role result.
+
+    Returns:
+        The result without its execution context.
+    """
+    if not isinstance(result, dict):
+        return result
+    return {key: value for key, value in result.items() if key != "context"}
+
+class CheckpointStore:
+    """
+    A directory of run checkpoints, one JSON file per run.
+    """
+
+    def __init__(self, directory: Optional[str] = None, keep_completed: bool = False):
+        """
+        Initialize a CheckpointStore instance.
+
+        Args:
+            directory: Where checkpoint files are kept. If None, uses
+                ~/.seeker-o1/checkpoints.
+            keep_completed: Whether to keep a run's file, with its answer,
+                after it completes. Otherwise it is deleted.
+        """
+        if directory is None:
+            directory = os.path.join(os.path.expanduser("~"), ".seeker-o1", "checkpoints")
+        self.directory = os.path.expanduser(directory)
+        self.keep_completed = keep_completed
+        self._lock = threading.Lock()
+
+    def open(self, task: str, kind: str, run_id: Optional[str] = None, **fields) -> "RunCheckpoint":
+        """
+        Start checkpointing a run, or pick up an existing one.
+
+        Args:
+            task: The task being run.
+            kind: What runs it, such as "hybrid".
+            run_id: The run's identifier; a new one is generated if None.
+            **fields: Extra fields to record, such as the mode.
+
+        Returns:
+            The RunCheckpoint for the run, holding any saved progress.
+        """
+        record = self.load(run_id) if run_id else None
+        if record is None:
+            now = time.time()
+            record = {
+                "run_id": run_id or uuid.uuid4().hex,
+                "task": task,
+                "kind": kind,
+                "status": "running",
+                "created_at": now,
+                "updated_at": now,
+                "steps": {},
+                "states": {},
+                **fields
+            }
+            self.save(record)
+        elif record.get("status") == "failed":
+            record["status"] = "running"
+            record.pop("error", None)
+            self.save(record)
+        return RunCheckpoint(self, record)
+
+    def save(self, record: Dict[str, Any]) -> None:
+        """
+        Write a run's record, replacing the previous one atomically.
+
+        Args:
+            record: The run record; its "run_id" names the file.
+        """
+        record["updated_at"] = time.time()
+        path = self._path(record["run_id"])
+        with self._lock:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temporary = f"{path}.{threading.get_ident()}.tmp"
+                with open(temporary, "w", encoding="utf-8") as handle:
+                    json.dump(record, handle, default=_to_json)
+                os.replace(temporary, path)
+            except OSError as e:
+                logger.warning(f"Could not save checkpoint {record['run_id']}: {e}")
+
+    def load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Read a run's record.
+
+        Args:
+            run_id: The run's identifier.
+
+        Returns:
+            The record, or None if there is none or it cannot be read.
+        """
+        path = self._path(run_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Could not read checkpoint {run_id}: {e}")
+            return None
+
+    def delete(self, run_id: str) -> bool:
+        """
+        Delete a run's record.
+
+        Args:
+            run_id: The run's identifier.
+
+        Returns:
+            True if a record was deleted.
+        """
+        with self._lock:
+            try:
+                os.remove(self._path(run_id))
+                return True
+            except FileNotFoundError:
+                return False
+
+    def list(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List saved runs, most recently updated first.
+
+        Args:
+            status: Only list runs with this status, such as "running" or "failed".
+
+        Returns:
+            A summary of each run: run_id, task, kind, status, timestamps and
+            the number of completed steps.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        summaries = []
+        for file_name in os.listdir(self.directory):
+            if not file_name.endswith(".json"):
+                continue
+            record = self.load(file_name[:-len(".json")])
+            if record is None or (status is not None and record.get("status") != status):
+                continue
+            summaries.append({
+                "run_id": record["run_id"],
+                "task": record.get("task"),
+                "kind": record.get("kind"),
+                "mode": record.get("mode"),
+                "status": record.get("status"),
+                "created_at": record.get("created_at"),
+                "updated_at": record.get("updated_at"),
+                "steps_completed": len(record.get("steps") or {})
+            })
+        summaries.sort(key=lambda summary: summary["updated_at"] or 0, reverse=True)
+        return summaries
+
+    def _path(self, run_id: str) -> str:
+        """
+        Get the file path of a run's record.
+
+        Args:
+            run_id: The run's identifier.
+
+        Returns:
+            The path.
+
+        Raises:
+            ValueError: If the identifier could escape the directory.
+        """
+        if not run_id or os.path.basename(run_id) != run_id or run_id.startswith("."):
+            raise ValueError(f"Invalid run id: {run_id!r}")
+        return os.path.join(self.directory, f"{run_id}.json")
+
+class RunCheckpoint:
+    """
+    The saved progress of one run.
+
+    Steps are named results, such as a role's output, that a resumed run
+    reuses instead of recomputing. States are the progress of steps still
+    running, such as a role's context after its latest iteration, replaced
+    every iteration and dropped once the step completes.
+    """
+
+    def __init__(self, store: CheckpointStore, record: Dict[str, Any]):
+        """
+        Initialize a RunCheckpoint instance.
+
+        Args:
+            store: The store the run is saved in.
+            record: The run's record.
+        """
+        self.store = store
+        self.record = record
+        # Set once the run completes; later saves, e.g. from a cancelled
+        # background pipeline, must not bring the record back
+        self.closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def run_id(self) -> str:
+        """
+        The run's identifier.
+        """
+        return self.record["run_id"]
+
+    @property
+    def resumed(self) -> bool:
+        """
+        Whether the run has progress from an earlier attempt.
+        """
+        return bool(self.record.get("steps")) or bool(self.record.get("states"))
+
+    def get_step(self, name: str) -> Optional[Any]:
+        """
+        Get the saved result of a completed step.
+
+        Args:
+            name: The step name.
+
+        Returns:
+            The result, or None if the step has not completed.
+        """
+        with self._lock:
+            return (self.record.get("steps") or {}).get(name)
+
+    def save_step(self, name: str, result: Any) -> None:
+        """
+        Record a completed step.
+
+        Args:
+            name: The step name.
+            result: The step's result, saved without its execution context.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self.record.setdefault("steps", {})[name] = _snapshot(compact_result(result))
+            (self.record.get("states") or {}).pop(name, None)
+            self.store.save(self.record)
+
+    def get_state(self, name: str) -> Optional[Any]:
+        """
+        Get the saved progress of a step that has not completed.
+
+        Args:
+            name: The step name.
+
+        Returns:
+            The state, or None if none was saved.
+        """
+        with self._lock:
+            return (self.record.get("states") or {}).get(name)
+
+    def save_state(self, name: str, state: Any) -> None:
+        """
+        Replace the saved progress of a running step.
+
+        Args:
+            name: The step name.
+            state: The new state, copied as it is now; the step may keep
+                changing it.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self.record.setdefault("states", {})[name] = _snapshot(state)
+            self.store.save(self.record)
+
+    def finish(self, result: Dict[str, Any]) -> None:
+        """
+        Mark the run completed.
+
+        The record is deleted unless the store keeps completed runs, in which
+        case it keeps the answer and drops the saved progress.
+
+        Args:
+            result: The run's final result.
+        """
+        with self._lock:
+            self.closed = True
+            if not self.store.keep_completed:
+                self.store.delete(self.run_id)
+                return
+            self.record.update(status="completed", steps={}, states={}, result=compact_result(result))
+            self.store.save(self.record)
+
+    def fail(self, error: Exception) -> None:
+        """
+        Mark the run failed, keeping its progress for a later resume.
+
+        Args:
+            error: What stopped the run.
+        """
+        with self._lock:
+            if self.closed:
+                return
+            self.record.update(status="failed", error=str(error))
+            self.store.save(self.record)
@@ -0,0 +1,222 @@
+"""
+Complexity scoring module for routing tasks between single and multi-agent modes.
+
+Scores are computed from precompiled keyword patterns, task length, special
+characters and the number of tools a task appears to need. Tasks can be
+scored one at a time or in batches, and every score can be broken down by
+feature for tuning.
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+import importlib.util
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# NumPy is only needed for batch scoring and is imported there
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+if TYPE_CHECKING:
+    import numpy as np
+
+# (feature, pattern, weight): every non-overlapping match in the lowercased task adds the weight
+OPERATION_FEATURES: List[Tuple[str, str, float]] = [
+    ("calculation", r"(calculate|compute|evaluate)", 1.0),
+    ("search", r"(search|find|look up)", 1.0),
+    ("text_operation", r"(count|process|analyze|transform)\s+text", 1.0),
+    ("code_execution", r"run\s+code|execute", 1.5),
+    ("analysis", r"compare|contrast|evaluate", 2.0),
+    ("optimization", r"optimize|improve|enhance", 2.5),
+    ("chaining", r"and|then|after|before", 1.0),
+    ("conditional", r"if|when|unless|otherwise", 1.5),
+    ("comprehensive", r"all|every|each", 1.0),
+    ("decision", r"most|best|optimal", 1.5),
+]
+
+WORD_WEIGHT = 0.1
+SPECIAL_CHAR_WEIGHT = 0.2
+TOOL_WEIGHT = 1.5
+
+# Each tool counts once if any of its keywords occurs in the lowercased task
+TOOL_KEYWORDS: Dict[str, List[str]] = {
+    "calculator": ["calculate", "compute", "evaluate", "math"],
+    "search": ["search", "find", "look up", "query"],
+    "text": ["text", "string", "characters", "words"],
+    "code": ["code", "execute", "run", "python"],
+}
+
+# Same set as "not c.isalnum() and not c.isspace()": \w is alphanumerics plus "_"
+_SPECIAL_CHAR = re.compile(r"[^\w\s]|_")
+
+# Batch scoring joins tasks with this separator; no pattern can match it
+_SEPARATOR = "\x00"
+_SPECIAL_CHAR_BATCH = re.compile(r"[^\w\s\x00]|_")
+
+class ComplexityScorer:
+    """
+    Precompiled task complexity scorer.
+
+    Patterns are compiled once per scorer and the task is lowercased once per
+    score. A task's features are counted into a fixed-order vector and
+    weighted in the same order as the scoring rules, so single and batch
+    scores are identical.
+    """
+
+    def __init__(self, max_score: float = 10.0):
+        """
+        Initialize a ComplexityScorer instance.
+
+        Args:
+            max_score: Upper bound for scores.
+        """
+        self.max_score = max_score
+        self._operations = [(name, re.compile(pattern), weight) for name, pattern, weight in OPERATION_FEATURES]
+        self._tools = [
+            (name, re.compile("|".join(re.escape(keyword) for keyword in keywords)))
+            for name, keywords in TOOL_KEYWORDS.items()
+        ]
+        self.feature_names: List[str] = [name for name, _, _ in OPERATION_FEATURES] + [
+            "words", "special_chars", "tools_needed"
+        ]
+        self.weights: List[float] = [weight for _, _, weight in OPERATION_FEATURES] + [
+            WORD_WEIGHT, SPECIAL_CHAR_WEIGHT, TOOL_WEIGHT
+        ]
+
+    def features(self, task: str) -> List[int]:
+        """
+        Count a task's features.
+
+        Args:
+            task: The task description.
+
+        Returns:
+            Feature counts in the order of feature_names.
+        """
+        task_lower = task.lower()
+        counts = [len(pattern.findall(task_lower)) for _, pattern, _ in self._operations]
+        counts.append(len(task.split()))
+        counts.append(len(_SPECIAL_CHAR.findall(task)))
+        counts.append(sum(1 for _, pattern in self._tools if pattern.search(task_lower)))
+        return counts
+
+    def score(self, task: str) -> float:
+        """
+        Score a task's complexity.
+
+        Args:
+            task: The task description.
+
+        Returns:
+            A complexity score between 0 and max_score.
+        """
+        return self._weigh(self.features(task))
+
+    def breakdown(self, task: str) -> Dict[str, Any]:
+        """
+        Score a task and report each feature's contribution.
+
+        Args:
+            task: The task description.
+
+        Returns:
+            A dictionary with per-feature "features" (count, weight, score),
+            the uncapped "raw" total and the capped "score".
+        """
+        features = {}
+        raw = 0.0
+        for name, count, weight in zip(self.feature_names, self.features(task), self.weights):
+            features[name] = {"count": count, "weight": weight, "score": weight * count}
+            raw += weight * count
+        return {"features": features, "raw": raw, "score": min(self.max_score, raw)}
+
+    def score_batch(self, tasks: Sequence[str]) -> List[float]:
+        """
+        Score many tasks at once.
+
+        With NumPy installed, the tasks are joined into one string so each
+        pattern runs once over the whole batch; matches are assigned back to
+        their task by offset, and the weighting is vectorised.
+
+        Args:
+            tasks: The task descriptions.
+
+        Returns:
+            A complexity score for each task, in input order.
+        """
+        if not NUMPY_AVAILABLE:
+            return [self.score(task) for task in tasks]
+        if not tasks:
+            return []
+
+        import numpy as np
+
+        matrix = self.features_batch(tasks)
+        scores = np.zeros(len(tasks), dtype=np.float64)
+        # Column by column, in rule order, so the floating-point sums match score()
+        for column, weight in enumerate(self.weights):
+            scores += weight * matrix[:, column]
+        return np.minimum(scores, self.max_score).tolist()
+
+    def features_batch(self, tasks: Sequence[str]) -> "np.ndarray":
+        """
+        Count the features of many tasks with one regex pass per pattern.
+
+        Tasks are joined with NUL, which none of the patterns can match, so
+        no match spans two tasks and per-task counts equal features().
+
+        Args:
+            tasks: The task descriptions.
+
+        Returns:
+            An integer array of shape (len(tasks), len(feature_names)).
+        """
+        import numpy as np
+
+        if any(_SEPARATOR in task for task in tasks):
+            return np.array([self.features(task) for task in tasks], dtype=np.int64).reshape(len(tasks), -1)
+
+        lowered = [task.lower() for task in tasks]
+        joined_lower = _SEPARATOR.join(lowered)
+        joined = _SEPARATOR.join(tasks)
+        # Task i spans [starts[i], starts[i + 1] - 1) of the joined string
+        lower_starts = np.cumsum([0] + [len(task) + 1 for task in lowered[:-1]])
+        starts = np.cumsum([0] + [len(task) + 1 for task in tasks[:-1]])
+
+        def per_task(pattern: re.Pattern, text: str, task_starts) -> "np.ndarray":
+            positions = np.fromiter((match.start() for match in pattern.finditer(text)), dtype=np.int64)
+            owners = np.searchsorted(task_starts, positions, side="right") - 1
+            return np.bincount(owners, minlength=len(tasks))
+
+        columns = [per_task(pattern, joined_lower, lower_starts) for _, pattern, _ in self._operations]
+        columns.append(np.fromiter((len(task.split()) for task in tasks), dtype=np.int64, count=len(tasks)))
+        columns.append(per_task(_SPECIAL_CHAR_BATCH, joined, starts))
+        columns.append(sum(per_task(pattern, joined_lower, lower_starts) > 0 for _, pattern in self._tools))
+        return np.stack(columns, axis=1)
+
+    def modes_batch(self, tasks: Sequence[str], threshold: float = 3.0) -> List[str]:
+        """
+        Decide the execution mode for many tasks ahead of time.
+
+        Args:
+            tasks: The task descriptions.
+            threshold: Scores at or above this use multi-agent mode.
+
+        Returns:
+            "single" or "multi" for each task, in input order.
+        """
+        return ["multi" if score >= threshold else "single" for score in self.score_batch(tasks)]
+
+    def _weigh(self, counts: Iterable[int]) -> float:
+        """
+        Weight and cap a feature vector.
+
+        Args:
+            counts: Feature counts in the order of feature_names.
+
+        Returns:
+            The capped score.
+        """
+        complexity = 0.0
+        for count, weight in zip(counts, self.weights):
+            complexity += weight * count
+        return min(self.max_score, complexity)
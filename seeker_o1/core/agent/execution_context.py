@@ -0,0 +1,76 @@
+"""
+Execution context module for per-run agent state.
+
+An agent instance is shared: the orchestrator sends every task to the same
+primary agent, and the multi-agent pipeline runs roles from a thread pool.
+Everything that belongs to one execute() call - the task, the iteration
+counter and the run's status - lives in an ExecutionContext instead of on
+the agent, so concurrent calls never see each other's progress.
+"""
+
+from typing import Any, Dict, Optional
+import time
+import uuid
+
+from seeker_o1.core.agent.checkpoint import RunCheckpoint
+
+class ExecutionContext:
+    """
+    The state of one execute() call on an agent.
+    """
+
+    def __init__(
+        self,
+        agent_name: str,
+        task: str,
+        run_id: Optional[str] = None,
+        checkpoint: Optional[RunCheckpoint] = None,
+        step: Optional[str] = None
+    ):
+        """
+        Initialize an ExecutionContext instance.
+
+        Args:
+            agent_name: Name of the agent running the task.
+            task: The task being run.
+            run_id: The checkpointed run this call belongs to, if any;
+                defaults to the checkpoint's.
+            checkpoint: The checkpoint the call saves its progress to, if any.
+            step: The step name the progress is saved under; defaults to the
+                agent name.
+        """
+        self.id = uuid.uuid4().hex
+        self.agent_name = agent_name
+        self.task = task
+        self.checkpoint = checkpoint
+        self.step = step or agent_name
+        self.run_id = run_id if run_id is not None or checkpoint is None else checkpoint.run_id
+        self.iteration = 0
+        self.started_at = time.time()
+        self.state: Dict[str, Any] = {"status": "executing", "task": task}
+
+    def update(self, **kwargs) -> None:
+        """
+        Update the run's state with new values.
+
+        Args:
+            **kwargs: Key-value pairs to update in the state.
+        """
+        self.state.update(kwargs)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Describe the run.
+
+        Returns:
+            The run's id, agent, task, run_id, iteration, elapsed seconds and state.
+        """
+        return {
+            "id": self.id,
+            "agent": self.agent_name,
+            "task": self.task,
+            "run_id": self.run_id,
+            "iteration": self.iteration,
+            "elapsed": time.time() - self.started_at,
+            "state": dict(self.state)
+        }
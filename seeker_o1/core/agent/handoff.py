@@ -0,0 +1,332 @@
+"""
+Handoff module for compacting outputs passed between specialized agents.
+
+In multi-agent mode each role's answer becomes part of the next role's
+prompt. The HandoffCompactor fits an answer to a per-role token budget by
+extractive selection: it keeps the sentences that carry the most facts and
+relevance to the task, in their original order. A language model is only
+asked to summarize when no extractive selection fits the budget.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+import logging
+import math
+import re
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Token budget for the handoff from each role to the next
+DEFAULT_BUDGETS: Dict[str, int] = {
+    "researcher": 250,
+    "planner": 200,
+    "executor": 250,
+}
+DEFAULT_BUDGET = 250
+
+OMISSION_MARKER = " [...] "
+
+# Sentence ends and line breaks; list items and headings stay separate units
+_UNIT_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[])|\n+")
+_WORD = re.compile(r"[a-z0-9]+")
+_NUMBER = re.compile(r"\d")
+_PROPER_NOUN = re.compile(r"(?<![.!?]\s)(?<!^)\b[A-Z][a-z]+")
+_LIST_ITEM = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+")
+_KEY_TERMS = re.compile(
+    r"\b(result|answer|conclusion|therefore|found|total|must|should|step|recommend|because|key|important)\b",
+    re.IGNORECASE
+)
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this to was were will with".split()
+)
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text, at about four characters per token.
+
+    Args:
+        text: The text to measure.
+
+    Returns:
+        The approximate token count.
+    """
+    return math.ceil(len(text) / 4)
+
+class HandoffCompactor:
+    """
+    Fits agent outputs to per-role token budgets before they are handed on.
+    """
+
+    def __init__(
+        self,
+        budgets: Optional[Dict[str, int]] = None,
+        default_budget: int = DEFAULT_BUDGET,
+        llm_fallback: bool = True,
+        model: Any = None,
+        token_counter: Optional[Callable[[str], int]] = None,
+        model_router: Any = None,
+        **kwargs
+    ):
+        """
+        Initialize a HandoffCompactor instance.
+
+        Args:
+            budgets: Token budget per role, merged over DEFAULT_BUDGETS.
+            default_budget: Budget for roles without their own.
+            llm_fallback: Whether to ask a model to summarize when no
+                extractive selection fits; otherwise the text is truncated.
+            model: Model used for the fallback; the default model if None.
+            token_counter: Function that counts tokens; estimate_tokens if None.
+            model_router: Router that provides the default model.
+            **kwargs: Additional configuration options.
+        """
+        self.budgets = {**DEFAULT_BUDGETS, **(budgets or {})}
+        self.default_budget = default_budget
+        self.llm_fallback = llm_fallback
+        self.model = model
+        self.count_tokens = token_counter or estimate_tokens
+        self.model_router = model_router
+        self.config = kwargs
+        self.stats: Dict[str, int] = {
+            "handoffs": 0,
+            "passthrough": 0,
+            "extractive": 0,
+            "llm": 0,
+            "truncated": 0,
+            "tokens_in": 0,
+            "tokens_out": 0,
+        }
+        self._lock = threading.Lock()
+
+    def compact(self, text: str, role: str, query: str = "") -> str:
+        """
+        Fit a role's output to its handoff budget.
+
+        Args:
+            text: The role's output.
+            role: The role that produced it.
+            query: The task, used to rank sentences by relevance.
+
+        Returns:
+            The text unchanged if it fits, otherwise the selected sentences
+            in original order with omissions marked, or a model summary.
+        """
+        budget = self.budgets.get(role, self.default_budget)
+        tokens_in = self.count_tokens(text)
+        if tokens_in <= budget:
+            self._record("passthrough", tokens_in, tokens_in)
+            return text
+
+        selected = self.select(text, budget, query)
+        if selected:
+            self._record("extractive", tokens_in, self.count_tokens(selected))
+            return selected
+
+        # No sentence fits on its own, e.g. one long block of code or data
+        if self.llm_fallback:
+            summary = self._summarize_with_model(text, budget, query)
+            if summary:
+                summary = self._truncate(summary, budget)
+                self._record("llm", tokens_in, self.count_tokens(summary))
+                return summary
+        truncated = self._truncate(text, budget)
+        self._record("truncated", tokens_in, self.count_tokens(truncated))
+        return truncated
+
+    def select(self, text: str, budget: int, query: str = "") -> str:
+        """
+        Select the highest-scoring sentences that fit a token budget.
+
+        Args:
+            text: The text to select from.
+            budget: Token budget for the result, including omission markers.
+            query: The task, used to rank sentences by relevance.
+
+        Returns:
+            The selected sentences in original order, joined with omission
+            markers where sentences were skipped, or "" if none fit.
+        """
+        spans = []
+        position = 0
+        for match in _UNIT_SPLIT.finditer(text):
+            spans.append((position, match.start()))
+            position = match.end()
+        spans.append((position, len(text)))
+        spans = [(start, end) for start, end in spans if text[start:end].strip()]
+        if not spans:
+            return ""
+        units = [text[start:end].strip() for start, end in spans]
+        query_terms = self._terms(query)
+        document_terms = [self._terms(unit) for unit in units]
+        frequency: Dict[str, int] = {}
+        for terms in document_terms:
+            for term in terms:
+                frequency[term] = frequency.get(term, 0) + 1
+
+        ranked = sorted(
+            range(len(units)),
+            key=lambda index: self._score(index, units[index], document_terms[index], query_terms, frequency),
+            reverse=True
+        )
+        marker_tokens = self.count_tokens(OMISSION_MARKER)
+        chosen: List[int] = []
+        used = 0
+        for index in ranked:
+            cost = self.count_tokens(units[index]) + marker_tokens
+            if used + cost > budget:
+                continue
+            # Skip near-duplicates of what is already selected
+            if any(self._overlap(document_terms[index], document_terms[other]) > 0.8 for other in chosen):
+                continue
+            chosen.append(index)
+            used += cost
+        if not chosen:
+            return ""
+
+        # Original order; adjacent sentences keep their separator, gaps get a marker
+        chosen.sort()
+        parts = [] if chosen[0] == 0 else [OMISSION_MARKER.lstrip()]
+        parts.append(units[chosen[0]])
+        for previous, index in zip(chosen, chosen[1:]):
+            if index == previous + 1:
+                parts.append(text[spans[previous][1]:spans[index][0]] or " ")
+            else:
+                parts.append(OMISSION_MARKER)
+            parts.append(units[index])
+        if chosen[-1] != len(units) - 1:
+            parts.append(OMISSION_MARKER.rstrip())
+        return "".join(parts)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get handoff counts by outcome and total tokens before and after.
+
+        Returns:
+            A copy of the statistics.
+        """
+        with self._lock:
+            return dict(self.stats)
+
+    def _score(
+        self,
+        index: int,
+        unit: str,
+        terms: Set[str],
+        query_terms: Set[str],
+        frequency: Dict[str, int]
+    ) -> Tuple[float, int]:
+        """
+        Score a sentence by how much it is likely to matter downstream.
+
+        Args:
+            index: Position of the sentence.
+            unit: The sentence.
+            terms: The sentence's content words.
+            query_terms: The task's content words.
+            frequency: Number of sentences each word occurs in.
+
+        Returns:
+            A (score, -index) tuple; earlier sentences win ties.
+        """
+        score = 0.0
+        if terms:
+            # Words shared with other sentences mark the main topic
+            score += sum(min(frequency[term], 3) for term in terms) / len(terms)
+            score += 2.0 * len(terms & query_terms) / max(len(query_terms), 1)
+        score += 1.0 if _NUMBER.search(unit) else 0.0
+        score += 0.5 * min(len(_PROPER_NOUN.findall(unit)), 3)
+        score += 0.75 if _KEY_TERMS.search(unit) else 0.0
+        score += 0.5 if _LIST_ITEM.match(unit) else 0.0
+        score += 1.0 if index == 0 else 0.0
+        return score, -index
+
+    def _summarize_with_model(self, text: str, budget: int, query: str) -> str:
+        """
+        Ask a language model to summarize a text within a budget.
+
+        Args:
+            text: The text to summarize.
+            budget: Token budget for the summary.
+            query: The task the text is about.
+
+        Returns:
+            The summary, or "" if the model is unavailable or fails.
+        """
+        try:
+            model = self.model
+            if model is None:
+                router = self.model_router
+                if router is None:
+                    from seeker_o1.models.model_router import ModelRouter
+                    router = ModelRouter()
+                model = router.get_default_model()
+            prompt = (
+                f"Summarize the following for the next step of this task: {query}\n"
+                f"Keep every number, name and conclusion. Use at most {budget * 3 // 4} words.\n\n{text}"
+            )
+            return (model.generate(prompt, max_tokens=budget) or "").strip()
+        except Exception as e:
+            logger.warning(f"Handoff summary failed, truncating instead: {e}")
+            return ""
+
+    def _truncate(self, text: str, budget: int) -> str:
+        """
+        Cut a text down to a token budget, keeping its beginning.
+
+        Args:
+            text: The text to cut.
+            budget: Token budget.
+
+        Returns:
+            The text, truncated with an omission marker if over budget.
+        """
+        if self.count_tokens(text) <= budget:
+            return text
+        limit = max(budget * 4 - len(OMISSION_MARKER), 0)
+        while limit and self.count_tokens(text[:limit] + OMISSION_MARKER.rstrip()) > budget:
+            limit -= max(1, limit // 10)
+        return text[:limit] + OMISSION_MARKER.rstrip()
+
+    def _record(self, outcome: str, tokens_in: int, tokens_out: int) -> None:
+        """
+        Count a handoff.
+
+        Args:
+            outcome: "passthrough", "extractive", "llm" or "truncated".
+            tokens_in: Tokens before compaction.
+            tokens_out: Tokens after compaction.
+        """
+        with self._lock:
+            self.stats["handoffs"] += 1
+            self.stats[outcome] += 1
+            self.stats["tokens_in"] += tokens_in
+            self.stats["tokens_out"] += tokens_out
+
+    @staticmethod
+    def _terms(text: str) -> Set[str]:
+        """
+        Get the content words of a text.
+
+        Args:
+            text: The text.
+
+        Returns:
+            Its lowercased words without stopwords.
+        """
+        return {word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS and len(word) > 1}
+
+    @staticmethod
+    def _overlap(first: Set[str], second: Set[str]) -> float:
+        """
+        Jaccard overlap of two word sets.
+
+        Args:
+            first: The first set.
+            second: The second set.
+
+        Returns:
+            The overlap between 0 and 1.
+        """
+        if not first or not second:
+            return 0.0
+        return len(first & second) / len(first | second)
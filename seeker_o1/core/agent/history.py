@@ -0,0 +1,247 @@
+"""
+Agent History module providing a bounded action log.
+
+Agents log every action they take. The log keeps the most recent entries in
+a fixed-size ring buffer; entries that fall out of it can be spilled to a
+gzip-compressed, append-only JSON Lines file so long-running processes keep
+their full history without holding it in memory. Evicted entries still
+buffered for the file are written when the history is closed, garbage
+collected or the interpreter exits.
+"""
+
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Union
+import gzip
+import json
+import logging
+import os
+import threading
+import weakref
+
+logger = logging.getLogger(__name__)
+
+def _write_spill(path: str, entries: List[Dict[str, Any]]) -> bool:
+    """
+    Append entries to a spill file as one gzip member.
+
+    Args:
+        path: Path of the .jsonl.gz file.
+        entries: The entries to write.
+
+    Returns:
+        True if they were written.
+    """
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lines = "".join(json.dumps(entry, default=str) + "\n" for entry in entries)
+        with gzip.open(path, "at", encoding="utf-8") as handle:
+            handle.write(lines)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not spill history to {path}, dropping entries: {e}")
+        return False
+
+def _spill_pending(path: str, pending: List[Dict[str, Any]], lock: threading.RLock) -> None:
+    """
+    Write a history's buffered evicted entries; run when the history goes away.
+
+    Args:
+        path: Path of the spill file.
+        pending: The history's buffer of evicted entries.
+        lock: The history's lock.
+    """
+    with lock:
+        if pending:
+            _write_spill(path, pending)
+            pending.clear()
+
+class AgentHistory:
+    """
+    A thread-safe ring buffer of history entries with optional disk spill.
+
+    Indexing, iteration, len() and comparison with a list cover the
+    in-memory entries, so it can stand in for the plain list agents used to
+    keep. query() reads across the spilled and in-memory entries.
+    """
+
+    def __init__(self, capacity: int = 1000, spill_path: Optional[str] = None, spill_batch: int = 64):
+        """
+        Initialize an AgentHistory instance.
+
+        Args:
+            capacity: Maximum number of entries kept in memory.
+            spill_path: Optional path of a .jsonl.gz file that evicted entries
+                are appended to. Without it, evicted entries are dropped.
+            spill_batch: Number of evicted entries buffered before they are
+                written, so the file is not reopened for every entry.
+        """
+        if capacity < 1:
+            raise ValueError("History capacity must be at least 1")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.spill_batch = spill_batch
+        self.spilled = 0
+        self.dropped = 0
+        self._entries: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._pending_spill: List[Dict[str, Any]] = []
+        self._lock = threading.RLock()
+        # Holds no reference to self, so the history can still be collected
+        self._finalizer = (
+            weakref.finalize(self, _spill_pending, spill_path, self._pending_spill, self._lock)
+            if spill_path else None
+        )
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """
+        Add an entry, evicting the oldest one if the buffer is full.
+
+        Args:
+            entry: The history entry.
+        """
+        with self._lock:
+            if len(self._entries) == self.capacity:
+                evicted = self._entries.popleft()
+                if self.spill_path:
+                    self._pending_spill.append(evicted)
+                    if len(self._pending_spill) >= self.spill_batch:
+                        self._flush_spill()
+                else:
+                    self.dropped += 1
+            self._entries.append(entry)
+
+    def query(
+        self,
+        action: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: Optional[int] = None,
+        include_spilled: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Find entries across the spilled and in-memory history.
+
+        Args:
+            action: Only return entries with this action name.
+            since: Only return entries logged at or after this timestamp.
+            until: Only return entries logged before this timestamp.
+            limit: Only return the most recent matching entries.
+            include_spilled: Whether to read entries spilled to disk.
+
+        Returns:
+            Matching entries, oldest first. Spilled entries are read back
+            from JSON, so values that were not JSON types come back as strings.
+        """
+        def matches(entry: Dict[str, Any]) -> bool:
+            timestamp = entry.get("timestamp", 0)
+            return (
+                (action is None or entry.get("action") == action)
+                and (since is None or timestamp >= since)
+                and (until is None or timestamp < until)
+            )
+
+        with self._lock:
+            if include_spilled and self.spill_path:
+                self._flush_spill()
+                results = [entry for entry in self._read_spilled() if matches(entry)]
+            else:
+                results = []
+            results.extend(entry for entry in self._entries if matches(entry))
+
+        if limit is not None:
+            results = results[-limit:] if limit > 0 else []
+        return results
+
+    def flush(self) -> None:
+        """
+        Write any buffered evicted entries to the spill file.
+        """
+        with self._lock:
+            self._flush_spill()
+
+    def close(self) -> None:
+        """
+        Write any buffered evicted entries.
+
+        The history can still be used afterwards; later evictions are
+        buffered and written as usual, including at exit.
+        """
+        with self._lock:
+            self._flush_spill()
+
+    def clear(self) -> None:
+        """
+        Drop the in-memory entries, counting them as dropped.
+
+        Buffered evicted entries are written to the spill file first; the
+        file is otherwise left untouched.
+        """
+        with self._lock:
+            self._flush_spill()
+            self.dropped += len(self._entries)
+            self._entries.clear()
+
+    @property
+    def total(self) -> int:
+        """
+        Number of entries ever logged, including spilled and dropped ones.
+        """
+        with self._lock:
+            return len(self._entries) + len(self._pending_spill) + self.spilled + self.dropped
+
+    def _flush_spill(self) -> None:
+        """
+        Append the buffered evicted entries to the spill file as one gzip member.
+        """
+        if not self._pending_spill:
+            return
+        if _write_spill(self.spill_path, self._pending_spill):
+            self.spilled += len(self._pending_spill)
+        else:
+            self.dropped += len(self._pending_spill)
+        self._pending_spill.clear()
+
+    def _read_spilled(self) -> Iterator[Dict[str, Any]]:
+        """
+        Read the spilled entries back, oldest first.
+
+        Yields:
+            Each spilled entry; unreadable lines and a truncated last member
+            are skipped.
+        """
+        if not os.path.exists(self.spill_path):
+            return
+        try:
+            with gzip.open(self.spill_path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+        except (OSError, EOFError) as e:
+            logger.warning(f"Stopped reading spilled history from {self.spill_path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        with self._lock:
+            if isinstance(index, slice):
+                return list(self._entries)[index]
+            return self._entries[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, AgentHistory):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"AgentHistory(entries={len(self)}, capacity={self.capacity}, spilled={self.spilled})"
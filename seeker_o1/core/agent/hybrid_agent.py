@@ -4,17 +4,49 @@ Hybrid Agent module that combines single and multi-agent capabilities.
 This agent can dynamically switch between single and multi-agent modes based on task complexity.
 """
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from collections import deque
 import logging
-import re
 import os
-from typing import Dict, Any, List, Tuple, Optional
+import re
+import threading
+import time
+from typing import Dict, Any, List, Tuple, Optional, Union, TYPE_CHECKING
 
 from seeker_o1.core.agent.tool_agent import ToolAgent
+from seeker_o1.core.agent.complexity import ComplexityScorer
+from seeker_o1.core.agent.checkpoint import CheckpointStore, RunCheckpoint
+from seeker_o1.core.agent.handoff import HandoffCompactor
+from seeker_o1.core.agent.result_cache import ResultCache
+from seeker_o1.models.base.base_model import is_error_answer
 from seeker_o1.models.model_router import ModelRouter
-from seeker_o1.models.vision_model import VisionModel
+from seeker_o1.tools.base import ToolCollection
+
+# The vision stack (torch, transformers, PIL, pytesseract) is imported on
+# first use, so text-only tasks never pay for loading it.
+if TYPE_CHECKING:
+    from seeker_o1.models.vision_model import VisionModel
+    from seeker_o1.models.vision_cache import VisionCache
+    from seeker_o1.models.vision_pipeline import VisionPipeline
+    from seeker_o1.models.vision_server import VisionClient
 
 logger = logging.getLogger(__name__)
 
+# Openings that mean a speculative single-agent answer should not be accepted
+DEFAULT_REJECT_PHRASES = [
+    "i'm sorry", "i am sorry", "i cannot", "i can't", "i'm unable", "i am unable",
+    "as an ai", "error", "could you clarify", "could you provide", "need more information"
+]
+
+# Multi-agent pipeline stages, in order
+PIPELINE_ROLES = ("researcher", "planner", "executor", "critic")
+
+class PipelineCancelled(Exception):
+    """Raised inside a multi-agent pipeline that was cancelled between stages."""
+
+# Boundaries between independent parts of a task, for research fan-out
+_SUBQUERY_SPLIT = re.compile(r"(?<=[.?!;])\s+|\n+|\s*;\s*|,?\s+(?:and then|then|also)\s+", re.IGNORECASE)
+
 class HybridAgent(ToolAgent):
     """
     A hybrid agent that can switch between single and multi-agent modes.
@@ -39,15 +71,122 @@ class HybridAgent(ToolAgent):
             **kwargs: Additional configuration options for the agent.
         """
         super().__init__(name=name, max_iterations=max_iterations, tools=tools, **kwargs)
+        # One router for this agent and its specialized agents, so each model is created once
+        if self.model_router is None:
+            self.model_router = ModelRouter()
         self.mode = "auto"
-        
-        # Specialized agents for multi-agent mode
-        self.specialized_agents = {
-            "researcher": ToolAgent(name="researcher", tools=tools),
-            "planner": ToolAgent(name="planner", tools=tools),
-            "executor": ToolAgent(name="executor", tools=tools),
-            "critic": ToolAgent(name="critic", tools=tools)
+        self.complexity_scorer = ComplexityScorer()
+        self.vision_config = kwargs.get("vision", {})
+        self.multi_agent_config = kwargs.get("multi_agent", {})
+        self._pipeline_pool: Optional[ThreadPoolExecutor] = None
+        self._early_exit_lock = threading.Lock()
+        self.early_exit_stats: Dict[str, int] = {"runs": 0, "planner_skipped": 0, "critic_skipped": 0}
+        self.speculative_config = self.multi_agent_config.get("speculative", {})
+        self.handoff_compactor = HandoffCompactor(
+            model_router=self.model_router,
+            **self.multi_agent_config.get("handoff", {})
+        )
+        self._speculation_pool: Optional[ThreadPoolExecutor] = None
+        self._speculation_lock = threading.Lock()
+        self.speculation_stats: Dict[str, Any] = {
+            "single": 0,
+            "multi": 0,
+            "runs": deque(maxlen=self.speculative_config.get("history_size", 1000))
         }
+        self.result_cache_config = kwargs.get("result_cache", {})
+        self.result_cache: Optional[ResultCache] = None
+        if self.result_cache_config.get("enabled", True):
+            self.result_cache = ResultCache(
+                ttl=self.result_cache_config.get("ttl", 3600),
+                max_entries=self.result_cache_config.get("max_entries", 1000),
+                semantic=self.result_cache_config.get("semantic", {}),
+                embed=self._embed_task
+            )
+        self.checkpoint_store: Optional[CheckpointStore] = kwargs.get("checkpoint_store")
+        self._vision_model: Optional["VisionModel"] = None
+        self._vision_cache: Optional["VisionCache"] = None
+        self._vision_pipeline: Optional["VisionPipeline"] = None
+        
+        # Specialized agents for multi-agent mode, created on first use
+        self.specialized_agents: Dict[str, ToolAgent] = {}
+        self.role_configs: Dict[str, Dict[str, Any]] = {}
+        self._shared_tools: Optional[ToolCollection] = None
+        self._specialized_lock = threading.Lock()
+    
+    def configure_specialized_agent(self, role: str, config: Dict[str, Any]) -> None:
+        """
+        Set how the specialized agent for a role is built.
+        
+        An agent already created for the role is replaced on its next use.
+        
+        Args:
+            role: The role name, such as "researcher" or "critic".
+            config: The role's settings: "name", "max_iterations", "tools"
+                (loaded in addition to the shared ones), "model" (overrides
+                of the default model config, such as {"name": "gpt-4o-mini"}),
+                "max_tokens" (token budget of each model call) and "timeout"
+                (seconds per model call).
+        """
+        with self._specialized_lock:
+            self.role_configs[role] = dict(config)
+            self.specialized_agents.pop(role, None)
+    
+    def get_specialized_agent(self, role: str) -> ToolAgent:
+        """
+        Get the specialized agent for a role, creating it on first use.
+        
+        Specialized agents share one frozen snapshot of this agent's tools
+        instead of loading their own.
+        
+        Args:
+            role: The role name, such as "researcher" or "critic".
+            
+        Returns:
+            The ToolAgent for the role.
+        """
+        agent = self.specialized_agents.get(role)
+        if agent is not None:
+            return agent
+        with self._specialized_lock:
+            if role not in self.specialized_agents:
+                self.specialized_agents[role] = self._build_role_agent(role)
+                logging.debug(f"Created specialized agent: {role}")
+            return self.specialized_agents[role]
+    
+    def _build_role_agent(self, role: str, suffix: str = "") -> ToolAgent:
+        """
+        Build an agent for a role from its configuration.
+        
+        Args:
+            role: The role name.
+            suffix: Appended to the agent's name, for parallel copies.
+            
+        Returns:
+            A new ToolAgent using the shared tools and model router.
+        """
+        role_config = self.role_configs.get(role, {})
+        return ToolAgent(
+            name=role_config.get("name", role) + suffix,
+            max_iterations=role_config.get("max_iterations", self.max_iterations),
+            tools=role_config.get("tools"),
+            tool_collection=self._get_shared_tools(),
+            history_capacity=self.history.capacity,
+            model_router=self.model_router,
+            model=role_config.get("model"),
+            max_tokens=role_config.get("max_tokens"),
+            timeout=role_config.get("timeout")
+        )
+    
+    def _get_shared_tools(self) -> ToolCollection:
+        """
+        Get the read-only tool registry shared by the specialized agents.
+        
+        Returns:
+            A frozen snapshot of this agent's tools.
+        """
+        if self._shared_tools is None:
+            self._shared_tools = self.tools.snapshot()
+        return self._shared_tools
     
     def _assess_complexity(self, task: str) -> float:
         """
@@ -59,101 +198,523 @@ class HybridAgent(ToolAgent):
         Returns:
             A complexity score between 0 and 10.
         """
-        complexity = 0.0
-        
-        # Check for multiple operations
-        operations = [
-            (r'(calculate|compute|evaluate)', 1.0),  # Basic calculations
-            (r'(search|find|look up)', 1.0),  # Search operations
-            (r'(count|process|analyze|transform)\s+text', 1.0),  # Text operations
-            (r'run\s+code|execute', 1.5),  # Code execution
-            (r'compare|contrast|evaluate', 2.0),  # Analysis operations
-            (r'optimize|improve|enhance', 2.5),  # Optimization tasks
-            (r'and|then|after|before', 1.0),  # Task chaining
-            (r'if|when|unless|otherwise', 1.5),  # Conditional operations
-            (r'all|every|each', 1.0),  # Comprehensive operations
-            (r'most|best|optimal', 1.5)  # Decision making
-        ]
-        
-        # Add complexity for each operation found
-        for pattern, score in operations:
-            matches = re.findall(pattern, task.lower())
-            complexity += score * len(matches)
-        
-        # Add complexity for length of task description
-        words = task.split()
-        complexity += len(words) * 0.1  # 0.1 points per word
-        
-        # Add complexity for special characters (potential complex expressions)
-        special_chars = sum(1 for c in task if not c.isalnum() and not c.isspace())
-        complexity += special_chars * 0.2
-        
-        # Add complexity for multiple tools needed
-        tool_keywords = {
-            'calculator': ['calculate', 'compute', 'evaluate', 'math'],
-            'search': ['search', 'find', 'look up', 'query'],
-            'text': ['text', 'string', 'characters', 'words'],
-            'code': ['code', 'execute', 'run', 'python']
-        }
-        
-        tools_needed = 0
-        task_lower = task.lower()
-        for tool_name, keywords in tool_keywords.items():
-            if any(kw in task_lower for kw in keywords):
-                tools_needed += 1
-            
-        complexity += tools_needed * 1.5
-        
-        # Cap the complexity at 10
-        return min(10.0, complexity)
+        return self.complexity_scorer.score(task)
     
     def execute(self, task: str, **kwargs) -> Dict[str, Any]:
         """
         Execute a task using the appropriate mode based on complexity.
         
+        Repeated tasks are answered from the result cache, or failing that
+        from memory; such results carry a "cached" or "memory" entry
+        describing the match. New answers are remembered. With a checkpoint store,
+        multi-agent runs save each completed role, and passing the run_id of
+        an interrupted run skips the roles it already completed.
+        
+        One HybridAgent can serve many tasks at once: each call runs in its
+        own execution context, and the specialized agents are reentrant too.
+        
         Args:
             task: The task description to execute.
-            **kwargs: Additional parameters for task execution.
+            **kwargs: Additional parameters for task execution; bypass_cache
+                skips the cache and memory lookups and run_id names the run
+                to resume.
             
         Returns:
             A dictionary containing the execution result and metadata.
         """
         tokens = task.split()
-        if tokens:
-            last_token = tokens[-1]
-            if os.path.exists(last_token) and last_token.lower().endswith((".png",".jpg",".jpeg",".bmp",".gif")):
-                prompt_text = " ".join(tokens[:-1])
-                vm = VisionModel()
-                raw = vm.read_text(last_token)
-                if raw:
-                    task = f"{prompt_text} {raw}"
-                else:
-                    caption = vm.describe_image(last_token)
-                    task = f"{prompt_text} {caption}"
+        image_paths = [token for token in tokens if self._is_image_path(token)]
+        if image_paths:
+            prompt_text = " ".join(token for token in tokens if token not in image_paths)
+            if len(image_paths) == 1:
+                image_content = self._extract_image_content(image_paths[0])
+            else:
+                image_content = " ".join(self._extract_images_content(image_paths))
+            task = f"{prompt_text} {image_content}"
+        
+        # Results are cached per requested mode, after images become text
+        cache_mode = kwargs.get("mode") or "auto"
+        bypass_cache = kwargs.get("bypass_cache", False)
+        if self.result_cache is not None and not bypass_cache:
+            cached = self.result_cache.lookup(task, cache_mode)
+            if cached is not None:
+                logging.info(f"Answered from the {cached['cached']['tier']} result cache.")
+                cached["llm_calls"] = 0
+                self._record_llm_calls(0)
+                return cached
+        if not bypass_cache:
+            remembered = self._answer_from_memory(task, cache_mode)
+            if remembered is not None:
+                self._record_llm_calls(0)
+                if self.result_cache is not None:
+                    self.result_cache.store(task, cache_mode, remembered)
+                return remembered
+        
+        checkpoint = self._open_checkpoint(task, cache_mode, kwargs.get("run_id"))
+        if checkpoint is not None and checkpoint.record.get("status") == "completed":
+            return checkpoint.record["result"]
+        try:
+            with self.execution(task, checkpoint=checkpoint):
+                result = self._execute_mode(task, **{**kwargs, "checkpoint": checkpoint})
+        except Exception as e:
+            if checkpoint is not None:
+                checkpoint.fail(e)
+            raise
+        if checkpoint is not None:
+            result["run_id"] = checkpoint.run_id
+            checkpoint.finish(result)
+        self._record_llm_calls(result.get("llm_calls", 0))
+        if self.result_cache is not None:
+            self.result_cache.store(task, cache_mode, result)
+        self.agent_memory.remember(task, cache_mode, result)
+        return result
+    
+    def _open_checkpoint(self, task: str, mode: str, run_id: Optional[str] = None) -> Optional[RunCheckpoint]:
+        """
+        Start or pick up the checkpoint of a run.
         
+        Args:
+            task: The task being run.
+            mode: The requested execution mode.
+            run_id: The run to resume; a new run if None.
+            
+        Returns:
+            The RunCheckpoint, or None if the agent has no checkpoint store.
+        """
+        if self.checkpoint_store is None:
+            return None
+        return self.checkpoint_store.open(task, "hybrid", run_id=run_id, agent=self.name, mode=mode)
+    
+    def _execute_mode(self, task: str, **kwargs) -> Dict[str, Any]:
+        """
+        Execute a task in the requested mode, or by complexity in auto mode.
+        
+        Args:
+            task: The task description, with any images already turned into text.
+            **kwargs: Additional parameters for task execution.
+            
+        Returns:
+            A dictionary containing the execution result and metadata.
+        """
         mode_override = kwargs.get("mode")
         if mode_override == "single":
             logging.info("Single-agent mode activated.")
-            model = ModelRouter().get_default_model()
-            answer = model.generate(task)
-            return {"task": task, "answer": answer, "mode": "single"}
+            return self._execute_single_agent(task)
         if mode_override == "multi":
             logging.info("Multi-agent mode activated.")
             return self._execute_multi_agent(task, **kwargs)
         complexity = self._assess_complexity(task)
+        if mode_override == "speculative":
+            return self._execute_speculative(task, complexity, **kwargs)
         
         # Decide on mode based on complexity
         if complexity < 3.0:
             logging.info(f"Task difficulty ({complexity:.1f}) below threshold (3.0). single-agent mode activated.")
             logging.info("User input is rated as a simple task..")
-            model = ModelRouter().get_default_model()
-            answer = model.generate(task)
-            return {"task": task, "answer": answer, "mode": "single"}
+            return self._execute_single_agent(task)
+        elif self.speculative_config.get("enabled", False) and complexity <= self.speculative_config.get("max_complexity", 10.0):
+            logging.info(f"Task complexity ({complexity:.1f}) above threshold (3.0). Racing single and multi-agent modes.")
+            return self._execute_speculative(task, complexity, **kwargs)
         else:
             logging.info(f"Task complexity ({complexity:.1f}) above threshold (3.0). multi-agent mode activated.")
             logging.info("User input is rated as a complex task..")
             return self._execute_multi_agent(task, **kwargs)
     
+    def _embed_task(self, text: str) -> List[float]:
+        """
+        Embed a task for the semantic result cache.
+        
+        Args:
+            text: The normalized task.
+            
+        Returns:
+            The embedding from the default model.
+            
+        Raises:
+            ValueError: If the model returned no embedding.
+        """
+        embedding = self._get_model().get_embedding(text)
+        if not embedding:
+            raise ValueError("The default model returned no embedding")
+        return embedding
+    
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit and miss counts and rates of the result cache.
+        
+        Returns:
+            The cache statistics, or an empty dictionary if caching is off.
+        """
+        if self.result_cache is None:
+            return {}
+        return self.result_cache.get_stats()
+    
+    def _execute_single_agent(self, task: str) -> Dict[str, Any]:
+        """
+        Answer a task with a single model call.
+        
+        Answers to related earlier tasks are included in the prompt.
+        
+        Args:
+            task: The task description.
+            
+        Returns:
+            A dictionary containing the answer, with "error" set if the
+            model call failed.
+        """
+        answer = self._get_model().generate(self._memory_prompt(task))
+        result = {"task": task, "answer": answer, "mode": "single", "llm_calls": 1}
+        if is_error_answer(answer):
+            result["error"] = answer
+        return result
+    
+    def _execute_speculative(self, task: str, complexity: float, **kwargs) -> Dict[str, Any]:
+        """
+        Race the single-agent answer against the multi-agent pipeline.
+        
+        The pipeline starts in the background while the single answer is
+        generated. If the single answer passes the acceptance check it is
+        returned and the pipeline is cancelled before its next stage;
+        otherwise the pipeline's result is awaited. Which path won is
+        recorded in the speculation stats.
+        
+        Args:
+            task: The task description.
+            complexity: The task's complexity score.
+            **kwargs: Additional parameters for task execution.
+            
+        Returns:
+            The winning result, with a "speculation" entry describing the race.
+        """
+        start_time = time.time()
+        cancel_event = threading.Event()
+        multi_kwargs = {key: value for key, value in kwargs.items() if key != "mode"}
+        multi_future = self._get_speculation_pool().submit(
+            self._bind_execution(self._execute_multi_agent), task, cancel_event=cancel_event, **multi_kwargs
+        )
+        
+        single_result = None
+        try:
+            single_result = self._execute_single_agent(task)
+        except Exception as e:
+            logging.warning(f"Speculative single-agent answer failed: {e}")
+        single_elapsed = time.time() - start_time
+        
+        if single_result is not None and "error" not in single_result and self._accept_single_answer(task, single_result.get("answer")):
+            cancel_event.set()
+            multi_future.add_done_callback(self._log_cancelled_pipeline)
+            self._record_speculation("single", complexity, single_elapsed, None)
+            single_result["speculation"] = {"winner": "single", "complexity": complexity, "single_elapsed": single_elapsed}
+            logging.info(f"Single-agent answer accepted after {single_elapsed:.2f}s; multi-agent pipeline cancelled.")
+            return single_result
+        
+        try:
+            multi_result = multi_future.result()
+        except Exception as e:
+            if single_result is None:
+                raise
+            logging.warning(f"Multi-agent pipeline failed ({e}); using the single-agent answer.")
+            self._record_speculation("single", complexity, single_elapsed, None)
+            single_result["speculation"] = {"winner": "single", "complexity": complexity, "single_elapsed": single_elapsed}
+            return single_result
+        
+        multi_elapsed = time.time() - start_time
+        self._record_speculation("multi", complexity, single_elapsed, multi_elapsed)
+        if single_result is not None:
+            # The losing single-agent answer cost a call too
+            multi_result["llm_calls"] = multi_result.get("llm_calls", 0) + single_result.get("llm_calls", 0)
+        multi_result["speculation"] = {
+            "winner": "multi",
+            "complexity": complexity,
+            "single_elapsed": single_elapsed,
+            "multi_elapsed": multi_elapsed
+        }
+        return multi_result
+    
+    def _accept_single_answer(self, task: str, answer: Optional[str]) -> bool:
+        """
+        Quickly decide whether a single-agent answer is good enough to return.
+        
+        Args:
+            task: The task description.
+            answer: The single-agent answer.
+            
+        Returns:
+            True if the answer is long enough and does not look like a refusal,
+            an error or a request for more information.
+        """
+        if not isinstance(answer, str):
+            return False
+        text = answer.strip()
+        if len(text) < self.speculative_config.get("min_answer_length", 20):
+            return False
+        
+        opening = text[:200].lower()
+        reject_phrases = self.speculative_config.get("reject_phrases", DEFAULT_REJECT_PHRASES)
+        if any(phrase in opening for phrase in reject_phrases):
+            return False
+        # A short answer that ends by asking something back is not an answer
+        return not (len(text) < 200 and text.endswith("?"))
+    
+    def _record_speculation(
+        self,
+        winner: str,
+        complexity: float,
+        single_elapsed: float,
+        multi_elapsed: Optional[float]
+    ) -> None:
+        """
+        Record the outcome of a speculative race.
+        
+        Args:
+            winner: "single" or "multi".
+            complexity: The task's complexity score.
+            single_elapsed: Seconds until the single answer was ready.
+            multi_elapsed: Seconds until the pipeline finished, if it was awaited.
+        """
+        with self._speculation_lock:
+            self.speculation_stats[winner] += 1
+            self.speculation_stats["runs"].append({
+                "winner": winner,
+                "complexity": complexity,
+                "single_elapsed": single_elapsed,
+                "multi_elapsed": multi_elapsed
+            })
+    
+    def get_speculation_stats(self) -> Dict[str, Any]:
+        """
+        Summarise how often each path won the speculative race.
+        
+        Returns:
+            Win counts and rates, mean latencies, and win rates per whole
+            complexity score, for tuning the mode threshold.
+        """
+        with self._speculation_lock:
+            runs = list(self.speculation_stats["runs"])
+            single_wins = self.speculation_stats["single"]
+            multi_wins = self.speculation_stats["multi"]
+        
+        total = single_wins + multi_wins
+        by_complexity: Dict[int, Dict[str, int]] = {}
+        for run in runs:
+            bucket = by_complexity.setdefault(int(run["complexity"]), {"single": 0, "multi": 0})
+            bucket[run["winner"]] += 1
+        
+        single_times = [run["single_elapsed"] for run in runs]
+        multi_times = [run["multi_elapsed"] for run in runs if run["multi_elapsed"] is not None]
+        return {
+            "runs": total,
+            "single_wins": single_wins,
+            "multi_wins": multi_wins,
+            "single_win_rate": single_wins / total if total else 0.0,
+            "mean_single_elapsed": sum(single_times) / len(single_times) if single_times else None,
+            "mean_multi_elapsed": sum(multi_times) / len(multi_times) if multi_times else None,
+            "by_complexity": {
+                bucket: {**wins, "single_win_rate": wins["single"] / (wins["single"] + wins["multi"])}
+                for bucket, wins in sorted(by_complexity.items())
+            }
+        }
+    
+    @staticmethod
+    def _log_cancelled_pipeline(future: Future) -> None:
+        """
+        Log how a cancelled speculative pipeline ended.
+        
+        Args:
+            future: The pipeline's future.
+        """
+        error = future.exception()
+        if isinstance(error, PipelineCancelled):
+            logging.debug(f"Speculative multi-agent pipeline stopped: {error}")
+        elif error is not None:
+            logging.debug(f"Speculative multi-agent pipeline failed after cancellation: {error}")
+    
+    def _get_speculation_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool that drives speculative pipelines.
+        
+        It is separate from the pipeline pool so a driver never waits on
+        role runs queued behind itself.
+        
+        Returns:
+            The ThreadPoolExecutor for pipeline drivers.
+        """
+        with self._lazy_lock:
+            if self._speculation_pool is None:
+                self._speculation_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="speculative")
+            return self._speculation_pool
+    
+    def _extract_image_content(self, image_path: str) -> str:
+        """
+        Turn an image into text for the task prompt.
+        
+        OCR and captioning run concurrently through the vision pipeline; OCR
+        text is preferred and a caption is used when the image has no text.
+        Results are served from the vision cache when possible, in which case
+        the vision model is never loaded.
+        
+        Args:
+            image_path: Path to the image file.
+            
+        Returns:
+            The OCR text or caption for the image.
+        """
+        cache = self._get_vision_cache()
+        cached = cache.lookup(image_path) if cache else None
+        if cached:
+            if cached.get("text"):
+                logging.info("Vision cache hit: reusing OCR text.")
+                return cached["text"]
+            if cached.get("caption"):
+                logging.info("Vision cache hit: reusing image caption.")
+                return cached["caption"]
+        
+        outcome = self._get_vision_pipeline().run(image_path)
+        logging.debug(f"Vision pipeline used {outcome['source']} with timings {outcome['timings']}")
+        if cache:
+            if outcome["source"] == "ocr":
+                cache.store(image_path, text=outcome["text"])
+            else:
+                # OCR output too short to use is recorded as "no text"
+                ocr_text = None if outcome["text"] is None else ""
+                cache.store(image_path, text=ocr_text, caption=outcome["caption"])
+        
+        if outcome["source"] == "ocr":
+            return outcome["text"]
+        return outcome["caption"]
+    
+    def _extract_images_content(self, image_paths: List[str]) -> List[str]:
+        """
+        Turn several images into text using the batched vision APIs.
+        
+        Cached images are resolved first. The rest go through OCR in a process
+        pool, and images without usable text are captioned in batches.
+        
+        Args:
+            image_paths: Paths to the image files.
+            
+        Returns:
+            The OCR text or caption for each image, in input order.
+        """
+        cache = self._get_vision_cache()
+        contents: Dict[str, str] = {}
+        pending: List[str] = []
+        for path in dict.fromkeys(image_paths):
+            cached = cache.lookup(path) if cache else None
+            if cached and (cached.get("text") or cached.get("caption")):
+                contents[path] = cached.get("text") or cached["caption"]
+            else:
+                pending.append(path)
+        
+        if pending:
+            vm = self._get_vision_model()
+            pipeline = self._get_vision_pipeline()
+            texts = vm.read_texts(pending)
+            to_caption = []
+            for path, text in zip(pending, texts):
+                if pipeline.is_usable_text(text):
+                    contents[path] = text
+                    if cache:
+                        cache.store(path, text=text)
+                else:
+                    to_caption.append(path)
+            
+            if to_caption:
+                captions = vm.describe_images(to_caption)
+                for path, caption in zip(to_caption, captions):
+                    contents[path] = caption
+                    if cache:
+                        cache.store(path, text="", caption=caption)
+        
+        return [contents[path] for path in image_paths]
+    
+    @staticmethod
+    def _is_image_path(token: str) -> bool:
+        """
+        Check whether a task token refers to an existing image file.
+        
+        Args:
+            token: A whitespace-separated token from the task.
+            
+        Returns:
+            True if the token is a path to an image file.
+        """
+        return token.lower().endswith((".png", ".jpg", ".jpeg", ".bmp", ".gif")) and os.path.exists(token)
+    
+    def _get_vision_model(self) -> Union["VisionModel", "VisionClient"]:
+        """
+        Get the vision model, loading it on first use.
+        
+        When a shared vision worker is configured (vision.worker.address), a
+        client for it is returned instead, so this process never loads the
+        model weights. If the worker is unreachable, the model is loaded
+        locally unless fallback_local is disabled.
+        
+        Returns:
+            The shared VisionModel instance, or a VisionClient for the worker.
+        """
+        with self._lazy_lock:
+            if self._vision_model is None:
+                worker_config = self.vision_config.get("worker", {})
+                if worker_config.get("address"):
+                    from seeker_o1.models.vision_server import VisionClient
+                    try:
+                        self._vision_model = VisionClient(**worker_config)
+                        logging.info(f"Using shared vision worker at {worker_config['address']}.")
+                        return self._vision_model
+                    except (ConnectionError, ValueError) as e:
+                        if not worker_config.get("fallback_local", True):
+                            raise
+                        logging.warning(f"{e}; loading the vision model in this process instead.")
+                from seeker_o1.models.vision_model import VisionModel
+                self._vision_model = VisionModel(**self.vision_config.get("model", {}))
+            return self._vision_model
+    
+    def _get_vision_pipeline(self) -> "VisionPipeline":
+        """
+        Get the vision pipeline, creating it on first use.
+        
+        Returns:
+            The shared VisionPipeline instance.
+        """
+        with self._lazy_lock:
+            if self._vision_pipeline is None:
+                from seeker_o1.models.vision_pipeline import VisionPipeline
+                pipeline_config = self.vision_config.get("pipeline", {})
+                self._vision_pipeline = VisionPipeline(
+                    self._get_vision_model(),
+                    max_workers=pipeline_config.get("max_workers", 2),
+                    min_text_length=pipeline_config.get("min_text_length", 3),
+                    text_precheck=pipeline_config.get("text_precheck", True)
+                )
+            return self._vision_pipeline
+    
+    def _get_vision_cache(self) -> Optional["VisionCache"]:
+        """
+        Get the vision cache, creating it on first use.
+        
+        Returns:
+            The VisionCache instance, or None if caching is disabled.
+        """
+        cache_config = self.vision_config.get("cache", {})
+        if not cache_config.get("enabled", True):
+            return None
+        
+        with self._lazy_lock:
+            if self._vision_cache is None:
+                from seeker_o1.models.vision_cache import VisionCache
+                try:
+                    self._vision_cache = VisionCache(
+                        storage_path=cache_config.get("storage_path"),
+                        perceptual_hash=cache_config.get("perceptual_hash", False),
+                        max_distance=cache_config.get("max_distance", 4)
+                    )
+                except Exception as e:
+                    logging.warning(f"Vision cache unavailable, continuing without it: {e}")
+                    self.vision_config.setdefault("cache", {})["enabled"] = False
+                    return None
+            return self._vision_cache
+    
     def _execute_multi_agent(self, task: str, **kwargs) -> Dict[str, Any]:
         """
         Execute a task using multiple specialized agents.
@@ -181,53 +742,446 @@ class HybridAgent(ToolAgent):
                         "task": task,
                         "answer": f"The result of {action_input['expression']} is {result['result']}",
                         "direct_result": result,
-                        "mode": "direct"
+                        "mode": "direct",
+                        "llm_calls": 0
                     }
         
         # For complex tasks, use multi-agent approach
+        cancel_event = kwargs.get("cancel_event")
+        checkpoint = kwargs.get("checkpoint")
+        skip_planner = self._should_skip_planner(task)
+        if self.multi_agent_config.get("pipeline", "concurrent") == "concurrent":
+            results = self._run_concurrent_pipeline(task, cancel_event, skip_planner, checkpoint)
+        else:
+            results = self._run_sequential_pipeline(task, cancel_event, skip_planner, checkpoint)
+        final_result = results["executor"]  # Use executor's result as the primary result
+        
+        skipped_stages = [role for role in PIPELINE_ROLES if role not in results]
+        with self._early_exit_lock:
+            self.early_exit_stats["runs"] += 1
+            for role in skipped_stages:
+                self.early_exit_stats[f"{role}_skipped"] += 1
+        if skipped_stages:
+            logging.info(f"Early exit: skipped {', '.join(skipped_stages)}")
+        
+        logging.info("All agents have finished their tasks. Seeker-o1 is aggregating results...")
+        logging.info("Seeker-o1 has successfully completed multi-agent processing")
+        
+        multi_result = {
+            "task": task,
+            "answer": final_result.get("answer", str(final_result)),
+            "agent_results": results,
+            "skipped_stages": skipped_stages,
+            "mode": "multi",
+            # Model calls made by the role agents; handoff summaries are counted by the compactor
+            "llm_calls": sum(result.get("llm_calls", 0) for result in results.values())
+        }
+        if "error" in final_result:
+            multi_result["error"] = final_result["error"]
+        return multi_result
+    
+    def _should_skip_planner(self, task: str) -> bool:
+        """
+        Decide whether a task is simple enough to run without a plan.
+        
+        A task skips the planner when it is a single part that needs a
+        single tool, and the executor has an intent for that tool.
+        
+        Args:
+            task: The task description.
+            
+        Returns:
+            True if the planner should be skipped.
+        """
+        early_exit = self.multi_agent_config.get("early_exit", {})
+        if not early_exit.get("enabled", True) or not early_exit.get("skip_planner", True):
+            return False
+        features = dict(zip(self.complexity_scorer.feature_names, self.complexity_scorer.features(task)))
+        if features["tools_needed"] > 1 or len(self._split_research_queries(task, 2)) > 1:
+            return False
+        executor = self.get_specialized_agent("executor")
+        return isinstance(executor, ToolAgent) and executor._get_intent_router().route(task.lower()) is not None
+    
+    def _should_skip_critic(self, executor_result: Dict[str, Any]) -> bool:
+        """
+        Decide whether the executor's result needs no review.
+        
+        Args:
+            executor_result: The executor's result.
+            
+        Returns:
+            True if the result is deterministic or its confidence reaches
+            the configured threshold.
+        """
+        early_exit = self.multi_agent_config.get("early_exit", {})
+        if not early_exit.get("enabled", True) or not early_exit.get("skip_critic", True):
+            return False
+        if executor_result.get("deterministic"):
+            return True
+        return executor_result.get("confidence", 0.0) >= early_exit.get("critic_confidence", 0.9)
+    
+    def get_early_exit_stats(self) -> Dict[str, int]:
+        """
+        Get how often each pipeline stage was skipped.
+        
+        Returns:
+            The number of multi-agent runs and of skips per stage.
+        """
+        with self._early_exit_lock:
+            return dict(self.early_exit_stats)
+    
+    def _run_sequential_pipeline(
+        self,
+        task: str,
+        cancel_event: Optional[threading.Event] = None,
+        skip_planner: bool = False,
+        checkpoint: Optional[RunCheckpoint] = None
+    ) -> Dict[str, Any]:
+        """
+        Run researcher, planner, executor and critic one after another.
+        
+        Args:
+            task: The task description.
+            cancel_event: If set, the pipeline stops before its next stage.
+            skip_planner: If True, the executor works from the research directly.
+            checkpoint: If given, roles that already completed in this run are
+                not rerun and each newly completed role is saved.
+            
+        Returns:
+            The result of each role, keyed by role, with per-role timings.
+        """
+        start_time = time.time()
         results = {}
-        final_result = None
         
         # Researcher analyzes the task and gathers information
-        researcher_result = self.specialized_agents["researcher"].execute(
-            f"Analyze and gather information for: {task}"
+        results["researcher"] = self._run_role(
+            self.get_specialized_agent("researcher"),
+            self._memory_prompt(f"Analyze and gather information for: {task}"),
+            start_time,
+            cancel_event,
+            checkpoint
         )
-        results["researcher"] = researcher_result
-        researcher_summary = researcher_result.get("answer", "")
-        if len(researcher_summary) > 2000:  # If output is very long
-            researcher_summary = researcher_summary[:1000] + "...[content omitted for brevity]..." + researcher_summary[-500:]
-        
-        # Planner creates a strategy based on research
-        planner_result = self.specialized_agents["planner"].execute(
-            f"Plan execution strategy for: {task}\nBased on research: {researcher_summary}"
-        )
-        results["planner"] = planner_result
-        planner_summary = planner_result.get("answer", "")
-        if len(planner_summary) > 2000:  # If output is very long
-            planner_summary = planner_summary[:1000] + "...[content omitted for brevity]..." + planner_summary[-500:]
+        researcher_summary = self._compact_handoff(task, "researcher", results["researcher"].get("answer", ""))
+        
+        if skip_planner:
+            executor_prompt = f"Execute: {task}\nBased on research: {researcher_summary}"
+        else:
+            # Planner creates a strategy based on research
+            results["planner"] = self._run_role(
+                self.get_specialized_agent("planner"),
+                f"Plan execution strategy for: {task}\nBased on research: {researcher_summary}",
+                start_time,
+                cancel_event,
+                checkpoint
+            )
+            planner_summary = self._compact_handoff(task, "planner", results["planner"].get("answer", ""))
+            executor_prompt = f"Execute plan for: {task}\nFollowing strategy: {planner_summary}"
         
         # Executor carries out the plan
-        executor_result = self.specialized_agents["executor"].execute(
-            f"Execute plan for: {task}\nFollowing strategy: {planner_summary}"
+        results["executor"] = self._run_role(
+            self.get_specialized_agent("executor"),
+            executor_prompt,
+            start_time,
+            cancel_event,
+            checkpoint
         )
-        results["executor"] = executor_result
-        final_result = executor_result  # Use executor's result as the primary result
-        executor_summary = executor_result.get("answer", "")
-        if len(executor_summary) > 2000:  # If output is very long
-            executor_summary = executor_summary[:1000] + "...[content omitted for brevity]..." + executor_summary[-500:]
+        if self._should_skip_critic(results["executor"]):
+            return results
+        executor_summary = self._compact_handoff(task, "executor", results["executor"].get("answer", ""))
         
         # Critic evaluates the results
-        critic_result = self.specialized_agents["critic"].execute(
-            f"Evaluate results for: {task}\nAnalyzing output: {executor_summary}"
+        results["critic"] = self._run_role(
+            self.get_specialized_agent("critic"),
+            f"Evaluate results for: {task}\nAnalyzing output: {executor_summary}",
+            start_time,
+            cancel_event,
+            checkpoint
         )
-        results["critic"] = critic_result
+        return results
+    
+    def _run_concurrent_pipeline(
+        self,
+        task: str,
+        cancel_event: Optional[threading.Event] = None,
+        skip_planner: bool = False,
+        checkpoint: Optional[RunCheckpoint] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the specialized agents with overlapping stages.
         
-        logging.info("All agents have finished their tasks. Seeker-o1 is aggregating results...")
-        logging.info("Seeker-o1 has successfully completed multi-agent processing")
+        The researcher fans out into parallel sub-queries. The planner starts
+        as soon as the first findings arrive, and findings that come in later
+        are handed to the executor alongside the plan.
         
+        Args:
+            task: The task description.
+            cancel_event: If set, the pipeline stops before its next stage.
+            skip_planner: If True, the executor works from the research directly.
+            checkpoint: If given, roles that already completed in this run are
+                not rerun and each newly completed role is saved.
+            
+        Returns:
+            The result of each role, keyed by role, with per-role timings.
+        """
+        start_time = time.time()
+        pool = self._get_pipeline_pool()
+        results = {}
+        
+        # Researcher: one run per sub-query; extra runs use their own agent instances
+        subqueries = self._split_research_queries(task, self.multi_agent_config.get("research_fanout", 3))
+        research_futures = {}
+        for index, subquery in enumerate(subqueries):
+            agent = self.get_specialized_agent("researcher") if index == 0 else self._clone_role_agent("researcher", index)
+            prompt = self._memory_prompt(f"Analyze and gather information for: {subquery}")
+            if len(subqueries) > 1:
+                prompt += f"\n(Part of the overall task: {task})"
+            research_futures[pool.submit(self._run_role, agent, prompt, start_time, cancel_event, checkpoint)] = index
+        
+        research_results: Dict[int, Dict[str, Any]] = {}
+        if skip_planner:
+            for future, index in research_futures.items():
+                research_results[index] = future.result()
+            results["researcher"] = self._merge_research(subqueries, research_results, start_time)
+            research_summary = self._compact_handoff(task, "researcher", results["researcher"].get("answer", ""))
+            results["executor"] = self._run_role(
+                self.get_specialized_agent("executor"),
+                f"Execute: {task}\nBased on research: {research_summary}",
+                start_time,
+                cancel_event,
+                checkpoint
+            )
+            return self._finish_with_critic(task, results, start_time, cancel_event, checkpoint)
+        
+        # Planner starts on the first findings instead of waiting for all of them
+        pending = set(research_futures)
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            research_results[research_futures[future]] = future.result()
+        early_indexes = sorted(research_results)
+        early_research = self._compact_handoff(
+            task,
+            "researcher",
+            "\n\n".join(research_results[index].get("answer", "") for index in early_indexes)
+        )
+        planner_future = pool.submit(
+            self._run_role,
+            self.get_specialized_agent("planner"),
+            f"Plan execution strategy for: {task}\nBased on research: {early_research}",
+            start_time,
+            cancel_event,
+            checkpoint
+        )
+        
+        for future in pending:
+            research_results[research_futures[future]] = future.result()
+        results["researcher"] = self._merge_research(subqueries, research_results, start_time)
+        results["planner"] = planner_future.result()
+        planner_summary = self._compact_handoff(task, "planner", results["planner"].get("answer", ""))
+        
+        # Executor gets the plan plus any findings the planner did not see
+        late_indexes = [index for index in sorted(research_results) if index not in early_indexes]
+        executor_prompt = f"Execute plan for: {task}\nFollowing strategy: {planner_summary}"
+        if late_indexes:
+            late_research = self._compact_handoff(
+                task,
+                "researcher",
+                "\n\n".join(research_results[index].get("answer", "") for index in late_indexes)
+            )
+            executor_prompt += f"\nAdditional research: {late_research}"
+        results["executor"] = self._run_role(
+            self.get_specialized_agent("executor"), executor_prompt, start_time, cancel_event, checkpoint
+        )
+        return self._finish_with_critic(task, results, start_time, cancel_event, checkpoint)
+    
+    def _finish_with_critic(
+        self,
+        task: str,
+        results: Dict[str, Any],
+        pipeline_start: float,
+        cancel_event: Optional[threading.Event] = None,
+        checkpoint: Optional[RunCheckpoint] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the critic, unless the executor's result needs no review.
+        
+        Args:
+            task: The task description.
+            results: The results so far, keyed by role.
+            pipeline_start: Time the pipeline started.
+            cancel_event: If set, the critic is not started.
+            checkpoint: If given, the critic's result is saved, or reused if
+                it already completed in this run.
+            
+        Returns:
+            The results in pipeline order, with the critic's if it ran.
+        """
+        formatted = {role: results[role] for role in PIPELINE_ROLES if role in results}
+        if self._should_skip_critic(results["executor"]):
+            return formatted
+        
+        executor_summary = self._compact_handoff(task, "executor", results["executor"].get("answer", ""))
+        formatted["critic"] = self._run_role(
+            self.get_specialized_agent("critic"),
+            f"Evaluate results for: {task}\nAnalyzing output: {executor_summary}",
+            pipeline_start,
+            cancel_event,
+            checkpoint
+        )
+        return formatted
+    
+    def _run_role(
+        self,
+        agent: ToolAgent,
+        prompt: str,
+        pipeline_start: float,
+        cancel_event: Optional[threading.Event] = None,
+        checkpoint: Optional[RunCheckpoint] = None
+    ) -> Dict[str, Any]:
+        """
+        Run one specialized agent and record its timing.
+        
+        Args:
+            agent: The agent to run.
+            prompt: The prompt for the agent.
+            pipeline_start: Time the pipeline started, for the start offset.
+            cancel_event: If set, the role is not started.
+            checkpoint: If given, a result saved under the agent's name is
+                returned instead of running it again, and a new result is saved.
+                The agent saves its progress under the same name after every
+                iteration, so an interrupted role resumes where it stopped.
+            
+        Returns:
+            The agent's result with "started" (seconds after the pipeline
+            started) and "elapsed" (seconds) added, and "resumed" set if it
+            came from the checkpoint.
+            
+        Raises:
+            PipelineCancelled: If the pipeline was cancelled.
+        """
+        if checkpoint is not None:
+            saved = checkpoint.get_step(agent.name)
+            if saved is not None:
+                logging.info(f"Resuming: reusing the completed {agent.name} result.")
+                return {**saved, "resumed": True}
+        if cancel_event is not None and cancel_event.is_set():
+            raise PipelineCancelled(f"{agent.name} not started")
+        role_start = time.time()
+        result = dict(agent.execute(prompt, checkpoint=checkpoint, step=agent.name))
+        result["started"] = role_start - pipeline_start
+        result["elapsed"] = time.time() - role_start
+        if checkpoint is not None:
+            checkpoint.save_step(agent.name, result)
+        return result
+    
+    def _merge_research(
+        self,
+        subqueries: List[str],
+        research_results: Dict[int, Dict[str, Any]],
+        pipeline_start: float
+    ) -> Dict[str, Any]:
+        """
+        Combine the researcher's sub-query results into one role result.
+        
+        Args:
+            subqueries: The sub-queries, in task order.
+            research_results: The result for each sub-query, keyed by index.
+            pipeline_start: Time the pipeline started.
+            
+        Returns:
+            The combined researcher result, with timings for each sub-query.
+        """
+        ordered = [research_results[index] for index in range(len(subqueries))]
+        if len(ordered) == 1:
+            return ordered[0]
+        started = min(result["started"] for result in ordered)
+        finished = max(result["started"] + result["elapsed"] for result in ordered)
         return {
-            "task": task,
-            "answer": final_result.get("answer", str(final_result)),
-            "agent_results": results,
-            "mode": "multi"
-        } 
\ No newline at end of file
+            "task": " | ".join(subqueries),
+            "answer": "\n\n".join(result.get("answer", "") for result in ordered),
+            "subqueries": [
+                {"query": subquery, **result} for subquery, result in zip(subqueries, ordered)
+            ],
+            "started": started,
+            "elapsed": finished - started,
+            "llm_calls": sum(result.get("llm_calls", 0) for result in ordered)
+        }
+    
+    @staticmethod
+    def _split_research_queries(task: str, limit: int) -> List[str]:
+        """
+        Split a task into independent research sub-queries.
+        
+        The task is split at sentence boundaries, semicolons and explicit
+        sequencing ("and then", "then", "also"). Fragments too short to
+        research on their own stay with their neighbours.
+        
+        Args:
+            task: The task description.
+            limit: Maximum number of sub-queries.
+            
+        Returns:
+            The sub-queries, or [task] if it does not split.
+        """
+        if limit <= 1:
+            return [task]
+        
+        parts = [part.strip() for part in _SUBQUERY_SPLIT.split(task) if part and part.strip()]
+        subqueries: List[str] = []
+        for part in parts:
+            if subqueries and len(part.split()) < 3:
+                subqueries[-1] = f"{subqueries[-1]} {part}"
+            else:
+                subqueries.append(part)
+        if len(subqueries) <= 1:
+            return [task]
+        
+        # Fold the overflow into the last sub-query
+        if len(subqueries) > limit:
+            subqueries = subqueries[:limit - 1] + [" ".join(subqueries[limit - 1:])]
+        return subqueries
+    
+    def _clone_role_agent(self, role: str, index: int) -> ToolAgent:
+        """
+        Create a separate agent for a parallel run of a role.
+        
+        Agents are reentrant, but each parallel run gets its own name so its
+        timings and checkpointed step stay apart. The copies share the
+        role's tools and model.
+        
+        Args:
+            role: The role name.
+            index: Index of the parallel run.
+            
+        Returns:
+            A new ToolAgent for the role.
+        """
+        return self._build_role_agent(role, suffix=f"-{index}")
+    
+    def _get_pipeline_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the thread pool for the concurrent pipeline, creating it on first use.
+        
+        Returns:
+            The shared ThreadPoolExecutor.
+        """
+        with self._lazy_lock:
+            if self._pipeline_pool is None:
+                max_workers = self.multi_agent_config.get("max_workers") or max(
+                    4, self.multi_agent_config.get("research_fanout", 3) + 1
+                )
+                self._pipeline_pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="multi-agent")
+            return self._pipeline_pool
+    
+    def _compact_handoff(self, task: str, role: str, text: str) -> str:
+        """
+        Fit a role's output to its token budget before handing it to the next role.
+        
+        Args:
+            task: The task description, for ranking what to keep.
+            role: The role that produced the output.
+            text: The role's answer.
+            
+        Returns:
+            The compacted text.
+        """
+        return self.handoff_compactor.compact(text, role=role, query=task)
@@ -0,0 +1,258 @@
+"""
+Intent Router module for rule-based action selection.
+
+Tools declare the task phrasings they handle as regex intents. The router
+combines every registered intent into one precompiled pattern, so picking an
+action usually costs a single regex search instead of one search per pattern.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import re
+import threading
+
+from seeker_o1.tools.base import BaseTool
+
+logger = logging.getLogger(__name__)
+
+# Inline flag letters for flags that can be scoped to a single intent
+_SCOPED_FLAGS = {re.IGNORECASE: "i", re.DOTALL: "s", re.MULTILINE: "m", re.VERBOSE: "x"}
+
+# Boundaries between clauses that may each need their own action; the group keeps the separator
+_CLAUSE_SPLIT = re.compile(r"(\s*;\s*|\s+(?:and then|then|and|also|plus)\s+)")
+
+class Intent:
+    """
+    A task phrasing that maps to a tool action.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        build: Callable[..., Dict[str, Any]],
+        flags: int = 0,
+        priority: int = 100,
+        order: int = 0
+    ):
+        """
+        Initialize an Intent instance.
+
+        Args:
+            name: The action (tool name) the intent routes to.
+            pattern: Regex searched for anywhere in the task.
+            build: Called with the pattern's capture groups; returns the action input.
+            flags: Regex flags for this pattern only (IGNORECASE, DOTALL, MULTILINE, VERBOSE).
+            priority: Lower priorities are tried first.
+            order: Registration order, used to break priority ties.
+        """
+        unsupported = flags & ~sum(_SCOPED_FLAGS)
+        if unsupported:
+            raise ValueError(f"Intent flags {unsupported} cannot be scoped to a single pattern")
+        self.name = name
+        self.pattern = pattern
+        self.build = build
+        self.flags = flags
+        self.priority = priority
+        self.order = order
+        # Compiling on its own validates the pattern and gives its group count
+        self.groups = re.compile(pattern, flags).groups
+
+    def scoped_pattern(self) -> str:
+        """
+        Get the pattern wrapped in its inline flags.
+
+        Returns:
+            The pattern as a scoped group, e.g. (?s:...).
+        """
+        letters = "".join(letter for flag, letter in _SCOPED_FLAGS.items() if self.flags & flag)
+        return f"(?{letters}:{self.pattern})" if letters else f"(?:{self.pattern})"
+
+class IntentRouter:
+    """
+    Routes a task to the highest-priority matching intent using combined regexes.
+
+    Every intent becomes an alternative ``(?:pattern)(?P<iN>)`` of one
+    precompiled pattern, in priority order. The empty marker group goes last
+    so each alternative still starts with a literal, which lets the regex
+    engine skip ahead to candidate positions. A single search finds the leftmost
+    match of any intent; the search is then repeated, further right and only
+    over higher-priority intents, until none is left. Tasks that match no
+    intent (the common case) cost one search, and the result is always the
+    same as calling re.search for each pattern in priority order and taking
+    the first hit.
+
+    Routing is thread-safe. The compiled intents are published as one
+    snapshot, so a route running while an intent is registered uses either
+    the old intents or the new ones, never a mix.
+    """
+
+    def __init__(self):
+        """
+        Initialize an IntentRouter instance.
+        """
+        self.intents: List[Intent] = []
+        # (intents in priority order, marker group of each, patterns by prefix length)
+        self._compiled: Optional[Tuple[List[Intent], List[int], Dict[int, re.Pattern]]] = None
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        pattern: str,
+        build: Callable[..., Dict[str, Any]],
+        flags: int = 0,
+        priority: int = 100
+    ) -> None:
+        """
+        Register an intent.
+
+        Args:
+            name: The action (tool name) the intent routes to.
+            pattern: Regex searched for anywhere in the task. Use unnamed groups for captures.
+            build: Called with the pattern's capture groups; returns the action input.
+            flags: Regex flags for this pattern only.
+            priority: Lower priorities are tried first; ties keep registration order.
+        """
+        with self._lock:
+            self.intents.append(Intent(name, pattern, build, flags, priority, order=len(self.intents)))
+            self._compiled = None
+
+    def register_tool(self, tool: BaseTool) -> int:
+        """
+        Register every intent a tool declares.
+
+        Args:
+            tool: The tool whose get_intents() to register.
+
+        Returns:
+            The number of intents registered.
+        """
+        intents = tool.get_intents()
+        for intent in intents:
+            self.register(
+                tool.name,
+                intent["pattern"],
+                intent["build"],
+                flags=intent.get("flags", 0),
+                priority=intent.get("priority", 100)
+            )
+        return len(intents)
+
+    def route(self, task: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Find the action for a task.
+
+        Args:
+            task: The task text.
+
+        Returns:
+            A tuple of (action_name, action_input), or None if no intent matches.
+        """
+        compiled = self._compiled or self._compile()
+        ordered, markers, _ = compiled
+        if not ordered:
+            return None
+
+        best = None
+        limit = len(ordered)
+        pos = 0
+        while limit:
+            # Intents before the one found cannot match at or left of its position
+            match = self._get_pattern(compiled, limit).search(task, pos)
+            if match is None:
+                break
+            best = match
+            limit = int(match.lastgroup[1:])
+            pos = match.start() + 1
+
+        if best is None:
+            return None
+        index = int(best.lastgroup[1:])
+        intent = ordered[index]
+        marker = markers[index]
+        groups = tuple(best.group(group) for group in range(marker - intent.groups, marker))
+        # Lazy formatting: routing runs on every agent iteration
+        logger.debug("Task routed to %s by pattern %r", intent.name, intent.pattern)
+        return intent.name, intent.build(*groups)
+
+    def route_all(self, task: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Find an action for each independent clause of a task.
+
+        The task is split at ";", "and", "then", "also" and "plus". A clause
+        that routes on its own starts a new action; one that does not stays
+        with the clause before it, so "search for salt and pepper" is still a
+        single search. Tasks containing code blocks are not split.
+
+        Args:
+            task: The task text.
+
+        Returns:
+            The distinct actions in task order; empty if no intent matches.
+            A task with a single action gives the same result as route().
+        """
+        if "```" in task:
+            routed = self.route(task)
+            return [routed] if routed else []
+
+        pieces = _CLAUSE_SPLIT.split(task)
+        segments = [pieces[0]]
+        for separator, clause in zip(pieces[1::2], pieces[2::2]):
+            if self.route(clause) is not None:
+                segments.append(clause)
+            else:
+                segments[-1] += separator + clause
+
+        if len(segments) == 1:
+            routed = self.route(task)
+            return [routed] if routed else []
+        actions: List[Tuple[str, Dict[str, Any]]] = []
+        for segment in segments:
+            routed = self.route(segment)
+            if routed is not None and routed not in actions:
+                actions.append(routed)
+        return actions
+
+    def _compile(self) -> Tuple[List[Intent], List[int], Dict[int, re.Pattern]]:
+        """
+        Order the intents by priority and compile the combined pattern.
+
+        Returns:
+            The published snapshot: the ordered intents, the marker group of
+            each, and the compiled patterns by prefix length.
+        """
+        with self._lock:
+            if self._compiled is None:
+                ordered = sorted(self.intents, key=lambda intent: (intent.priority, intent.order))
+                compiled: Tuple[List[Intent], List[int], Dict[int, re.Pattern]] = (ordered, [], {})
+                if ordered:
+                    full = self._get_pattern(compiled, len(ordered))
+                    compiled[1].extend(full.groupindex[f"i{index}"] for index in range(len(ordered)))
+                self._compiled = compiled
+            return self._compiled
+
+    @staticmethod
+    def _get_pattern(compiled: Tuple[List[Intent], List[int], Dict[int, re.Pattern]], limit: int) -> re.Pattern:
+        """
+        Get the combined pattern over the first limit intents, compiling it on first use.
+
+        Group numbers are the same in every prefix, so markers from the full
+        pattern apply to all of them.
+
+        Args:
+            compiled: The snapshot from _compile().
+            limit: Number of highest-priority intents to include.
+
+        Returns:
+            The compiled pattern.
+        """
+        ordered, _, patterns = compiled
+        pattern = patterns.get(limit)
+        if pattern is None:
+            pattern = re.compile("|".join(
+                f"{intent.scoped_pattern()}(?P<i{index}>)"
+                for index, intent in enumerate(ordered[:limit])
+            ))
+            patterns[limit] = pattern
+        return pattern
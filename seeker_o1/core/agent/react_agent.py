@@ -2,15 +2,36 @@
 React Agent module that extends the base agent with reasoning capabilities.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 import json
 import logging
+import threading
+import time
 
+from seeker_o1.core.agent.agent_memory import AgentMemory
 from seeker_o1.core.agent.base_agent import BaseAgent
+from seeker_o1.core.memory import BaseMemory, ShortTermMemory
+from seeker_o1.models.base.base_model import is_error_answer
 from seeker_o1.models.model_router import ModelRouter
 
 logger = logging.getLogger(__name__)
 
+# Action that ends the loop with the answer in its "answer" input
+FINAL_ANSWER_ACTION = "final_answer"
+
+# Default rolling context compaction policy (the context_compaction option)
+DEFAULT_COMPACTION = {
+    "enabled": True,
+    "keep_steps": 3,             # iterations kept verbatim
+    "max_observation_chars": 2000,  # larger observations are stored in memory by reference
+    "max_summary_chars": 2000,   # running summary of folded iterations
+    "preview_chars": 200
+}
+
+# Observation keys kept inline when the observation is stored by reference
+_INLINE_OBSERVATION_KEYS = ("status", "error", "terminal", "final", "confidence")
+
 class ReactAgent(BaseAgent):
     """
     A reasoning agent that follows the React paradigm (Reasoning and Acting).
@@ -29,72 +50,498 @@ class ReactAgent(BaseAgent):
         """
         super().__init__(name=name, **kwargs)
         self.max_iterations = max_iterations
-        self.current_iteration = 0
+        # Guards the shared helpers created on first use, such as the action pool
+        self._lazy_lock = threading.RLock()
+        self._action_pool: Optional[ThreadPoolExecutor] = None
+        self.compaction = {**DEFAULT_COMPACTION, **kwargs.get("context_compaction", {})}
+        self.compaction["keep_steps"] = max(2, self.compaction["keep_steps"])
+        self._observation_store: Optional[BaseMemory] = kwargs.get("short_term_memory")
+        self.model_router: Optional[ModelRouter] = kwargs.get("model_router")
+        self.model_config: Dict[str, Any] = kwargs.get("model") or {}
+        memory_config = dict(kwargs.get("memory", {}))
+        cache_config = kwargs.get("result_cache", {})
+        if cache_config.get("enabled", True) and "ttl" in cache_config:
+            # Memory must not serve answers the result cache already treats as stale
+            max_age = memory_config.get("max_age")
+            memory_config["max_age"] = cache_config["ttl"] if max_age is None else min(max_age, cache_config["ttl"])
+        self.agent_memory = AgentMemory(
+            short_term=kwargs.get("short_term_memory"),
+            long_term=kwargs.get("long_term_memory"),
+            **memory_config
+        )
+        self._answer_lock = threading.Lock()
+        self.answer_stats: Dict[str, int] = {"tasks": 0, "llm_free": 0, "llm_calls": 0}
     
     def execute(self, task: str, **kwargs) -> Dict[str, Any]:
         """
         Execute a task using the React paradigm.
         
+        The agent may execute several tasks at once; each call's iteration
+        counter and status live in its own execution context.
+        
+        With a checkpoint, the compacted context is saved under the step
+        name after every iteration, and a run whose step was interrupted
+        continues after its last completed iteration.
+        
+        With memories, a task answered before is answered from them without
+        running the loop, and each new answer is remembered.
+        
         Args:
             task: The task description to execute.
-            **kwargs: Additional parameters for task execution.
+            **kwargs: Additional parameters for task execution; checkpoint
+                is the RunCheckpoint to save progress to, step the name it is
+                saved under (the agent name by default), and bypass_cache
+                skips the memory lookup.
+            
+        Returns:
+            A dictionary containing the execution result and metadata.
+        """
+        mode = kwargs.get("mode") or "auto"
+        if not kwargs.get("bypass_cache", False):
+            remembered = self._answer_from_memory(task, mode)
+            if remembered is not None:
+                self._record_llm_calls(0)
+                return remembered
+        
+        with self.execution(task, checkpoint=kwargs.get("checkpoint"), step=kwargs.get("step")):
+            result = self._run_loop(task)
+        self.agent_memory.remember(task, mode, result)
+        return result
+    
+    def _answer_from_memory(self, task: str, mode: str) -> Optional[Dict[str, Any]]:
+        """
+        Build a result from the remembered answer to a task.
+        
+        Args:
+            task: The task description.
+            mode: The execution mode the task was requested in.
+            
+        Returns:
+            A result with "llm_calls" 0 and a "memory" entry (tier, age in
+            seconds and the task as first asked), or None if the task is not
+            remembered.
+        """
+        record = self.agent_memory.recall(task, mode)
+        if record is None:
+            return None
+        logging.info(f"{self.name} answered from {record['tier']} memory.")
+        return {
+            "task": task,
+            "answer": record["answer"],
+            "llm_calls": 0,
+            "memory": {
+                "tier": record["tier"],
+                "age": time.time() - record.get("created_at", time.time()),
+                "original_task": record["task"]
+            }
+        }
+    
+    def _memory_prompt(self, prompt: str) -> str:
+        """
+        Put answers to related earlier tasks in front of a model prompt.
+        
+        Args:
+            prompt: The prompt.
+            
+        Returns:
+            The prompt with the related answers, or unchanged if there are none.
+        """
+        related = self._related_answers()
+        return f"{related}\n\nTask: {prompt}" if related else prompt
+    
+    def _related_answers(self) -> str:
+        """
+        Render the answers to earlier tasks related to the running one.
+        
+        The related tasks are looked up once per run, on first use.
+        
+        Returns:
+            The answers as prompt text, or an empty string if there are none.
+        """
+        execution = self.current_execution
+        if execution is None or not self.agent_memory.enabled:
+            return ""
+        if "memory_facts" not in execution.state:
+            execution.update(memory_facts=self.agent_memory.related(execution.task))
+        facts = execution.state["memory_facts"]
+        if not facts:
+            return ""
+        lines = ["Answers to related earlier tasks:"]
+        lines.extend(f"- {fact['task']}: {self._preview(fact['answer'], 500)}" for fact in facts)
+        return "\n".join(lines)
+    
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """
+        Get how often tasks were answered from memory.
+        
+        Returns:
+            Lookup, hit, fact and write counts, and the hit rate.
+        """
+        return self.agent_memory.get_stats()
+    
+    @property
+    def current_iteration(self) -> int:
+        """
+        The iteration of the run this thread is executing, or 0 outside of execute().
+        """
+        execution = self.current_execution
+        return execution.iteration if execution is not None else 0
+    
+    def _run_loop(self, task: str) -> Dict[str, Any]:
+        """
+        Run the thought-action loop and build the result.
+        
+        If the execution context has a checkpoint, the loop starts from the
+        state saved for its step and saves the context after every iteration.
+        
+        Args:
+            task: The task description to execute, inside its execution context.
             
         Returns:
             A dictionary containing the execution result and metadata.
         """
         self.update_state(status="executing", task=task)
-        self.current_iteration = 0
+        execution = self.current_execution
+        execution.iteration = 0
         
         # Initialize the context with the task
         context = {
             "task": task,
             "thoughts": [],
             "actions": [],
-            "observations": []
+            "observations": [],
+            "batch_sizes": [],
+            "summary": [],
+            "steps_folded": 0
         }
+        done = False
+        checkpoint = execution.checkpoint
+        saved = checkpoint.get_state(execution.step) if checkpoint is not None else None
+        if saved is not None:
+            context = saved["context"]
+            done = saved["done"]
+            execution.iteration = saved["iteration"] + (0 if done else 1)
+            logging.info(f"{self.name} resuming run {checkpoint.run_id} at iteration {execution.iteration}")
         
         # Main React loop
-        while self.current_iteration < self.max_iterations:
+        while not done and execution.iteration < self.max_iterations:
             # Generate thought
             thought = self._generate_thought(context)
             context["thoughts"].append(thought)
             
-            # Decide on action
-            action_name, action_input = self._decide_action(context)
-            action = {"name": action_name, "input": action_input}
-            context["actions"].append(action)
+            # Decide on one or more independent actions
+            decided = self._decide_actions(context)
+            actions = [{"name": action_name, "input": action_input} for action_name, action_input in decided]
+            context["actions"].extend(actions)
             
-            # Execute action and get observation
-            observation = self._execute_action(action_name, action_input)
-            context["observations"].append(observation)
+            # Execute the actions and fold their observations back in call order
+            observations = [self._store_large_observation(observation) for observation in self._execute_actions(decided)]
+            context["observations"].extend(observations)
+            context["batch_sizes"].append(len(actions))
             
             # Log the iteration
-            self.log_action("iteration", {
-                "iteration": self.current_iteration,
-                "thought": thought,
-                "action": action,
-                "observation": observation
-            })
+            if len(actions) == 1:
+                self.log_action("iteration", {
+                    "iteration": execution.iteration,
+                    "thought": thought,
+                    "action": actions[0],
+                    "observation": observations[0]
+                })
+            else:
+                self.log_action("iteration", {
+                    "iteration": execution.iteration,
+                    "thought": thought,
+                    "actions": actions,
+                    "observations": observations
+                })
+            
+            # Keep the last keep_steps iterations (at least two, for the repeat check)
+            self._compact_context(context)
             
             # Check if we should terminate
-            if self._should_terminate(context):
+            done = self._should_terminate(context)
+            if checkpoint is not None:
+                checkpoint.save_state(execution.step, {"iteration": execution.iteration, "done": done, "context": context})
+            if done:
                 break
                 
-            self.current_iteration += 1
+            execution.iteration += 1
+        
+        iterations_run = context["steps_folded"] + len(context["batch_sizes"])
+        iterations_saved = self.max_iterations - iterations_run
+        if iterations_saved > 0:
+            logging.debug(
+                f"{self.name} stopped after {iterations_run} iteration(s) "
+                f"({context.get('termination_reason')}), saving {iterations_saved}"
+            )
+        
+        # Generate final answer from the full observations of the recent iterations
+        answer_context = {
+            **context,
+            "observations": [self._resolve_observation(observation) for observation in context["observations"]]
+        }
+        last_size = context["batch_sizes"][-1] if context["batch_sizes"] else 1
+        final_observation = next(
+            (observation for observation in context["observations"][-last_size:]
+             if isinstance(observation, dict) and observation.get("final")),
+            None
+        )
+        last_actions = context["actions"][-last_size:]
+        last_observations = answer_context["observations"][-last_size:]
+        llm_calls = 0
+        if final_observation is not None:
+            final_answer = str(final_observation["result"])
+        else:
+            # Tools render their own results; a model is asked only when one cannot
+            final_answer = self._template_answer(last_actions, last_observations)
+            if final_answer is None and last_size > 1:
+                # Template the parallel actions that can be; one model call
+                # answers the rest, in place of the first of them
+                parts = [
+                    self._template_answer([action], [observation])
+                    for action, observation in zip(last_actions, last_observations)
+                ]
+                remaining = [index for index, part in enumerate(parts) if part is None]
+                remaining_context = {
+                    **answer_context,
+                    "actions": context["actions"][:-last_size] + [last_actions[index] for index in remaining],
+                    "observations": answer_context["observations"][:-last_size] + [last_observations[index] for index in remaining],
+                    "batch_sizes": context["batch_sizes"][:-1] + [len(remaining)],
+                    "llm_calls": 0
+                }
+                parts[remaining[0]] = self._generate_final_answer(remaining_context)
+                llm_calls += remaining_context["llm_calls"]
+                final_answer = "\n\n".join(part for part in parts if part is not None)
+            elif final_answer is None:
+                answer_context["llm_calls"] = 0
+                final_answer = self._generate_final_answer(answer_context)
+                llm_calls += answer_context["llm_calls"]
         
-        # Generate final answer
-        final_answer = self._generate_final_answer(context)
+        self._record_llm_calls(llm_calls)
         
         result = {
             "task": task,
             "answer": final_answer,
-            "iterations": self.current_iteration,
-            "context": context
+            "iterations": execution.iteration,
+            "iterations_saved": iterations_saved,
+            "termination_reason": context.get("termination_reason", "max_iterations"),
+            "llm_calls": llm_calls,
+            "context": context,
+            **self._assess_result(context)
         }
+        if is_error_answer(final_answer):
+            result["error"] = final_answer
         
         self.update_state(status="completed")
         return result
     
+    def get_answer_stats(self) -> Dict[str, Any]:
+        """
+        Get how many tasks were answered without a model call.
+        
+        Returns:
+            Task, LLM-free task and model call counts, and "llm_free_percent",
+            the percentage of tasks answered without any model call.
+        """
+        with self._answer_lock:
+            stats: Dict[str, Any] = dict(self.answer_stats)
+        stats["llm_free_percent"] = 100.0 * stats["llm_free"] / stats["tasks"] if stats["tasks"] else 0.0
+        return stats
+    
+    def _record_llm_calls(self, llm_calls: int) -> None:
+        """
+        Count a finished task and the model calls it took.
+        
+        Args:
+            llm_calls: Number of model calls made for the task.
+        """
+        with self._answer_lock:
+            self.answer_stats["tasks"] += 1
+            self.answer_stats["llm_calls"] += llm_calls
+            if not llm_calls:
+                self.answer_stats["llm_free"] += 1
+    
+    def _template_answer(self, actions: List[Dict[str, Any]], observations: List[Any]) -> Optional[str]:
+        """
+        Answer from tool templates when every observation has one.
+        
+        Args:
+            actions: The actions of the last step.
+            observations: Their resolved observations, in the same order.
+            
+        Returns:
+            The rendered observations joined in call order, or None if any
+            observation has no template.
+        """
+        if not observations or len(actions) != len(observations):
+            return None
+        parts = []
+        for action, observation in zip(actions, observations):
+            part = self._format_observation(action["name"], observation)
+            if part is None:
+                return None
+            parts.append(part)
+        return "\n\n".join(parts)
+    
+    def _format_observation(self, action_name: str, observation: Any) -> Optional[str]:
+        """
+        Render one observation as answer text without a model call.
+        
+        Args:
+            action_name: The action that produced the observation.
+            observation: The resolved observation.
+            
+        Returns:
+            The answer text, or None if there is no template for it.
+        """
+        # Base implementation has no tools to render observations
+        return None
+    
+    def _compact_context(self, context: Dict[str, Any]) -> None:
+        """
+        Fold iterations older than the last keep_steps into the running summary.
+        
+        Each folded iteration becomes one summary line. When the summary
+        grows past max_summary_chars its oldest lines are dropped, so the
+        context stays about the same size however long the run is.
+        
+        Args:
+            context: The current execution context, compacted in place.
+        """
+        if not self.compaction["enabled"]:
+            return
+        while len(context["batch_sizes"]) > self.compaction["keep_steps"]:
+            size = context["batch_sizes"].pop(0)
+            thought = context["thoughts"].pop(0)
+            actions = context["actions"][:size]
+            observations = context["observations"][:size]
+            del context["actions"][:size]
+            del context["observations"][:size]
+            context["steps_folded"] += 1
+            
+            outcomes = "; ".join(
+                f"{action['name']}({self._preview(action['input'], 80)}) -> {self._describe_observation(observation)}"
+                for action, observation in zip(actions, observations)
+            )
+            context["summary"].append(f"Step {context['steps_folded']}: {self._preview(thought, 120)} | {outcomes}")
+        
+        summary = context["summary"]
+        while len(summary) > 1 and sum(len(line) for line in summary) > self.compaction["max_summary_chars"]:
+            summary.pop(0)
+    
+    def render_context(self, context: Dict[str, Any]) -> str:
+        """
+        Render the context as prompt text: the running summary, then the
+        recent iterations verbatim.
+        
+        Final answer prompts are built from this, so they stay roughly the
+        same size however many iterations the run took.
+        
+        Args:
+            context: The current execution context.
+            
+        Returns:
+            The prompt text.
+        """
+        lines = [f"Task: {context['task']}"]
+        if context.get("summary"):
+            lines.append("Earlier steps:")
+            lines.extend(context["summary"])
+        observations = iter(zip(context.get("actions", []), context.get("observations", [])))
+        for thought, size in zip(context.get("thoughts", []), context.get("batch_sizes", [])):
+            lines.append(f"Thought: {thought}")
+            for _ in range(size):
+                action, observation = next(observations)
+                lines.append(f"Action: {action['name']} {json.dumps(action['input'], default=str)}")
+                lines.append(f"Observation: {json.dumps(observation, default=str)}")
+        return "\n".join(lines)
+    
+    def _store_large_observation(self, observation: Any) -> Any:
+        """
+        Move a large observation into memory and keep a reference in the context.
+        
+        Args:
+            observation: The observation from an action.
+            
+        Returns:
+            The observation itself if it is small, otherwise a stub with its
+            status, a "ref" to the stored observation and a short preview.
+        """
+        if not isinstance(observation, dict) or observation.get("final"):
+            return observation
+        serialized = json.dumps(observation, default=str)
+        if len(serialized) <= self.compaction["max_observation_chars"]:
+            return observation
+        
+        reference = self._get_observation_store().add({"type": "observation", "agent": self.name, "observation": observation})
+        stub = {key: observation[key] for key in _INLINE_OBSERVATION_KEYS if key in observation}
+        stub["ref"] = reference
+        stub["preview"] = self._preview(observation.get("result", observation), self.compaction["preview_chars"])
+        stub["size"] = len(serialized)
+        return stub
+    
+    def _resolve_observation(self, observation: Any) -> Any:
+        """
+        Get the full observation behind a stored reference.
+        
+        Args:
+            observation: An observation or a reference stub.
+            
+        Returns:
+            The stored observation, or the stub if it is not a reference or
+            the stored copy has expired.
+        """
+        if not isinstance(observation, dict) or "ref" not in observation:
+            return observation
+        stored = self._get_observation_store().get(observation["ref"])
+        return stored["observation"] if stored else observation
+    
+    def _get_observation_store(self) -> BaseMemory:
+        """
+        Get the memory that large observations are stored in.
+        
+        Returns:
+            The agent's short-term memory, or a private one if it has none.
+        """
+        with self._lazy_lock:
+            if self._observation_store is None:
+                self._observation_store = ShortTermMemory(capacity=self.compaction.get("store_capacity", 200))
+            return self._observation_store
+    
+    def _describe_observation(self, observation: Any) -> str:
+        """
+        Describe an observation in one short line for the running summary.
+        
+        Args:
+            observation: The observation or reference stub.
+            
+        Returns:
+            The status and a preview of the result or error.
+        """
+        if not isinstance(observation, dict):
+            return self._preview(observation, 120)
+        status = observation.get("status", "unknown")
+        if "ref" in observation:
+            return f"{status}: {observation['preview'][:120]} [ref {observation['ref']}]"
+        detail = observation.get("error") if status == "error" else observation.get("result", "")
+        return f"{status}: {self._preview(detail, 120)}"
+    
+    @staticmethod
+    def _preview(value: Any, limit: int) -> str:
+        """
+        Render a value as a single line of at most limit characters.
+        
+        Args:
+            value: The value to render.
+            limit: Maximum length.
+            
+        Returns:
+            The preview text.
+        """
+        text = value if isinstance(value, str) else json.dumps(value, default=str)
+        text = " ".join(text.split())
+        return text if len(text) <= limit else text[:limit - 3] + "..."
+    
     def _generate_thought(self, context: Dict[str, Any]) -> str:
         """
         Generate a thought based on the current context.
@@ -123,6 +570,73 @@ class ReactAgent(BaseAgent):
         # Currently using a placeholder
         return "text", {"text": context['task'], "operation": "process"}
     
+    def _decide_actions(self, context: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Decide on the independent actions to take in this iteration.
+        
+        Args:
+            context: The current execution context.
+            
+        Returns:
+            A list of (action_name, action_input) tuples; by default the single
+            action from _decide_action.
+        """
+        return [self._decide_action(context)]
+    
+    def _execute_actions(self, actions: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Execute an iteration's actions, concurrently if there are several.
+        
+        Args:
+            actions: The (action_name, action_input) tuples to execute.
+            
+        Returns:
+            The observations, in the same order as the actions.
+        """
+        if len(actions) == 1:
+            return [self._run_action(*actions[0])]
+        
+        pool = self._get_action_pool()
+        run_action = self._bind_execution(self._run_action)
+        futures = [pool.submit(run_action, action_name, action_input) for action_name, action_input in actions]
+        observations = []
+        for (action_name, _), future in zip(actions, futures):
+            try:
+                observations.append(future.result())
+            except Exception as e:
+                observations.append({"status": "error", "error": f"Error executing action {action_name}: {e}"})
+        return observations
+    
+    def _run_action(self, action_name: str, action_input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute one action, answering final-answer actions without a tool.
+        
+        Args:
+            action_name: The name of the action to execute.
+            action_input: The input parameters for the action.
+            
+        Returns:
+            The observation from executing the action.
+        """
+        if action_name == FINAL_ANSWER_ACTION:
+            return {"status": "success", "result": action_input.get("answer", ""), "final": True}
+        return self._execute_action(action_name, action_input)
+    
+    def _get_action_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the bounded thread pool for running an iteration's actions.
+        
+        Returns:
+            A ThreadPoolExecutor with max_parallel_actions workers (default 4).
+        """
+        with self._lazy_lock:
+            if self._action_pool is None:
+                self._action_pool = ThreadPoolExecutor(
+                    max_workers=self.config.get("max_parallel_actions", 4),
+                    thread_name_prefix=f"{self.name}-actions"
+                )
+            return self._action_pool
+    
     def _execute_action(self, action_name: str, action_input: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute an action and return the observation.
@@ -147,112 +661,143 @@ class ReactAgent(BaseAgent):
         Returns:
             True if execution should terminate, False otherwise.
         """
-        # This should check if we've found a satisfactory answer
-        # Currently using a placeholder
-        return self.current_iteration >= self.max_iterations - 1
+        reason = self._termination_reason(context)
+        if reason is not None:
+            context["termination_reason"] = reason
+        return reason is not None
+    
+    def _termination_reason(self, context: Dict[str, Any]) -> Optional[str]:
+        """
+        Work out why execution should stop after the latest iteration.
+        
+        Args:
+            context: The current execution context.
+            
+        Returns:
+            "final_answer" if the agent gave an explicit answer, "success" if
+            every observation of the latest iteration succeeded and is
+            terminal (observations may set "terminal" to False to keep going),
+            "repeated_action" if the iteration repeated the previous one's
+            actions, "max_iterations" on the last iteration, or None to
+            continue.
+        """
+        actions = context["actions"]
+        batch_sizes = context.get("batch_sizes") or [1] * len(actions)
+        size = batch_sizes[-1]
+        last_actions = actions[-size:]
+        if any(action["name"] == FINAL_ANSWER_ACTION for action in last_actions):
+            return "final_answer"
+        if all(
+            isinstance(observation, dict) and observation.get("status") == "success" and observation.get("terminal", True)
+            for observation in context["observations"][-size:]
+        ):
+            return "success"
+        # The same actions on the same inputs will not produce anything new
+        if len(batch_sizes) > 1 and actions[-size - batch_sizes[-2]:-size] == last_actions:
+            return "repeated_action"
+        if self.current_iteration >= self.max_iterations - 1:
+            return "max_iterations"
+        return None
+    
+    def _assess_result(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Derive confidence signals for a finished run.
+        
+        Args:
+            context: The final execution context.
+            
+        Returns:
+            A dictionary with "confidence" (the share of successful
+            observations, between 0 and 1) and "deterministic" (whether the
+            answer came only from deterministic tools).
+        """
+        observations = context.get("observations", [])
+        if not observations:
+            return {"confidence": 0.0, "deterministic": False}
+        successes = sum(
+            1 for observation in observations
+            if isinstance(observation, dict) and observation.get("status") == "success"
+        )
+        return {"confidence": successes / len(observations), "deterministic": False}
     
     def _generate_final_answer(self, context: Dict[str, Any]) -> str:
         """
         Generate a final answer based on the context.
         
+        Tool results are rendered by the tools' own templates before this is
+        called; this handles aggregated multi-agent results and otherwise
+        asks the default model.
+        
         Args:
             context: The current execution context.
             
         Returns:
             The final answer string.
         """
-        # Check if we have any successful tool executions
         for observation in context.get("observations", []):
-            if isinstance(observation, dict) and "result" in observation:
+            if isinstance(observation, dict) and isinstance(observation.get("result"), dict):
                 result = observation["result"]
                 
-                # Handle calculator tool
-                if isinstance(result, dict):
-                    # Calculator tool
-                    if "expression" in result and "result" in result and result.get("status") == "success":
-                        expression = result["expression"]
-                        calc_result = result["result"]
-                        return f"The result of {expression} is {calc_result}"
-                    elif result.get("status") == "error" and "error" in result:
-                        return f"Calculator error: {result['error']}"
-                    
-                    # Search tool
-                    if "query" in result and "results" in result:
-                        query = result["query"]
-                        results = result["results"]
-                        result_count = result.get("result_count", len(results))
-                        
-                        # Format the results
-                        formatted_results = "\n".join([f"- {r}" for r in results[:5]])
-                        comment = result.get("comment", "")
-                        comment_text = f"\n\n{comment}" if comment else ""
-                        
-                        return f"I searched for '{query}' and found {result_count} results:\n\n{formatted_results}{comment_text}"
+                # Multi-agent results
+                if "agent_results" in result:
+                    agent_results = result["agent_results"]
+                    final_answer = []
                     
-                    # Text tool
-                    if "text" in result and "operation" in result and "result" in result:
-                        text = result["text"]
-                        operation = result["operation"]
-                        text_result = result["result"]
-                        fun_fact = result.get("fun_fact", "")
-                        
-                        operation_description = {
-                            "count": "characters in",
-                            "reverse": "reversed",
-                            "uppercase": "in uppercase",
-                            "lowercase": "in lowercase",
-                            "capitalize": "capitalized",
-                            "wordcount": "words in"
-                        }.get(operation, operation)
-                        
-                        fun_fact_text = f"\n\n{fun_fact}" if fun_fact else ""
-                        
-                        if operation in ["count", "wordcount"]:
-                            return f"I counted {text_result} {operation_description} '{text}'{fun_fact_text}"
-                        else:
-                            return f"I processed '{text}' with {operation} operation:\n\n{text_result}{fun_fact_text}"
+                    # Process each agent's contribution
+                    sections = [
+                        ("researcher", "Research findings"),
+                        ("planner", "Execution plan"),
+                        ("executor", "Execution results"),
+                        ("critic", "Analysis and recommendations")
+                    ]
+                    for role, heading in sections:
+                        if role in agent_results:
+                            contribution = agent_results[role].get("answer", "")
+                            if contribution:
+                                final_answer.append(f"{heading}:\n{contribution}")
                     
-                    # Code tool
-                    if "code" in result and ("result" in result or "output" in result):
-                        code = result["code"]
-                        code_result = result.get("result", "No direct result")
-                        output = result.get("output", "")
-                        execution_type = result.get("execution_type", "code")
-                        
-                        if output:
-                            return f"I executed your Python code:\n\n```python\n{code}\n```\n\nOutput:\n```\n{output}\n```"
-                        else:
-                            return f"I executed your Python code:\n\n```python\n{code}\n```\n\nResult: {code_result}"
-                
-                    # Multi-agent results
-                    if "agent_results" in result:
-                        agent_results = result["agent_results"]
-                        final_answer = []
+                    # Combine all parts with proper formatting
+                    if final_answer:
+                        return "\n\n".join(final_answer)
                         
-                        # Process each agent's contribution
-                        if "researcher" in agent_results:
-                            research = agent_results["researcher"].get("answer", "")
-                            if research:
-                                final_answer.append(f"Research findings:\n{research}")
-                        
-                        if "planner" in agent_results:
-                            plan = agent_results["planner"].get("answer", "")
-                            if plan:
-                                final_answer.append(f"Execution plan:\n{plan}")
-                        
-                        if "executor" in agent_results:
-                            execution = agent_results["executor"].get("answer", "")
-                            if execution:
-                                final_answer.append(f"Execution results:\n{execution}")
-                        
-                        if "critic" in agent_results:
-                            critique = agent_results["critic"].get("answer", "")
-                            if critique:
-                                final_answer.append(f"Analysis and recommendations:\n{critique}")
-                        
-                        # Combine all parts with proper formatting
-                        if final_answer:
-                            return "\n\n".join(final_answer)
-                            
         # If no successful results found after analyzing the task
-        return ModelRouter().get_default_model().generate(context["task"]) 
\ No newline at end of file
+        return self._generate_with_model(context)
+    
+    def _generate_with_model(self, context: Dict[str, Any]) -> str:
+        """
+        Ask the model to answer the task, counting the call in the context.
+        
+        The prompt is the rendered context (the summary of folded steps and
+        the recent actions with their observations), after any answers to
+        related earlier tasks.
+        
+        Args:
+            context: The answer context; its "llm_calls" count is incremented.
+            
+        Returns:
+            The model's answer.
+        """
+        context["llm_calls"] = context.get("llm_calls", 0) + 1
+        options = {
+            key: self.config[key] for key in ("max_tokens", "timeout") if self.config.get(key) is not None
+        }
+        prompt = self.render_context(context)
+        if context.get("summary") or context.get("actions"):
+            prompt += "\n\nAnswer the task using the steps above."
+        related = self._related_answers()
+        if related:
+            prompt = f"{related}\n\n{prompt}"
+        return self._get_model().generate(prompt, **options)
+    
+    def _get_model(self) -> Any:
+        """
+        Get the model this agent answers with.
+        
+        Returns:
+            The model for the agent's "model" settings from its router, or
+            the default model if it has none.
+        """
+        with self._lazy_lock:
+            if self.model_router is None:
+                self.model_router = ModelRouter()
+        return self.model_router.resolve_model(self.model_config)
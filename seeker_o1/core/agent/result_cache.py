@@ -0,0 +1,392 @@
+"""
+Result Cache module for reusing answers to repeated tasks.
+
+The cache has two tiers. The exact tier matches tasks after normalisation
+(case, whitespace and spacing around symbols, outside quotes), so
+"Calculate 2 + 2" and "calculate 2+2" share an entry. The semantic tier
+compares task embeddings and reuses an answer when the similarity reaches
+a threshold and both tasks contain the same numbers and quoted literals. Stored tasks are embedded by a
+background worker, so storing a result never waits on the embedding model.
+Entries are kept per execution mode and expire after a TTL.
+"""
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import copy
+import importlib.util
+import logging
+import math
+import re
+import threading
+import time
+
+from seeker_o1.models.base.base_model import is_error_answer
+
+logger = logging.getLogger(__name__)
+
+# NumPy speeds up the semantic scan and is imported there
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+_WHITESPACE = re.compile(r"\s+")
+_SYMBOL_SPACING = re.compile(r"\s*([^\w\s'\"])\s*")
+_TRAILING_PUNCTUATION = re.compile(r"[.!?]+$")
+# Quoted spans are values, not wording, and are matched verbatim
+_QUOTED = re.compile(r"((?<!\w)'[^']*'(?!\w)|\"[^\"]*\")")
+# Values a semantically similar task must share for its answer to be reused
+_LITERALS = re.compile(r"\d+(?:\.\d+)?|'[^']*'|\"[^\"]*\"")
+
+def normalize_task(task: str) -> str:
+    """
+    Normalise a task for exact matching.
+
+    Args:
+        task: The task description.
+
+    Returns:
+        The task lowercased, with whitespace collapsed, no spaces around
+        symbols and no trailing sentence punctuation. Quoted spans are kept
+        as they are.
+    """
+    parts = _QUOTED.split(task.strip())
+    for index in range(0, len(parts), 2):
+        parts[index] = _SYMBOL_SPACING.sub(r"\1", _WHITESPACE.sub(" ", parts[index].lower()))
+    return _TRAILING_PUNCTUATION.sub("", "".join(parts))
+
+class ResultCache:
+    """
+    Two-tier cache of task results, keyed by execution mode.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3600,
+        max_entries: int = 1000,
+        semantic: Optional[Dict[str, Any]] = None,
+        embed: Optional[Callable[[str], Sequence[float]]] = None,
+        **kwargs
+    ):
+        """
+        Initialize a ResultCache instance.
+
+        Args:
+            ttl: Seconds an entry stays valid.
+            max_entries: Maximum entries per tier; the least recently used go first.
+            semantic: Semantic tier options: "enabled" (default True),
+                "threshold" (minimum cosine similarity, default 0.92) and
+                "max_failures" (consecutive embedding failures after which
+                the tier is switched off, default 3).
+            embed: Function that embeds a text. Without it the semantic tier
+                is off.
+            **kwargs: Additional configuration options.
+        """
+        semantic = semantic or {}
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.semantic_enabled = semantic.get("enabled", True) and embed is not None
+        self.threshold = semantic.get("threshold", 0.92)
+        self.max_failures = semantic.get("max_failures", 3)
+        self._failures = 0
+        self.embed = embed
+        self.config = kwargs
+        # (mode, normalized task) -> (stored_at, original task, result)
+        self._exact: "OrderedDict[Tuple[str, str], Tuple[float, str, Dict[str, Any]]]" = OrderedDict()
+        # (mode, normalized task) -> unit-length embedding
+        self._vectors: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._indexer: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self.stats: Dict[str, int] = {
+            "lookups": 0,
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expired": 0,
+            "embed_failures": 0,
+        }
+
+    def lookup(self, task: str, mode: str = "auto") -> Optional[Dict[str, Any]]:
+        """
+        Find a cached result for a task.
+
+        Args:
+            task: The task description.
+            mode: The execution mode the result must have been produced in.
+
+        Returns:
+            A copy of the cached result with task set to this task and a
+            "cached" entry describing the hit, or None on a miss.
+        """
+        key = (mode, normalize_task(task))
+        now = time.time()
+        with self._lock:
+            self.stats["lookups"] += 1
+            entry = self._get_live(key, now)
+            if entry is not None:
+                self.stats["exact_hits"] += 1
+                return self._mark(entry, task, "exact", 1.0, now)
+            has_candidates = self.semantic_enabled and any(other[0] == mode for other in self._vectors)
+
+        if has_candidates:
+            match = self._semantic_match(key, now)
+            if match is not None:
+                entry, similarity = match
+                with self._lock:
+                    self.stats["semantic_hits"] += 1
+                return self._mark(entry, task, "semantic", similarity, now)
+
+        with self._lock:
+            self.stats["misses"] += 1
+        return None
+
+    def store(self, task: str, mode: str, result: Dict[str, Any]) -> bool:
+        """
+        Cache a task result.
+
+        Results without an answer, with an error, whose answer is a failed
+        model call's error message, or that came from the cache are not
+        stored. A copy is kept, so later changes to the result do not reach
+        the cache; the task is added to the semantic tier in the background.
+
+        Args:
+            task: The task description.
+            mode: The execution mode that produced the result.
+            result: The result to cache.
+
+        Returns:
+            True if the result was stored.
+        """
+        answer = result.get("answer")
+        if not answer or "error" in result or "cached" in result or is_error_answer(answer):
+            return False
+        key = (mode, normalize_task(task))
+        with self._lock:
+            self._exact[key] = (time.time(), task, copy.deepcopy(result))
+            self._exact.move_to_end(key)
+            self.stats["stores"] += 1
+            while len(self._exact) > self.max_entries:
+                evicted, _ = self._exact.popitem(last=False)
+                self._vectors.pop(evicted, None)
+                self.stats["evictions"] += 1
+
+        if self.semantic_enabled and key not in self._vectors:
+            future = self._get_indexer().submit(self._index, key)
+            with self._lock:
+                self._pending = [pending for pending in self._pending if not pending.done()]
+                self._pending.append(future)
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until the results stored so far are in the semantic tier.
+
+        Args:
+            timeout: Maximum seconds to wait for each embedding.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result(timeout=timeout)
+            except Exception as e:
+                logger.debug(f"Semantic indexing did not finish: {e}")
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+        with self._lock:
+            self._exact.clear()
+            self._vectors.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit and miss counts and rates.
+
+        Returns:
+            The counters, the current entry count and the overall, exact and
+            semantic hit rates.
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self.stats)
+            stats["entries"] = len(self._exact)
+        lookups = stats["lookups"]
+        stats["hit_rate"] = (stats["exact_hits"] + stats["semantic_hits"]) / lookups if lookups else 0.0
+        stats["exact_hit_rate"] = stats["exact_hits"] / lookups if lookups else 0.0
+        stats["semantic_hit_rate"] = stats["semantic_hits"] / lookups if lookups else 0.0
+        return stats
+
+    def _get_live(self, key: Tuple[str, str], now: float) -> Optional[Tuple[float, str, Dict[str, Any]]]:
+        """
+        Get an entry if it exists and has not expired, dropping it if it has.
+
+        Args:
+            key: The (mode, normalized task) key.
+            now: The current time.
+
+        Returns:
+            The entry, or None.
+        """
+        entry = self._exact.get(key)
+        if entry is None:
+            return None
+        if now - entry[0] > self.ttl:
+            del self._exact[key]
+            self._vectors.pop(key, None)
+            self.stats["expired"] += 1
+            return None
+        self._exact.move_to_end(key)
+        return entry
+
+    def _semantic_match(
+        self,
+        key: Tuple[str, str],
+        now: float
+    ) -> Optional[Tuple[Tuple[float, str, Dict[str, Any]], float]]:
+        """
+        Find the most similar live entry in the same mode.
+
+        Args:
+            key: The (mode, normalized task) key of the new task.
+            now: The current time.
+
+        Returns:
+            The entry and its similarity, or None if none reaches the
+            threshold with the same numbers and quoted literals.
+        """
+        vector = self._embed(key[1])
+        if vector is None:
+            return None
+        literals = sorted(_LITERALS.findall(key[1]))
+
+        with self._lock:
+            candidates = [(other, other_vector) for other, other_vector in self._vectors.items() if other[0] == key[0]]
+        if not candidates:
+            return None
+        similarities = self._similarities(vector, [other_vector for _, other_vector in candidates])
+
+        ranked = sorted(zip(similarities, range(len(candidates))), reverse=True)
+        for similarity, index in ranked:
+            if similarity < self.threshold:
+                break
+            other = candidates[index][0]
+            if sorted(_LITERALS.findall(other[1])) != literals:
+                continue
+            with self._lock:
+                entry = self._get_live(other, now)
+            if entry is not None:
+                return entry, similarity
+        return None
+
+    def _index(self, key: Tuple[str, str]) -> None:
+        """
+        Embed a stored task and add it to the semantic tier.
+
+        Args:
+            key: The (mode, normalized task) key of the entry.
+        """
+        if not self.semantic_enabled:
+            return
+        vector = self._embed(key[1])
+        if vector is not None:
+            with self._lock:
+                if key in self._exact:
+                    self._vectors[key] = vector
+
+    def _get_indexer(self) -> ThreadPoolExecutor:
+        """
+        Get the worker that embeds stored tasks, creating it on first use.
+
+        Returns:
+            A single-worker ThreadPoolExecutor.
+        """
+        with self._lock:
+            if self._indexer is None:
+                self._indexer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="result-cache-index")
+            return self._indexer
+
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """
+        Embed a text and scale it to unit length.
+
+        A failure only skips the lookup or indexing that needed the vector.
+        The semantic tier is switched off after max_failures failures in a
+        row.
+
+        Args:
+            text: The text to embed.
+
+        Returns:
+            The unit-length vector, or None if it could not be computed.
+        """
+        try:
+            vector = list(self.embed(text))
+        except Exception as e:
+            with self._lock:
+                self.stats["embed_failures"] += 1
+                self._failures += 1
+                disable = self._failures >= self.max_failures
+                if disable:
+                    self.semantic_enabled = False
+            if disable:
+                logger.warning(
+                    f"Embedding failed {self.max_failures} times in a row, disabling the semantic result cache: {e}"
+                )
+            else:
+                logger.warning(f"Embedding failed, skipping the semantic result cache: {e}")
+            return None
+        with self._lock:
+            self._failures = 0
+        norm = math.sqrt(sum(value * value for value in vector))
+        if not norm:
+            return None
+        return [value / norm for value in vector]
+
+    @staticmethod
+    def _similarities(vector: List[float], others: List[List[float]]) -> List[float]:
+        """
+        Cosine similarities between a unit vector and unit vectors.
+
+        Args:
+            vector: The query vector.
+            others: The cached vectors.
+
+        Returns:
+            One similarity per cached vector.
+        """
+        if NUMPY_AVAILABLE and len(others) > 1 and all(len(other) == len(vector) for other in others):
+            import numpy as np
+
+            return (np.asarray(others, dtype=np.float64) @ np.asarray(vector, dtype=np.float64)).tolist()
+        return [
+            sum(a * b for a, b in zip(vector, other)) if len(other) == len(vector) else 0.0
+            for other in others
+        ]
+
+    @staticmethod
+    def _mark(entry: Tuple[float, str, Dict[str, Any]], task: str, tier: str, similarity: float, now: float) -> Dict[str, Any]:
+        """
+        Copy a cached result and record how it was found.
+
+        Args:
+            entry: The cache entry.
+            task: The task being answered.
+            tier: "exact" or "semantic".
+            similarity: The similarity of the match.
+            now: The current time.
+
+        Returns:
+            The marked copy of the result.
+        """
+        stored_at, original_task, result = entry
+        marked = copy.deepcopy(result)
+        marked["task"] = task
+        marked["cached"] = {
+            "tier": tier,
+            "similarity": similarity,
+            "age": now - stored_at,
+            "original_task": original_task
+        }
+        return marked
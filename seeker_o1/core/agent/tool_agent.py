@@ -5,12 +5,12 @@ Tool Agent module that extends the react agent with tool execution capabilities.
 from typing import Dict, List, Any, Optional, Tuple
 import importlib
 import logging
-import re
 import inspect
 import pkgutil
 
 from seeker_o1.core.agent.react_agent import ReactAgent
-from seeker_o1.tools.base import ToolCollection, BaseTool
+from seeker_o1.core.agent.intent_router import IntentRouter
+from seeker_o1.tools.base import ToolCollection, BaseTool, ToolResult
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,7 @@ class ToolAgent(ReactAgent):
         name: Optional[str] = None, 
         max_iterations: int = 10, 
         tools: Optional[List[str]] = None,
+        tool_collection: Optional[ToolCollection] = None,
         **kwargs
     ):
         """
@@ -35,15 +36,21 @@ class ToolAgent(ReactAgent):
             name: Optional name for the agent.
             max_iterations: Maximum number of thought-action cycles to perform.
             tools: Optional list of tool names to load.
+            tool_collection: Optional collection to use instead of a new one.
+                A frozen collection is shared as is; loading a tool that is
+                not in it gives the agent a private copy first.
             **kwargs: Additional configuration options for the agent.
         """
         super().__init__(name=name, max_iterations=max_iterations, **kwargs)
-        self.tools: ToolCollection = ToolCollection()
+        self.tools: ToolCollection = tool_collection if tool_collection is not None else ToolCollection()
+        self._intent_router: Optional[IntentRouter] = None
+        self._intent_router_tools: Tuple[str, ...] = ()
         
         # Load specified tools or default tools
         if tools:
             for tool_name in tools:
-                self.load_tool(tool_name)
+                if tool_name not in self.tools.tools:
+                    self.load_tool(tool_name)
     
     def load_tool(self, tool_name: str) -> bool:
         """
@@ -66,6 +73,9 @@ class ToolAgent(ReactAgent):
             
             if tool_class:
                 tool_instance = tool_class()
+                if self.tools.frozen:
+                    # Copy on write: a shared collection is never modified
+                    self.tools = self.tools.copy()
                 self.tools.register_tool(tool_instance)
             else:
                 logger.warning(f"Could not find tool class for {tool_name}")
@@ -90,60 +100,51 @@ class ToolAgent(ReactAgent):
         """
         task = context['task'].lower()
         
-        # Check for calculator tasks
-        calc_pattern = r'calculate\s+(.+)$'
-        calc_match = re.search(calc_pattern, task, re.IGNORECASE)
+        routed = self._get_intent_router().route(task)
+        if routed:
+            return routed
+                
+        # Default to dummy action for other tasks
+        return "dummy_action", {"query": f"Placeholder action for {task}"}
+    
+    def _decide_actions(self, context: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Decide on the independent actions to take in this iteration.
+        
+        With the parallel_actions option (on by default), a task whose
+        clauses route to different tools, such as "search for X and
+        calculate Y", gets one action per clause.
         
-        if calc_match and self.tools.get_tool('calculator'):
-            expression = calc_match.group(1).strip()
-            logging.info(f"Matched calculator expression: '{expression}'")
-            return "calculator", {"expression": expression}
+        Args:
+            context: The current execution context.
             
-        # Check for search tasks
-        search_patterns = [
-            r'search(?:\s+for)?\s+(.+)',
-            r'find(?:\s+information(?:\s+about)?)?\s+(.+)',
-            r'look\s+up\s+(.+)'
-        ]
-        
-        for pattern in search_patterns:
-            search_match = re.search(pattern, task, re.IGNORECASE)
-            if search_match and self.tools.get_tool('search'):
-                query = search_match.group(1)
-                return "search", {"query": query}
-                
-        # Check for text processing tasks
-        text_patterns = {
-            r"count\s+characters\s+in\s+['\"](.+)['\"]": ("count", None),
-            r"count\s+words\s+in\s+['\"](.+)['\"]": ("wordcount", None),
-            r"reverse\s+['\"](.+)['\"]": ("reverse", None),
-            r"uppercase\s+['\"](.+)['\"]": ("uppercase", None),
-            r"lowercase\s+['\"](.+)['\"]": ("lowercase", None),
-            r"capitalize\s+['\"](.+)['\"]": ("capitalize", None),
-        }
+        Returns:
+            A list of (action_name, action_input) tuples.
+        """
+        if self.config.get("parallel_actions", True):
+            actions = self._get_intent_router().route_all(context['task'].lower())
+            if len(actions) > 1:
+                return actions
+        return [self._decide_action(context)]
+    
+    def _get_intent_router(self) -> IntentRouter:
+        """
+        Get the intent router for the loaded tools.
         
-        for pattern, (operation, extractor) in text_patterns.items():
-            text_match = re.search(pattern, task, re.IGNORECASE)
-            if text_match and self.tools.get_tool('text'):
-                # Use the matched text directly from group 1
-                text = text_match.group(1)
-                return "text", {"text": text, "operation": operation}
-                
+        The router is rebuilt only when the set of loaded tools changes.
         
-        code_patterns = [
-            r'run\s+code\s+```(?:python)?\s*(.+?)```',
-            r'execute\s+```(?:python)?\s*(.+?)```',
-            r'evaluate\s+```(?:python)?\s*(.+?)```'
-        ]
-        
-        for pattern in code_patterns:
-            code_match = re.search(pattern, task, re.IGNORECASE | re.DOTALL)
-            if code_match and self.tools.get_tool('code'):
-                code = code_match.group(1).strip()
-                return "code", {"code": code}
-                
-        # Default to dummy action for other tasks
-        return "dummy_action", {"query": f"Placeholder action for {task}"}
+        Returns:
+            The IntentRouter built from the tools' declared intents.
+        """
+        with self._lazy_lock:
+            tool_names = tuple(self.tools.tools)
+            if self._intent_router is None or tool_names != self._intent_router_tools:
+                router = IntentRouter()
+                for tool in self.tools.tools.values():
+                    router.register_tool(tool)
+                self._intent_router = router
+                self._intent_router_tools = tool_names
+            return self._intent_router
     
     def _execute_action(self, action_name: str, action_input: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -183,6 +184,74 @@ class ToolAgent(ReactAgent):
             
             return {"status": "error", "error": f"Unknown action or tool: {action_name}"}
     
+    def _assess_result(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Derive confidence signals for a finished run from the tools it used.
+        
+        An observation counts fully when it is a success from a deterministic
+        tool and half when it is a success from any other tool, unless the
+        observation reports its own "confidence".
+        
+        Args:
+            context: The final execution context.
+            
+        Returns:
+            A dictionary with "confidence", "deterministic" (every observation
+            is a success from a deterministic tool) and "tools_used".
+        """
+        scores = []
+        tools_used = []
+        for action, observation in zip(context.get("actions", []), context.get("observations", [])):
+            if not isinstance(observation, dict) or observation.get("status") != "success":
+                scores.append(0.0)
+                continue
+            tool = self.tools.get_tool(action["name"])
+            deterministic = bool(getattr(tool, "deterministic", False))
+            if action["name"] not in tools_used:
+                tools_used.append(action["name"])
+            scores.append(observation.get("confidence", 1.0 if deterministic else 0.5))
+        
+        if not scores:
+            return {"confidence": 0.0, "deterministic": False, "tools_used": []}
+        deterministic = all(score == 1.0 for score in scores) and all(
+            getattr(self.tools.get_tool(name), "deterministic", False) for name in tools_used
+        )
+        return {
+            "confidence": sum(scores) / len(scores),
+            "deterministic": deterministic,
+            "tools_used": tools_used
+        }
+    
+    def _format_observation(self, action_name: str, observation: Any) -> Optional[str]:
+        """
+        Render an observation with the template of the tool that produced it.
+        
+        The observation is unwrapped back to what the tool returned before
+        it is passed to the tool's format_result.
+        
+        Args:
+            action_name: The tool that produced the observation.
+            observation: The resolved observation.
+            
+        Returns:
+            The answer text, or None if the tool has no template for it.
+        """
+        tool = self.tools.get_tool(action_name)
+        if tool is None or not isinstance(observation, dict):
+            return None
+        # _execute_action wraps results without a status in {"status", "result"}
+        if set(observation) == {"status", "result"}:
+            result = observation["result"]
+        else:
+            result = observation
+        if isinstance(result, ToolResult):
+            result = result.result if result.status == "success" else {"status": "error", "error": result.error_message}
+        try:
+            return tool.format_result(result)
+        except Exception as e:
+            logger.warning(f"Tool {action_name} could not format its result: {e}")
+            return None
+    
     def list_available_tools(self) -> List[Dict[str, Any]]:
         """
         List all available tools.
@@ -10,7 +10,7 @@ import time
 import heapq
 import logging
 import random
-from collections import deque
+import threading
 
 from seeker_o1.core.memory.base_memory import BaseMemory
 
@@ -56,7 +56,8 @@ class ShortTermMemory(BaseMemory):
         self.access_times: Dict[str, float] = {}
         self.creation_times: Dict[str, float] = {}
         self.lru_queue: List[tuple] = []  # Priority queue for LRU eviction
-        self.memory = deque()  # FIFO storage for recent items
+        # Agents running concurrently share one memory
+        self._lock = threading.RLock()
         
         if capacity < 100:
             logger.warning(f"Seeker O1 short-term memory capacity of {capacity} is quite small. Performance may suffer.")
@@ -65,23 +66,40 @@ class ShortTermMemory(BaseMemory):
         
         logger.info(f"Seeker O1 short-term memory initialized with capacity for {capacity} items and {ttl}s retention")
     
-    def add(self, item: Any):
-        """Add an item to the memory, potentially displacing the oldest if full."""
-        if len(self.memory) >= self.capacity:
-            removed_item = self.memory.popleft()
-            logger.debug(f"Short-term memory full. Discarded oldest item: {removed_item}")
+    def add(self, item: Any) -> str:
+        """
+        Add an item to memory, evicting the least recently used item if full.
         
-        self.memory.append(item)
-        logger.debug(f"Added to short-term memory: {item}")
+        Args:
+            item: The item to add to memory.
+            
+        Returns:
+            A string identifier for the added item.
+        """
+        with self._lock:
+            self._prune_expired()
+            if len(self.items) >= self.capacity:
+                self._evict_lru()
+            
+            identifier = str(uuid.uuid4())
+            now = time.time()
+            self.items[identifier] = item
+            self.creation_times[identifier] = now
+            self.access_times[identifier] = now
+            heapq.heappush(self.lru_queue, (now, identifier))
+            logger.debug(f"Added to short-term memory: {identifier[:8]}")
+            return identifier
     
     def get_all(self) -> List[Any]:
         """
         Retrieve all items from memory.
         
         Returns:
-            A list of all items in memory.
+            A list of all items in memory, oldest first.
         """
-        return list(self.memory)
+        with self._lock:
+            self._prune_expired()
+            return list(self.items.values())
     
     def get(self, identifier: str) -> Optional[Dict[str, Any]]:
         """
@@ -95,20 +113,21 @@ class ShortTermMemory(BaseMemory):
         Returns:
             The retrieved item, or None if not found.
         """
-        # Prune expired items
-        self._prune_expired()
-        
-        # Check if the item exists
-        if identifier not in self.items:
-            logger.debug(f"Seeker O1 has no recollection of item {identifier[:8]}...")
-            return None
-        
-        # Update access time
-        self.access_times[identifier] = time.time()
-        
-        # Return the item
-        logger.debug(f"Seeker O1 recalls this item perfectly!")
-        return self.items[identifier]
+        with self._lock:
+            # Prune expired items
+            self._prune_expired()
+            
+            # Check if the item exists
+            if identifier not in self.items:
+                logger.debug(f"Seeker O1 has no recollection of item {identifier[:8]}...")
+                return None
+            
+            # Update access time
+            self.access_times[identifier] = time.time()
+            
+            # Return the item
+            logger.debug(f"Seeker O1 recalls this item perfectly!")
+            return self.items[identifier]
     
     def search(self, query: Dict[str, Any], limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -123,45 +142,46 @@ class ShortTermMemory(BaseMemory):
         Returns:
             A list of matching items.
         """
-        # Prune expired items
-        self._prune_expired()
-        
-        logger.debug(f"Seeker O1 is probing deeply for matching items...")
-        
-        results = []
-        
-        for identifier, item in self.items.items():
-            # Check if all query fields match
-            is_match = True
-            for key, value in query.items():
-                if key not in item or item[key] != value:
-                    is_match = False
-                    break
+        with self._lock:
+            # Prune expired items
+            self._prune_expired()
             
-            if is_match:
-                # Update access time
-                self.access_times[identifier] = time.time()
-                
-                # Add to results
-                results.append({
-                    "id": identifier,
-                    "item": item,
-                    "created_at": self.creation_times[identifier]
-                })
+            logger.debug(f"Seeker O1 is probing deeply for matching items...")
+            
+            results = []
+            
+            for identifier, item in self.items.items():
+                # Check if all query fields match
+                is_match = True
+                for key, value in query.items():
+                    if key not in item or item[key] != value:
+                        is_match = False
+                        break
                 
-                # Check limit
-                if len(results) >= limit:
-                    break
-        
-        # Sort by recency
-        results.sort(key=lambda x: x["created_at"], reverse=True)
-        
-        if not results:
-            logger.debug("Seeker O1 found nothing that matches. How disappointing.")
-        else:
-            logger.debug(f"Seeker O1 successfully extracted {len(results)} matching items!")
-        
-        return results
+                if is_match:
+                    # Update access time
+                    self.access_times[identifier] = time.time()
+                    
+                    # Add to results
+                    results.append({
+                        "id": identifier,
+                        "item": item,
+                        "created_at": self.creation_times[identifier]
+                    })
+                    
+                    # Check limit
+                    if len(results) >= limit:
+                        break
+            
+            # Sort by recency
+            results.sort(key=lambda x: x["created_at"], reverse=True)
+            
+            if not results:
+                logger.debug("Seeker O1 found nothing that matches. How disappointing.")
+            else:
+                logger.debug(f"Seeker O1 successfully extracted {len(results)} matching items!")
+            
+            return results
     
     def update(self, identifier: str, item: Dict[str, Any]) -> bool:
         """
@@ -174,22 +194,23 @@ class ShortTermMemory(BaseMemory):
         Returns:
             True if the update was successful, False otherwise.
         """
-        # Prune expired items
-        self._prune_expired()
-        
-        # Check if the item exists
-        if identifier not in self.items:
-            logger.debug(f"Seeker O1 can't update what it doesn't have (identifier: {identifier[:8]})")
-            return False
-        
-        # Update the item
-        self.items[identifier] = item
-        
-        # Update access time
-        self.access_times[identifier] = time.time()
-        
-        logger.debug(f"Seeker O1 memory successfully updated with fresh content")
-        return True
+        with self._lock:
+            # Prune expired items
+            self._prune_expired()
+            
+            # Check if the item exists
+            if identifier not in self.items:
+                logger.debug(f"Seeker O1 can't update what it doesn't have (identifier: {identifier[:8]})")
+                return False
+            
+            # Update the item
+            self.items[identifier] = item
+            
+            # Update access time
+            self.access_times[identifier] = time.time()
+            
+            logger.debug(f"Seeker O1 memory successfully updated with fresh content")
+            return True
     
     def delete(self, identifier: str) -> bool:
         """
@@ -201,31 +222,33 @@ class ShortTermMemory(BaseMemory):
         Returns:
             True if the deletion was successful, False otherwise.
         """
-        # Check if the item exists
-        if identifier not in self.items:
-            return False
-        
-        # Delete the item
-        del self.items[identifier]
-        del self.access_times[identifier]
-        del self.creation_times[identifier]
-        
-        # Note: The item will remain in the LRU queue, but will be skipped when it's popped
-        
-        logger.debug(f"Seeker O1 has purged this item from its memory")
-        return True
+        with self._lock:
+            # Check if the item exists
+            if identifier not in self.items:
+                return False
+            
+            # Delete the item
+            del self.items[identifier]
+            del self.access_times[identifier]
+            del self.creation_times[identifier]
+            
+            # Note: The item will remain in the LRU queue, but will be skipped when it's popped
+            
+            logger.debug(f"Seeker O1 has purged this item from its memory")
+            return True
     
     def clear(self) -> None:
         """
         Clear all items from memory.
         """
-        old_count = len(self.items)
-        self.items = {}
-        self.access_times = {}
-        self.creation_times = {}
-        self.lru_queue = []
-        
-        logger.info(f"Seeker O1 memory has been completely flushed of {old_count} items. Fresh and clean!")
+        with self._lock:
+            old_count = len(self.items)
+            self.items = {}
+            self.access_times = {}
+            self.creation_times = {}
+            self.lru_queue = []
+            
+            logger.info(f"Seeker O1 memory has been completely flushed of {old_count} items. Fresh and clean!")
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -234,26 +257,27 @@ class ShortTermMemory(BaseMemory):
         Returns:
             A dictionary containing memory statistics.
         """
-        utilization = len(self.items) / self.capacity if self.capacity > 0 else 0
-        
-        # Add a funny message based on utilization
-        if utilization > 0.9:
-            status = "Seeker O1 memory is nearly full! Things are getting tight in here."
-        elif utilization > 0.7:
-            status = "Seeker O1 memory is filling up nicely."
-        elif utilization > 0.4:
-            status = "Seeker O1 memory has plenty of room for more."
-        else:
-            status = "Seeker O1 memory is mostly empty. Feed me more data!"
+        with self._lock:
+            utilization = len(self.items) / self.capacity if self.capacity > 0 else 0
             
-        return {
-            "type": "short_term",
-            "capacity": self.capacity,
-            "ttl": self.ttl,
-            "current_size": len(self.items),
-            "utilization": utilization,
-            "status": status
-        }
+            # Add a funny message based on utilization
+            if utilization > 0.9:
+                status = "Seeker O1 memory is nearly full! Things are getting tight in here."
+            elif utilization > 0.7:
+                status = "Seeker O1 memory is filling up nicely."
+            elif utilization > 0.4:
+                status = "Seeker O1 memory has plenty of room for more."
+            else:
+                status = "Seeker O1 memory is mostly empty. Feed me more data!"
+                
+            return {
+                "type": "short_term",
+                "capacity": self.capacity,
+                "ttl": self.ttl,
+                "current_size": len(self.items),
+                "utilization": utilization,
+                "status": status
+            }
     
     def _prune_expired(self) -> None:
         """
@@ -262,9 +286,11 @@ class ShortTermMemory(BaseMemory):
         current_time = time.time()
         expired_identifiers = []
         
+        # Creation times are in insertion order, so the scan stops at the first live item
         for identifier, creation_time in self.creation_times.items():
-            if current_time - creation_time > self.ttl:
-                expired_identifiers.append(identifier)
+            if current_time - creation_time <= self.ttl:
+                break
+            expired_identifiers.append(identifier)
         
         if expired_identifiers:
             for identifier in expired_identifiers:
@@ -277,14 +303,20 @@ class ShortTermMemory(BaseMemory):
         Evict the least recently used item from memory.
         """
         while self.lru_queue:
-            _, identifier = heapq.heappop(self.lru_queue)
+            queued_at, identifier = heapq.heappop(self.lru_queue)
             
             # Skip if the item has been deleted
             if identifier not in self.items:
                 continue
             
+            # Requeue items accessed since they were queued
+            if self.access_times[identifier] > queued_at:
+                heapq.heappush(self.lru_queue, (self.access_times[identifier], identifier))
+                continue
+            
             # Delete the item
-            item_name = self.items[identifier].get("name", "unknown")
+            item = self.items[identifier]
+            item_name = item.get("name", "unknown") if isinstance(item, dict) else "unknown"
             self.delete(identifier)
             logger.debug(f"Seeker O1 had to push out '{item_name}' to make room for new content")
             break 
\ No newline at end of file
@@ -9,12 +9,11 @@ Behind every successful Seeker O1 is a well-designed Orchestrator.
 
 from typing import Dict, List, Any, Optional, Union
 import logging
-import yaml
 import os
 import time
 import random
 
-from seeker_o1.core.agent import BaseAgent, HybridAgent
+from seeker_o1.core.agent import BaseAgent, CheckpointStore, HybridAgent
 from seeker_o1.core.memory import ShortTermMemory, LongTermMemory
 from seeker_o1.tools.base import ToolCollection
 from seeker_o1.models.model_router import ModelRouter
@@ -84,13 +83,17 @@ class AgentOrchestrator:
         
         logger.info("Seeker O1 Orchestrator initialized and ready for action")
     
-    def execute_task(self, task: str, mode: Optional[str] = None) -> Dict[str, Any]:
+    def execute_task(self, task: str, mode: Optional[str] = None, run_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Execute a task using an appropriate agent.
         
+        May be called from several threads at once; the primary agent keeps
+        each task's progress in its own execution context.
+        
         Args:
             task: The task description to execute.
             mode: Execution mode ("single" or "multi"). If None, uses the config default.
+            run_id: The checkpointed run to continue, if any.
             
         Returns:
             The execution result.
@@ -116,7 +119,8 @@ class AgentOrchestrator:
             logger.info(f"Seeker O1 processing task: {display_task}")
         
         # Execute the task with the primary agent
-        result = self.primary_agent.execute(task, mode=mode)
+        options = {"run_id": run_id} if run_id else {}
+        result = self.primary_agent.execute(task, mode=mode, **options)
         
         # Record execution time
         execution_time = time.time() - start_time
@@ -194,6 +198,110 @@ class AgentOrchestrator:
         
         return self.task_history[-limit:]
     
+    def resume_task(self, run_id: str) -> Dict[str, Any]:
+        """
+        Continue an interrupted task from its last completed step.
+        
+        Args:
+            run_id: The run's identifier, as listed by list_checkpoints().
+            
+        Returns:
+            The execution result; the saved answer if the run had completed.
+            
+        Raises:
+            ValueError: If checkpoints are disabled or the run has no checkpoint.
+        """
+        if self.checkpoint_store is None:
+            raise ValueError("Checkpoints are disabled")
+        record = self.checkpoint_store.load(run_id)
+        if record is None:
+            raise ValueError(f"No checkpoint for run {run_id}")
+        if record.get("status") == "completed":
+            return record["result"]
+        
+        logger.info(f"Seeker O1 resuming run {run_id} with {len(record.get('steps') or {})} completed step(s)")
+        return self.execute_task(record["task"], mode=record.get("mode"), run_id=run_id)
+    
+    def list_checkpoints(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List checkpointed runs, most recent first.
+        
+        Args:
+            status: Only list runs with this status ("running", "failed" or "completed").
+            
+        Returns:
+            A summary of each run, or an empty list if checkpoints are disabled.
+        """
+        if self.checkpoint_store is None:
+            return []
+        return self.checkpoint_store.list(status=status)
+    
+    def get_speculation_stats(self) -> Dict[str, Any]:
+        """
+        Get how often each path won speculative single vs multi-agent races.
+        
+        Returns:
+            The primary agent's speculation stats, or an empty dictionary if
+            it does not race modes.
+        """
+        if self.primary_agent is None or not hasattr(self.primary_agent, "get_speculation_stats"):
+            return {}
+        return self.primary_agent.get_speculation_stats()
+    
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get how often tasks were answered from the result cache.
+        
+        Returns:
+            The primary agent's result cache stats, or an empty dictionary if
+            it has no result cache.
+        """
+        if self.primary_agent is None or not hasattr(self.primary_agent, "get_result_cache_stats"):
+            return {}
+        return self.primary_agent.get_result_cache_stats()
+    
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """
+        Get how often tasks were answered from memory.
+        
+        Returns:
+            The primary agent's memory stats, or an empty dictionary if it
+            does not use memory.
+        """
+        if self.primary_agent is None or not hasattr(self.primary_agent, "get_memory_stats"):
+            return {}
+        return self.primary_agent.get_memory_stats()
+    
+    def get_answer_stats(self) -> Dict[str, Any]:
+        """
+        Get how many tasks were answered without any model call.
+        
+        Returns:
+            The primary agent's answer stats, including "llm_free_percent".
+        """
+        if self.primary_agent is None or not hasattr(self.primary_agent, "get_answer_stats"):
+            return {}
+        return self.primary_agent.get_answer_stats()
+    
+    def process_images(self, source: str, output_path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Run OCR and captioning over a directory or glob of images.
+
+        Args:
+            source: A directory (searched recursively) or a glob pattern.
+            output_path: Path of the JSONL file to stream results to.
+            **kwargs: Overrides for bulk_process options (workers, max_in_flight, resume, caption).
+
+        Returns:
+            A summary of the run.
+        """
+        from seeker_o1.models.vision_bulk import bulk_process
+
+        vision_config = self.config.get("vision", {})
+        options = dict(vision_config.get("bulk", {}))
+        options.update(kwargs)
+        return bulk_process(source, output_path, vision_config=vision_config, **options)
+
     def get_last_result(self) -> Dict[str, Any]:
         """
         Get the result of the last executed task.
@@ -219,7 +327,29 @@ class AgentOrchestrator:
                 "name": "seeker-o1",
                 "mode": "single",
                 "max_iterations": 10,
-                "complexity_threshold": 7
+                "complexity_threshold": 7,
+                "parallel_actions": True,
+                "max_parallel_actions": 4,
+                "history": {
+                    "capacity": 1000,
+                    "spill_dir": None
+                },
+                "context_compaction": {
+                    "enabled": True,
+                    "keep_steps": 3,
+                    "max_observation_chars": 2000,
+                    "max_summary_chars": 2000
+                },
+                "result_cache": {
+                    "enabled": True,
+                    "ttl": 3600,
+                    "max_entries": 1000,
+                    "semantic": {
+                        "enabled": True,
+                        "threshold": 0.92,
+                        "max_failures": 3
+                    }
+                }
             },
             "memory": {
                 "short_term": {
@@ -230,6 +360,13 @@ class AgentOrchestrator:
                     "enabled": True,
                     "storage_path": None,
                     "index_in_memory": True
+                },
+                "agent": {
+                    "recall": True,
+                    "max_age": 3600,
+                    "max_facts": 3,
+                    "min_relevance": 0.3,
+                    "min_confidence": 0.5
                 }
             },
             "model": {
@@ -239,6 +376,71 @@ class AgentOrchestrator:
             },
             "tools": {
                 "enabled": []
+            },
+            "multi_agent": {
+                "pipeline": "concurrent",
+                "research_fanout": 3,
+                "max_workers": None,
+                "handoff": {
+                    "budgets": {"researcher": 250, "planner": 200, "executor": 250},
+                    "llm_fallback": True
+                },
+                "early_exit": {
+                    "enabled": True,
+                    "skip_planner": True,
+                    "skip_critic": True,
+                    "critic_confidence": 0.9
+                },
+                "speculative": {
+                    "enabled": False,
+                    "max_complexity": 10.0,
+                    "min_answer_length": 20,
+                    "history_size": 1000
+                }
+            },
+            "specialized_agents": {
+                "roles": ["researcher", "planner", "executor", "critic"]
+            },
+            "checkpoints": {
+                "enabled": False,
+                "directory": None,
+                "keep_completed": False
+            },
+            "vision": {
+                "model": {
+                    "batch_size": 8,
+                    "ocr_workers": None,
+                    "ocr_binarize": False,
+                    "inference": {
+                        "inference_mode": True,
+                        "num_threads": None,
+                        "quantize": False,
+                        "backend": "eager"
+                    }
+                },
+                "cache": {
+                    "enabled": True,
+                    "storage_path": None,
+                    "perceptual_hash": False,
+                    "max_distance": 4
+                },
+                "pipeline": {
+                    "max_workers": 2,
+                    "min_text_length": 3,
+                    "text_precheck": True
+                },
+                "bulk": {
+                    "workers": None,
+                    "max_in_flight": None
+                },
+                "worker": {
+                    "address": None,
+                    "authkey": None,
+                    "timeout": 120.0,
+                    "fallback_local": True,
+                    "batch_window": 0.02,
+                    "max_batch": 16
+                }
             }
         }
         
@@ -249,6 +451,8 @@ class AgentOrchestrator:
             return default_config
         
         try:
+            import yaml
+            
             # Load the config file
             with open(config_path, "r") as f:
                 config = yaml.safe_load(f)
@@ -300,6 +504,11 @@ class AgentOrchestrator:
         mode = agent_config.get("mode", "single")
         max_iterations = agent_config.get("max_iterations", 10)
         complexity_threshold = agent_config.get("complexity_threshold", 7)
+        history_config = agent_config.get("history", {})
+        history_spill_path = None
+        if history_config.get("spill_dir"):
+            spill_dir = os.path.expanduser(history_config["spill_dir"])
+            history_spill_path = os.path.join(spill_dir, f"{name}-history.jsonl.gz")
         
         # Get tools config
         tools_config = self.config.get("tools", {})
@@ -308,6 +517,7 @@ class AgentOrchestrator:
         
         short_term_memory = self._create_short_term_memory()
         long_term_memory = self._create_long_term_memory()
+        self.checkpoint_store = self._create_checkpoint_store()
         
         
         agent = HybridAgent(
@@ -316,15 +526,26 @@ class AgentOrchestrator:
             tools=enabled_tools,
             mode=mode,
             complexity_threshold=complexity_threshold,
+            parallel_actions=agent_config.get("parallel_actions", True),
+            max_parallel_actions=agent_config.get("max_parallel_actions", 4),
+            history_capacity=history_config.get("capacity", 1000),
+            history_spill_path=history_spill_path,
+            context_compaction=agent_config.get("context_compaction", {}),
+            result_cache=agent_config.get("result_cache", {}),
+            checkpoint_store=self.checkpoint_store,
             short_term_memory=short_term_memory,
-            long_term_memory=long_term_memory
+            long_term_memory=long_term_memory,
+            memory=self.config.get("memory", {}).get("agent", {}),
+            vision=self.config.get("vision", {}),
+            multi_agent=self.config.get("multi_agent", {})
         )
         
         logger.info(f"Primary agent created. seeker-o1 is ready with {len(enabled_tools)} tools available")
         
         
-        if mode == "multi" or mode == "auto":
-            self._create_specialized_agents(agent)
+        # Role agents are built on first use, so configuring them is cheap in any mode
+        self._create_specialized_agents(agent)
+        if mode in ("multi", "auto", "speculative"):
             logger.info("Multiple specialized agents have been inserted into seeker-o1")
         
         
@@ -370,6 +591,21 @@ class AgentOrchestrator:
         
         return LongTermMemory(storage_path=storage_path, index_in_memory=index_in_memory)
     
+    def _create_checkpoint_store(self) -> Optional[CheckpointStore]:
+        """
+        Create the store that task progress is checkpointed to.
+        
+        Returns:
+            A CheckpointStore instance, or None if checkpoints are disabled.
+        """
+        checkpoint_config = self.config.get("checkpoints", {})
+        if not checkpoint_config.get("enabled", False):
+            return None
+        return CheckpointStore(
+            directory=checkpoint_config.get("directory"),
+            keep_completed=checkpoint_config.get("keep_completed", False)
+        )
+    
     def _create_specialized_agents(self, primary_agent: HybridAgent) -> None:
         """
         Create specialized agents for multi-agent mode.
@@ -384,7 +620,7 @@ class AgentOrchestrator:
         specialized_config = self.config.get("specialized_agents", {})
         roles = specialized_config.get("roles", default_roles)
         
-        # Create each specialized agent
+        # Configure each specialized agent; the primary agent builds it on first use
         for role in roles:
             role_config = specialized_config.get(role, {})
             
@@ -399,8 +635,8 @@ class AgentOrchestrator:
             merged_config = self._merge_configs(default_role_config, role_config)
             
             # Add to the primary agent
-            # primary_agent.add_specialized_agent(role, merged_config)
-            # logger.debug(f"Added {role} agent to seeker-o1")
+            primary_agent.configure_specialized_agent(role, merged_config)
+            logger.debug(f"Added {role} agent to seeker-o1")
         
         logger.info(f"seeker-o1 now contains {len(roles)} specialized agents working together harmoniously")
         if len(roles) > 5:
@@ -14,9 +14,13 @@ def main():
     """Main entry point for the Seeker-o1 agent"""
     parser = argparse.ArgumentParser(description="Seeker-o1 - Strategic Exploration and Knowledge Extraction Research")
     parser.add_argument("--config", type=str, default="config.yaml", help="Path to configuration file")
-    parser.add_argument("--mode", type=str, default="single", choices=["single", "multi"], help="Agent mode")
+    parser.add_argument("--mode", type=str, default="single", choices=["single", "multi", "auto", "speculative"], help="Agent mode")
     parser.add_argument("--task", type=str, help="Task description")
+    parser.add_argument("--resume", type=str, metavar="RUN_ID", help="Resume an interrupted task from its checkpoint")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
+    parser.add_argument("--bulk", type=str, help="Directory or glob of images to OCR and caption")
+    parser.add_argument("--output", type=str, default="vision_results.jsonl", help="JSONL output file for --bulk")
+    parser.add_argument("--workers", type=int, help="Number of worker processes for --bulk")
     
     args = parser.parse_args()
     
@@ -29,6 +33,19 @@ def main():
     # Initialize the agent orchestrator
     orchestrator = AgentOrchestrator(config_path=args.config)
     
+    # If an image source is provided, run bulk vision processing
+    if args.bulk:
+        options = {"workers": args.workers} if args.workers else {}
+        summary = orchestrator.process_images(args.bulk, args.output, **options)
+        cli.console.print(f"Processed {summary['processed']}, skipped {summary['skipped']}, "
+              f"failed {summary['failed']} in {summary['elapsed']:.1f}s -> {args.output}")
+        return
+    
+    if args.resume:
+        result = orchestrator.resume_task(args.resume)
+        cli.display_result(result)
+        return
+    
     # If task is provided as argument, execute it
     if args.task:
         result = orchestrator.execute_task(args.task, mode=args.mode)
@@ -5,6 +5,6 @@ This module contains the base model interfaces:
 - BaseModel: Abstract base class for all language models
 """
 
-from seeker_o1.models.base.base_model import BaseModel
+from seeker_o1.models.base.base_model import ERROR_ANSWER_PREFIX, BaseModel, is_error_answer
 
-__all__ = ["BaseModel"] 
\ No newline at end of file
+__all__ = ["BaseModel", "ERROR_ANSWER_PREFIX", "is_error_answer"] 
\ No newline at end of file
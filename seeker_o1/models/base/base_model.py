@@ -5,6 +5,21 @@ Base Model module that defines the common interface for all language models.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Union, Callable
 
+# Models report a failed call by answering with this prefix instead of raising
+ERROR_ANSWER_PREFIX = "Error: "
+
+def is_error_answer(answer: Any) -> bool:
+    """
+    Check whether a generated answer reports a failed model call.
+    
+    Args:
+        answer: The answer returned by generate().
+        
+    Returns:
+        True if the answer is an error message rather than model output.
+    """
+    return isinstance(answer, str) and answer.startswith(ERROR_ANSWER_PREFIX)
+
 class BaseModel(ABC):
     """
     Abstract base class for language model implementations.
@@ -0,0 +1,195 @@
+"""
+Image preprocessing module for the seeker-o1 framework.
+
+Decodes images once at the resolution the vision consumers actually need and
+prepares OCR and captioning inputs from that single decode.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Union
+import logging
+import threading
+
+from PIL import Image, ImageChops, ImageFilter, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# Longest side handed to Tesseract. Large enough for body text in phone photos
+# and full-page scans, far below the 4000+ px of modern cameras.
+OCR_MAX_SIDE = 2048
+
+# BLIP's processor resizes to 384x384, so anything larger is wasted decoding.
+CAPTION_SIZE = 384
+
+def load_image(source: Union[str, Image.Image], max_side: Optional[int] = None) -> Image.Image:
+    """
+    Decode an image, bounded to a maximum side length.
+
+    JPEGs are decoded in draft mode, which lets libjpeg scale by 1/2, 1/4 or
+    1/8 during decoding instead of decoding at full size and resizing. EXIF
+    orientation is applied so phone photos come out upright.
+
+    Args:
+        source: Path to the image file, or an already opened image.
+        max_side: Maximum length of the longest side. If None, keeps the full resolution.
+
+    Returns:
+        The decoded image.
+    """
+    image = Image.open(source) if isinstance(source, str) else source
+
+    if max_side and image.format == "JPEG":
+        width, height = image.size
+        scale = max_side / max(width, height)
+        if scale < 1:
+            image.draft(image.mode, (max(1, int(width * scale)), max(1, int(height * scale))))
+
+    image = ImageOps.exif_transpose(image)
+    if max_side and max(image.size) > max_side:
+        image.thumbnail((max_side, max_side), Image.Resampling.BILINEAR)
+    image.load()
+    return image
+
+def prepare_for_ocr(
+    image: Image.Image,
+    max_side: int = OCR_MAX_SIDE,
+    binarize: bool = False,
+    block_radius: int = 15,
+    offset: int = 10
+) -> Image.Image:
+    """
+    Prepare an image for Tesseract.
+
+    The image is converted to grayscale. Tesseract binarises its input
+    itself, so local-mean binarisation is off by default; turn it on for
+    photos whose uneven lighting washes out text.
+
+    Args:
+        image: The decoded image.
+        max_side: Maximum length of the longest side.
+        binarize: Whether to apply adaptive binarisation.
+        block_radius: Radius of the box filter used for the local mean.
+        offset: How much darker than the local mean a pixel must be to count as ink.
+
+    Returns:
+        A grayscale or bilevel image.
+    """
+    gray = _flatten(image).convert("L")
+    if max(gray.size) > max_side:
+        gray = gray.copy()
+        gray.thumbnail((max_side, max_side), Image.Resampling.BILINEAR)
+    if not binarize:
+        return gray
+
+    local_mean = gray.filter(ImageFilter.BoxBlur(block_radius))
+    darkness = ImageChops.subtract(local_mean, gray)
+    return darkness.point(lambda value: 0 if value > offset else 255, mode="1")
+
+def prepare_for_caption(image: Image.Image, size: int = CAPTION_SIZE) -> Image.Image:
+    """
+    Prepare an image for the BLIP captioner.
+
+    Args:
+        image: The decoded image.
+        size: Maximum length of the longest side.
+
+    Returns:
+        An RGB image no larger than the captioner's input size.
+    """
+    rgb = _flatten(image)
+    if max(rgb.size) > size:
+        rgb = rgb.copy()
+        rgb.thumbnail((size, size), Image.Resampling.BICUBIC)
+    return rgb
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """
+    Convert an image to RGB, compositing any transparency onto white.
+
+    Args:
+        image: The image to convert.
+
+    Returns:
+        An RGB image.
+    """
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, "white")
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB") if image.mode != "RGB" else image
+
+class DecodedImage:
+    """
+    An image decoded once and shared between OCR and captioning.
+
+    Decoding is lazy and thread-safe, so the OCR and caption workers of the
+    vision pipeline can both ask for their input concurrently. Each prepared
+    variant is computed once and cached.
+    """
+
+    def __init__(self, source: Union[str, Image.Image], max_side: Optional[int] = OCR_MAX_SIDE):
+        """
+        Initialize a DecodedImage instance.
+
+        Args:
+            source: Path to the image file, or an already opened image.
+            max_side: Maximum longest side to decode at. Use CAPTION_SIZE when OCR is not needed.
+        """
+        self.source = source
+        self.max_side = max_side
+        self._image: Optional[Image.Image] = None
+        self._variants: Dict[Tuple[Any, ...], Image.Image] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def image(self) -> Image.Image:
+        """
+        The decoded image.
+        """
+        with self._lock:
+            if self._image is None:
+                self._image = load_image(self.source, self.max_side)
+            return self._image
+
+    def for_ocr(self, max_side: int = OCR_MAX_SIDE, binarize: bool = False) -> Image.Image:
+        """
+        Get the OCR input for this image.
+
+        Args:
+            max_side: Maximum length of the longest side.
+            binarize: Whether to apply adaptive binarisation.
+
+        Returns:
+            The prepared image.
+        """
+        return self._variant(("ocr", max_side, binarize), prepare_for_ocr, max_side=max_side, binarize=binarize)
+
+    def for_caption(self, size: int = CAPTION_SIZE) -> Image.Image:
+        """
+        Get the captioning input for this image.
+
+        Args:
+            size: Maximum length of the longest side.
+
+        Returns:
+            The prepared image.
+        """
+        return self._variant(("caption", size), prepare_for_caption, size=size)
+
+    def _variant(self, key: Tuple[Any, ...], prepare, **kwargs) -> Image.Image:
+        """
+        Compute and cache a prepared variant of the image.
+
+        Args:
+            key: Cache key for the variant.
+            prepare: Function turning the decoded image into the variant.
+            **kwargs: Arguments for the prepare function.
+
+        Returns:
+            The prepared image.
+        """
+        image = self.image
+        with self._lock:
+            if key not in self._variants:
+                self._variants[key] = prepare(image, **kwargs)
+            return self._variants[key]
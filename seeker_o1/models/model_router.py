@@ -3,7 +3,9 @@ Model Router module for dynamic model selection.
 """
 
 from typing import Dict, List, Any, Optional, Union, Type
+import json
 import logging
+import threading
 
 from seeker_o1.models.base.base_model import BaseModel
 from seeker_o1.models.openai_model import OpenAIModel
@@ -18,6 +20,9 @@ class ModelRouter:
     - Registering different model implementations
     - Selecting models based on task requirements
     - Fallback mechanisms for reliability
+    
+    Models created from a configuration are cached by that configuration,
+    so agents sharing a router share one client per distinct model config.
     """
     
     def __init__(self, default_model_config: Optional[Dict[str, Any]] = None):
@@ -37,6 +42,8 @@ class ModelRouter:
             "temperature": 0.0
         }
         self.default_model = None
+        self._config_models: Dict[str, BaseModel] = {}
+        self._lock = threading.RLock()
     
     def register_model(self, name: str, model: BaseModel) -> None:
         """
@@ -80,9 +87,13 @@ class ModelRouter:
             logging.warning(f"Model '{name_or_config}' not found. Using default model.")
             return self.get_default_model()
         
-        # If it's a config dict, create a new model
+        # If it's a config dict, reuse or create the model for that config
         elif isinstance(name_or_config, dict):
-            return self._create_model_from_config(name_or_config)
+            key = json.dumps(name_or_config, sort_keys=True, default=str)
+            with self._lock:
+                if key not in self._config_models:
+                    self._config_models[key] = self._create_model_from_config(name_or_config)
+                return self._config_models[key]
         
         # Invalid input
         else:
@@ -97,10 +108,33 @@ class ModelRouter:
             The default model instance.
         """
         if self.default_model is None:
-            self.default_model = self._create_model_from_config(self.default_model_config)
+            with self._lock:
+                if self.default_model is None:
+                    self.default_model = self._create_model_from_config(self.default_model_config)
         
         return self.default_model
     
+    def resolve_model(self, overrides: Optional[Dict[str, Any]] = None) -> BaseModel:
+        """
+        Get the default model, or a model for the default config with overrides.
+        
+        Args:
+            overrides: Model settings to change, such as {"name": "gpt-4o-mini"}.
+            
+        Returns:
+            The model instance, shared with every caller using the same settings.
+        """
+        if not overrides:
+            return self.get_default_model()
+        overrides = dict(overrides)
+        if "name" in overrides and "model_name" not in overrides:
+            overrides["model_name"] = overrides.pop("name")
+        config = dict(self.default_model_config)
+        if "model_name" in overrides:
+            config.pop("name", None)
+        config.update(overrides)
+        return self.get_model(config)
+    
     def select_model_for_task(self, task: str, requirements: Dict[str, Any] = None) -> BaseModel:
         """
         Select an appropriate model for a given task.
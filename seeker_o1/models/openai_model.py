@@ -3,19 +3,16 @@ OpenAI Model implementation for the seeker-o1 framework.
 """
 
 from typing import Dict, List, Any, Optional, Union, Callable
+import importlib.util
 import json
 import logging
 import os
 
-try:
-    import openai
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+# The openai client is imported when the first model is created; only check
+# that it is installed here to keep import time down.
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
 
-from seeker_o1.models.base.base_model import BaseModel
-from tenacity import retry, stop_after_attempt, wait_random_exponential
+from seeker_o1.models.base.base_model import ERROR_ANSWER_PREFIX, BaseModel
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +58,7 @@ class OpenAIModel(BaseModel):
         self.base_url = base_url
         
         # Initialize client
+        from openai import OpenAI
         self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
         
         # Set default embedding model
@@ -116,7 +114,7 @@ class OpenAIModel(BaseModel):
         
         except Exception as e:
             logging.error(f"Error generating with OpenAI: {e}")
-            return f"Error: {str(e)}"
+            return f"{ERROR_ANSWER_PREFIX}{str(e)}"
     
     def generate_with_tools(
         self, 
@@ -215,7 +213,7 @@ class OpenAIModel(BaseModel):
         except Exception as e:
             logging.error(f"Error generating with tools using OpenAI: {e}")
             return {
-                "content": f"Error: {str(e)}",
+                "content": f"{ERROR_ANSWER_PREFIX}{str(e)}",
                 "tool_calls": []
             }
     
@@ -0,0 +1,334 @@
+"""
+Bulk vision processing module for the seeker-o1 framework.
+
+Runs OCR and captioning over a directory or glob of images on a process pool
+and streams one JSON line per image, so large batches of scanned documents
+can be pre-processed and resumed after an interruption.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterator, Optional, Set, Tuple
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".tif", ".tiff", ".webp")
+
+# Per-process state of a bulk worker; populated by _init_worker.
+_worker_state: Dict[str, Any] = {}
+
+def iter_image_paths(source: str) -> Iterator[str]:
+    """
+    Expand a directory or glob pattern into image paths.
+
+    Args:
+        source: A directory (searched recursively) or a glob pattern.
+
+    Yields:
+        Image file paths in sorted order.
+    """
+    if os.path.isdir(source):
+        pattern = os.path.join(source, "**", "*")
+    else:
+        pattern = source
+
+    for path in sorted(glob.iglob(pattern, recursive=True)):
+        if os.path.isfile(path) and path.lower().endswith(IMAGE_EXTENSIONS):
+            yield path
+
+def load_completed_paths(output_path: str) -> Set[str]:
+    """
+    Read the paths already recorded in a JSONL output file.
+
+    A partially written last line (from an interrupted run) is ignored, so
+    that image is processed again.
+
+    Args:
+        output_path: Path to the JSONL output file.
+
+    Returns:
+        The set of image paths with a complete record.
+    """
+    completed: Set[str] = set()
+    if not os.path.exists(output_path):
+        return completed
+
+    with open(output_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if "path" in record and "error" not in record:
+                completed.add(record["path"])
+    return completed
+
+def bulk_process(
+    source: str,
+    output_path: str,
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    resume: bool = True,
+    caption: bool = True,
+    vision_config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run OCR and captioning over many images on a process pool.
+
+    Each worker process loads the vision model once. At most max_in_flight
+    images are queued at a time, so memory stays bounded however many images
+    the source expands to. Records are appended to the output file as soon as
+    each image finishes. If a worker process dies, the images it had in
+    flight are recorded as failed, so a resumed run retries them, and the
+    pool is restarted.
+
+    Args:
+        source: A directory (searched recursively) or a glob pattern.
+        output_path: Path of the JSONL file to append records to.
+        workers: Number of worker processes. Defaults to half the CPU count.
+        max_in_flight: Maximum number of queued images. Defaults to twice the worker count.
+        resume: Whether to skip images already recorded in the output file.
+        caption: Whether to caption images that have no usable OCR text.
+        vision_config: The 'vision' configuration section (model, cache and pipeline options).
+
+    Returns:
+        A summary with counts of processed, skipped and failed images, the
+        number of pool restarts and the elapsed time.
+    """
+    vision_config = vision_config or {}
+    workers = workers or max(1, (os.cpu_count() or 2) // 2)
+    max_in_flight = max_in_flight or workers * 2
+    start_time = time.time()
+
+    completed = load_completed_paths(output_path) if resume else set()
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    summary = {"processed": 0, "skipped": 0, "failed": 0, "restarts": 0, "workers": workers}
+    # Spawned workers start clean even if this process has already loaded torch
+    context = multiprocessing.get_context("spawn")
+
+    def start_pool() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(vision_config, caption, workers)
+        )
+
+    executor = start_pool()
+    # Each future's image and the pool it was submitted to
+    pending: Dict[Future, Tuple[str, ProcessPoolExecutor]] = {}
+
+    def restart_pool() -> None:
+        nonlocal executor
+        logger.warning("A bulk vision worker died; restarting the worker pool")
+        executor.shutdown(wait=False, cancel_futures=True)
+        executor = start_pool()
+        summary["restarts"] += 1
+
+    def submit(path: str) -> None:
+        try:
+            future = executor.submit(_process_image, path)
+        except BrokenProcessPool:
+            restart_pool()
+            future = executor.submit(_process_image, path)
+        pending[future] = (path, executor)
+
+    try:
+        with open(output_path, "a", encoding="utf-8") as output:
+
+            def drain() -> None:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                broken = False
+                for future in done:
+                    path, pool = pending.pop(future)
+                    try:
+                        record = future.result()
+                    except BrokenProcessPool as e:
+                        # Only the pool still in use needs restarting
+                        broken = broken or pool is executor
+                        record = {"path": path, "error": f"Worker process died: {e}"}
+                    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    output.flush()
+                    if "error" in record:
+                        summary["failed"] += 1
+                    else:
+                        summary["processed"] += 1
+                if broken:
+                    restart_pool()
+
+            for path in iter_image_paths(source):
+                if path in completed:
+                    summary["skipped"] += 1
+                    continue
+                if len(pending) >= max_in_flight:
+                    drain()
+                submit(path)
+
+            while pending:
+                drain()
+    finally:
+        executor.shutdown()
+
+    summary["elapsed"] = time.time() - start_time
+    logger.info(
+        f"Bulk vision run finished: {summary['processed']} processed, "
+        f"{summary['skipped']} skipped, {summary['failed']} failed in {summary['elapsed']:.1f}s"
+    )
+    return summary
+
+def _init_worker(vision_config: Dict[str, Any], caption: bool, workers: int) -> None:
+    """
+    Set up a worker process.
+
+    The vision model is created on first use, so OCR-only batches never load BLIP.
+
+    Args:
+        vision_config: The 'vision' configuration section.
+        caption: Whether captioning is enabled.
+        workers: Total number of workers, used to split CPU threads between them.
+    """
+    model_config = dict(vision_config.get("model", {}))
+    inference = dict(model_config.get("inference") or {})
+    if not inference.get("num_threads"):
+        # Avoid oversubscription: every worker would otherwise use all cores
+        inference["num_threads"] = max(1, (os.cpu_count() or 1) // workers)
+    model_config["inference"] = inference
+    # OCR already runs one image per process here
+    model_config["ocr_workers"] = 1
+
+    _worker_state.clear()
+    _worker_state.update({
+        "model_config": model_config,
+        "cache_config": vision_config.get("cache", {}),
+        "min_text_length": vision_config.get("pipeline", {}).get("min_text_length", 3),
+        "caption": caption,
+        "vision_model": None,
+        "vision_cache": None,
+    })
+
+def _get_worker_vision_model():
+    """
+    Get this worker's vision model, loading it on first use.
+
+    Returns:
+        The worker's VisionModel instance.
+    """
+    if _worker_state["vision_model"] is None:
+        from seeker_o1.models.vision_model import VisionModel
+        _worker_state["vision_model"] = VisionModel(**_worker_state["model_config"])
+    return _worker_state["vision_model"]
+
+def _get_worker_vision_cache():
+    """
+    Get this worker's vision cache, if caching is enabled.
+
+    Returns:
+        A VisionCache instance, or None.
+    """
+    cache_config = _worker_state["cache_config"]
+    if not cache_config.get("enabled", True):
+        return None
+    if _worker_state["vision_cache"] is None:
+        from seeker_o1.models.vision_cache import VisionCache
+        _worker_state["vision_cache"] = VisionCache(
+            storage_path=cache_config.get("storage_path"),
+            perceptual_hash=cache_config.get("perceptual_hash", False),
+            max_distance=cache_config.get("max_distance", 4)
+        )
+    return _worker_state["vision_cache"]
+
+def _lookup_cached(cache, path: str) -> Optional[Dict[str, Any]]:
+    """
+    Look an image up in the worker's cache, treating cache errors as a miss.
+
+    Args:
+        cache: The worker's VisionCache.
+        path: Path to the image file.
+
+    Returns:
+        The cached entry, or None.
+    """
+    try:
+        return cache.lookup(path)
+    except Exception as e:
+        # Workers share one SQLite file and may find it locked
+        logger.warning(f"Vision cache lookup failed for {path}: {e}")
+        return None
+
+def _store_cached(cache, path: str, **kwargs) -> None:
+    """
+    Store an image's result in the worker's cache, logging any error.
+
+    The result is already computed, so a failed cache write must not turn it
+    into a failure.
+
+    Args:
+        cache: The worker's VisionCache.
+        path: Path to the image file.
+        **kwargs: The text and caption to store.
+    """
+    try:
+        cache.store(path, **kwargs)
+    except Exception as e:
+        logger.warning(f"Could not cache the vision result for {path}: {e}")
+
+def _process_image(path: str) -> Dict[str, Any]:
+    """
+    Run OCR, and captioning if needed, on one image inside a worker.
+
+    Args:
+        path: Path to the image file.
+
+    Returns:
+        The JSONL record for the image.
+    """
+    from seeker_o1.models.image_preprocessing import DecodedImage
+    from seeker_o1.models.vision_cache import VisionCache
+    from seeker_o1.models.vision_model import _ocr_image
+
+    start_time = time.time()
+    timings: Dict[str, float] = {}
+    record: Dict[str, Any] = {"path": path}
+
+    try:
+        record["hash"] = VisionCache.content_hash(path)
+        cache = _get_worker_vision_cache()
+        cached = _lookup_cached(cache, path) if cache else None
+        text = cached.get("text") if cached else None
+        caption = cached.get("caption") if cached else None
+        record["cached"] = cached is not None
+
+        decoded = DecodedImage(path)
+        if text is None:
+            stage_start = time.time()
+            binarize = _worker_state["model_config"].get("ocr_binarize", False)
+            text = _ocr_image(decoded, binarize=binarize)
+            timings["ocr"] = time.time() - stage_start
+
+        usable = len("".join(text.split())) >= _worker_state["min_text_length"]
+        if not usable and caption is None and _worker_state["caption"]:
+            stage_start = time.time()
+            caption = _get_worker_vision_model().describe_image(decoded)
+            timings["caption"] = time.time() - stage_start
+
+        record["text"] = text
+        record["caption"] = caption
+    except Exception as e:
+        logger.error(f"Bulk vision processing failed for {path}: {e}")
+        record["error"] = str(e)
+    else:
+        if cache and (not cached or "ocr" in timings or "caption" in timings):
+            _store_cached(cache, path, text=text if usable else "", caption=caption)
+
+    timings["total"] = time.time() - start_time
+    record["timings"] = timings
+    return record
@@ -0,0 +1,266 @@
+"""
+Vision cache module for the seeker-o1 framework.
+
+Stores OCR text and image captions keyed by image content so that repeated
+images do not go through Tesseract or BLIP again.
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class VisionCache:
+    """
+    Persistent cache for vision results.
+
+    Entries are keyed by the SHA-256 of the image bytes. When perceptual
+    hashing is enabled, a 64-bit difference hash is stored alongside each entry
+    so that near-duplicate images (re-encoded screenshots, resized photos) can
+    also be served from the cache.
+    """
+
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        perceptual_hash: bool = False,
+        max_distance: int = 4,
+        **kwargs
+    ):
+        """
+        Initialize a VisionCache instance.
+
+        Args:
+            storage_path: Path of the SQLite database file. If None, uses a default location.
+            perceptual_hash: Whether to match near-duplicate images by perceptual hash.
+            max_distance: Maximum Hamming distance between perceptual hashes for a match.
+            **kwargs: Additional configuration options.
+        """
+        if storage_path is None:
+            home_dir = os.path.expanduser("~")
+            storage_path = os.path.join(home_dir, ".seeker-o1", "vision_cache.db")
+
+        self.storage_path = storage_path
+        self.perceptual_hash = perceptual_hash
+        self.max_distance = max_distance
+        self.config = kwargs
+        # Lookups run on the vision pipeline's worker threads
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(self.storage_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS vision_cache ("
+                "content_hash TEXT PRIMARY KEY, "
+                "phash TEXT, "
+                "text TEXT, "
+                "caption TEXT, "
+                "created_at REAL, "
+                "updated_at REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_vision_cache_phash ON vision_cache (phash)")
+
+    def lookup(self, image_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up cached vision results for an image.
+
+        Args:
+            image_path: Path to the image file.
+
+        Returns:
+            A dictionary with "content_hash", "text" and "caption" keys, or None on a miss.
+            "text" is an empty string when OCR previously found nothing, and None
+            when OCR has not been run for this image.
+        """
+        content_hash = self.content_hash(image_path)
+
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT content_hash, text, caption FROM vision_cache WHERE content_hash = ?",
+                (content_hash,)
+            ).fetchone()
+
+            if row is None and self.perceptual_hash:
+                row = self._lookup_near_duplicate(conn, image_path)
+
+        if row is None:
+            with self._stats_lock:
+                self.misses += 1
+            return None
+
+        with self._stats_lock:
+            self.hits += 1
+        logger.debug(f"Vision cache hit for {image_path}")
+        return {"content_hash": row[0], "text": row[1], "caption": row[2]}
+
+    def store(self, image_path: str, text: Optional[str] = None, caption: Optional[str] = None) -> str:
+        """
+        Store vision results for an image.
+
+        Existing values are kept for any field passed as None, so OCR text and
+        captions can be added independently.
+
+        Args:
+            image_path: Path to the image file.
+            text: OCR text extracted from the image.
+            caption: Caption generated for the image.
+
+        Returns:
+            The content hash used as the cache key.
+        """
+        content_hash = self.content_hash(image_path)
+        phash = None
+        if self.perceptual_hash:
+            try:
+                phash = self.difference_hash(image_path)
+            except Exception as e:
+                logger.debug(f"Could not compute perceptual hash for {image_path}: {e}")
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO vision_cache (content_hash, phash, text, caption, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(content_hash) DO UPDATE SET "
+                "phash = COALESCE(excluded.phash, phash), "
+                "text = COALESCE(excluded.text, text), "
+                "caption = COALESCE(excluded.caption, caption), "
+                "updated_at = excluded.updated_at",
+                (content_hash, phash, text, caption, now, now)
+            )
+
+        return content_hash
+
+    def clear(self) -> None:
+        """
+        Remove all cached entries.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM vision_cache")
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the cache.
+
+        Returns:
+            A dictionary containing cache statistics.
+        """
+        with self._connect() as conn:
+            entry_count = conn.execute("SELECT COUNT(*) FROM vision_cache").fetchone()[0]
+
+        with self._stats_lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "storage_path": self.storage_path,
+            "perceptual_hash": self.perceptual_hash,
+            "entry_count": entry_count,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0
+        }
+
+    @staticmethod
+    def content_hash(image_path: str) -> str:
+        """
+        Compute the SHA-256 hash of an image file's bytes.
+
+        Args:
+            image_path: Path to the image file.
+
+        Returns:
+            The hex digest of the file contents.
+        """
+        digest = hashlib.sha256()
+        with open(image_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def difference_hash(image_path: str, hash_size: int = 8) -> str:
+        """
+        Compute a difference hash (dHash) of an image.
+
+        The image is reduced to a (hash_size + 1) x hash_size grayscale thumbnail
+        and each bit records whether a pixel is brighter than its right neighbour.
+
+        Args:
+            image_path: Path to the image file.
+            hash_size: Number of bits per row of the hash.
+
+        Returns:
+            The hash as a hex string.
+        """
+        import numpy as np
+        from PIL import Image
+
+        with Image.open(image_path) as image:
+            image.draft("L", (hash_size * 8, hash_size * 8))
+            pixels = np.asarray(image.convert("L").resize((hash_size + 1, hash_size)), dtype=np.int16)
+
+        value = 0
+        for bit in (pixels[:, :-1] > pixels[:, 1:]).flat:
+            value = (value << 1) | int(bit)
+
+        return f"{value:0{hash_size * hash_size // 4}x}"
+
+    def _lookup_near_duplicate(self, conn: sqlite3.Connection, image_path: str) -> Optional[tuple]:
+        """
+        Find the closest cached entry by perceptual hash.
+
+        Args:
+            conn: An open database connection.
+            image_path: Path to the image file.
+
+        Returns:
+            The matching (content_hash, text, caption) row, or None.
+        """
+        try:
+            target = int(self.difference_hash(image_path), 16)
+        except Exception as e:
+            logger.debug(f"Could not compute perceptual hash for {image_path}: {e}")
+            return None
+
+        best_row = None
+        best_distance = self.max_distance + 1
+        for content_hash, phash, text, caption in conn.execute(
+            "SELECT content_hash, phash, text, caption FROM vision_cache WHERE phash IS NOT NULL"
+        ):
+            distance = bin(target ^ int(phash, 16)).count("1")
+            if distance < best_distance:
+                best_distance = distance
+                best_row = (content_hash, text, caption)
+
+        if best_row is not None:
+            logger.debug(f"Vision cache near-duplicate match at distance {best_distance}")
+        return best_row
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Open a connection to the cache database for a single transaction.
+
+        Yields:
+            A SQLite connection that is committed and closed on exit.
+        """
+        conn = sqlite3.connect(self.storage_path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
@@ -1,14 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor
+import logging
+import os
 from seeker_o1.models.base.base_model import BaseModel
+from seeker_o1.models.image_preprocessing import DecodedImage, CAPTION_SIZE
 from PIL import Image
-from transformers import BlipProcessor, BlipForConditionalGeneration
-import torch
-import pytesseract
+
+# torch, transformers and pytesseract are imported on first use so that
+# importing this module (or running OCR in a worker process) stays cheap.
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INFERENCE_PROFILE = {
+    "inference_mode": True,
+    "num_threads": None,
+    "quantize": False,
+    "backend": "eager",
+}
+
+def _ocr_image(image, binarize=False):
+    # Module-level so it can be pickled into OCR worker processes
+    import pytesseract
+    decoded = image if isinstance(image, DecodedImage) else DecodedImage(image)
+    return pytesseract.image_to_string(decoded.for_ocr(binarize=binarize)).strip()
 
 class VisionModel(BaseModel):
-    def __init__(self, model_name="BLIP", **kwargs):
+    def __init__(self, model_name="BLIP", batch_size=8, ocr_workers=None, inference=None, ocr_binarize=False, **kwargs):
         super().__init__(model_name, **kwargs)
+        self.batch_size = batch_size
+        self.ocr_binarize = ocr_binarize
+        self.ocr_workers = ocr_workers or os.cpu_count() or 1
+        self._ocr_pool = None
+        self.inference = {**DEFAULT_INFERENCE_PROFILE, **(inference or {})}
+        from transformers import BlipProcessor, BlipForConditionalGeneration
         self.processor = BlipProcessor.from_pretrained("Salesforce/blip-image-captioning-base")
         self.model = BlipForConditionalGeneration.from_pretrained("Salesforce/blip-image-captioning-base")
+        self.model.eval()
+        self._apply_inference_profile()
+    def _apply_inference_profile(self):
+        import torch
+        from seeker_o1.models.vision_runtime import VisionEncoderForTrace, TracedVisionEncoder
+        if self.inference["num_threads"]:
+            torch.set_num_threads(int(self.inference["num_threads"]))
+        if self.inference["quantize"]:
+            # Dynamic int8 quantisation of every nn.Linear; weights are quantised once, activations per call
+            self.model = torch.ao.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+        backend = self.inference["backend"]
+        if backend == "torchscript":
+            image_size = self.model.config.vision_config.image_size
+            example = torch.zeros(1, 3, image_size, image_size)
+            try:
+                with torch.no_grad():
+                    traced = torch.jit.trace(VisionEncoderForTrace(self.model.vision_model), example, check_trace=False)
+                self.model.vision_model = TracedVisionEncoder(torch.jit.freeze(traced.eval()))
+            except Exception as e:
+                logger.warning(f"TorchScript export of the vision encoder failed, using eager mode: {e}")
+        elif backend != "eager":
+            logger.warning(f"Unknown vision inference backend '{backend}', using eager mode")
+    def _inference_context(self):
+        import torch
+        return torch.inference_mode() if self.inference["inference_mode"] else torch.no_grad()
     def generate(self, prompt, system_message=None, temperature=None, max_tokens=None, **kwargs):
         return "VisionModel does not support text generation."
     def generate_with_tools(self, prompt, tools, system_message=None, temperature=None, max_tokens=None, **kwargs):
@@ -18,16 +68,61 @@ class VisionModel(BaseModel):
     def get_embedding(self, text, **kwargs):
         return []
     def analyze_image(self, image_path):
-        image = Image.open(image_path)
-        return {"size": image.size, "mode": image.mode}
-    def describe_image(self, image_path):
-        image = Image.open(image_path).convert("RGB")
+        with Image.open(image_path) as image:
+            return {"size": image.size, "mode": image.mode}
+    def describe_image(self, image_path, stop_event=None):
+        image = self._caption_input(image_path)
         inputs = self.processor(image, return_tensors="pt")
-        with torch.no_grad():
-            out = self.model.generate(**inputs)
+        generate_kwargs = {}
+        if stop_event is not None:
+            from transformers import StoppingCriteriaList
+            from seeker_o1.models.vision_runtime import EventStoppingCriteria
+            generate_kwargs["stopping_criteria"] = StoppingCriteriaList([EventStoppingCriteria(stop_event)])
+        with self._inference_context():
+            out = self.model.generate(**inputs, **generate_kwargs)
         caption = self.processor.decode(out[0], skip_special_tokens=True)
         return caption
+    def describe_images(self, image_paths, batch_size=None):
+        # Captions come back in input order; an image that cannot be captioned gets ""
+        batch_size = batch_size or self.batch_size
+        captions = []
+        for start in range(0, len(image_paths), batch_size):
+            paths = image_paths[start:start + batch_size]
+            try:
+                batch = [self._caption_input(path) for path in paths]
+                inputs = self.processor(images=batch, return_tensors="pt")
+                with self._inference_context():
+                    out = self.model.generate(**inputs)
+                captions.extend(self.processor.batch_decode(out, skip_special_tokens=True))
+            except Exception as e:
+                logger.warning(f"Captioning a batch of {len(paths)} images failed, captioning them one by one: {e}")
+                captions.extend(self._describe_or_empty(path) for path in paths)
+        return captions
     def read_text(self, image_path):
-        image = Image.open(image_path)
-        text = pytesseract.image_to_string(image)
-        return text.strip() 
\ No newline at end of file
+        return _ocr_image(image_path, binarize=self.ocr_binarize)
+    def read_texts(self, image_paths):
+        # Texts come back in input order; an image that cannot be read gets ""
+        if len(image_paths) <= 1 or self.ocr_workers <= 1:
+            return [self._result_or_empty("OCR", path, self.read_text, path) for path in image_paths]
+        if self._ocr_pool is None:
+            self._ocr_pool = ProcessPoolExecutor(max_workers=self.ocr_workers)
+        futures = [self._ocr_pool.submit(_ocr_image, path, self.ocr_binarize) for path in image_paths]
+        return [self._result_or_empty("OCR", path, future.result) for path, future in zip(image_paths, futures)]
+    def _describe_or_empty(self, image_path):
+        return self._result_or_empty("Captioning", image_path, self.describe_image, image_path)
+    @staticmethod
+    def _result_or_empty(stage, image_path, func, *args):
+        try:
+            return func(*args)
+        except Exception as e:
+            logger.warning(f"{stage} failed for {getattr(image_path, 'source', image_path)}: {e}")
+            return ""
+    @staticmethod
+    def _caption_input(image):
+        # Paths are decoded straight at caption resolution; shared decodes are reused as-is
+        decoded = image if isinstance(image, DecodedImage) else DecodedImage(image, max_side=CAPTION_SIZE)
+        return decoded.for_caption()
+    def close(self):
+        if self._ocr_pool is not None:
+            self._ocr_pool.shutdown(wait=False, cancel_futures=True)
+            self._ocr_pool = None 
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Vision pipeline module for the seeker-o1 framework.
+
+Runs OCR and image captioning concurrently and picks whichever result is
+usable first.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+import logging
+import threading
+import time
+
+from seeker_o1.models.image_preprocessing import DecodedImage, load_image, OCR_MAX_SIDE, CAPTION_SIZE
+
+logger = logging.getLogger(__name__)
+
+class VisionPipeline:
+    """
+    Concurrent OCR and captioning for a single image.
+
+    The image is decoded once and shared by both stages. Captioning starts on
+    a worker thread and OCR runs next to it, unless a cheap pre-check decides
+    the image has no text. As soon as OCR
+    yields usable text the caption generation is cancelled; otherwise the
+    caption is returned.
+    """
+
+    def __init__(
+        self,
+        vision_model,
+        max_workers: int = 2,
+        min_text_length: int = 3,
+        text_precheck: bool = True,
+        **kwargs
+    ):
+        """
+        Initialize a VisionPipeline instance.
+
+        Args:
+            vision_model: The VisionModel used for OCR and captioning.
+            max_workers: Number of worker threads shared by OCR and captioning.
+            min_text_length: Minimum number of non-space characters for OCR text to count as usable.
+            text_precheck: Whether to skip OCR for images that appear to contain no text.
+            **kwargs: Additional configuration options.
+        """
+        self.vision_model = vision_model
+        self.min_text_length = min_text_length
+        self.text_precheck = text_precheck
+        self.config = kwargs
+        self._executor = ThreadPoolExecutor(max_workers=max(2, max_workers), thread_name_prefix="vision")
+
+    def run(self, image_path: str) -> Dict[str, Any]:
+        """
+        Extract text or a caption from an image.
+
+        Args:
+            image_path: Path to the image file.
+
+        Returns:
+            A dictionary with "text" (None if OCR was skipped), "caption"
+            (None if it was cancelled), "source" ("ocr" or "caption") and
+            per-stage "timings" in seconds.
+        """
+        start_time = time.time()
+        timings: Dict[str, float] = {}
+        stop_event = threading.Event()
+
+        run_ocr = not self.text_precheck or self.has_text(image_path)
+        if not run_ocr:
+            logger.debug(f"No text detected in {image_path}; skipping OCR")
+        timings["precheck"] = time.time() - start_time
+
+        # Decode once, at the resolution of the most demanding consumer
+        decoded = DecodedImage(image_path, max_side=OCR_MAX_SIDE if run_ocr else CAPTION_SIZE)
+
+        # Workers return their timings, so only this thread writes the dict
+        caption_future = self._executor.submit(self._timed, self.vision_model.describe_image, decoded,
+                                               stop_event=stop_event)
+
+        text = None
+        if run_ocr:
+            ocr_future = self._executor.submit(self._timed, self.vision_model.read_text, decoded)
+            text, timings["ocr"] = ocr_future.result()
+
+        if self.is_usable_text(text):
+            stop_event.set()
+            caption_future.cancel()
+            timings["total"] = time.time() - start_time
+            return {"text": text, "caption": None, "source": "ocr", "timings": timings}
+
+        caption, timings["caption"] = caption_future.result()
+        timings["total"] = time.time() - start_time
+        return {"text": text, "caption": caption, "source": "caption", "timings": timings}
+
+    def is_usable_text(self, text: Optional[str]) -> bool:
+        """
+        Check whether OCR output is good enough to use instead of a caption.
+
+        Args:
+            text: The OCR output.
+
+        Returns:
+            True if the text has enough non-space characters.
+        """
+        if not text:
+            return False
+        return len("".join(text.split())) >= self.min_text_length
+
+    @staticmethod
+    def has_text(image_path: str, edge_threshold: int = 96, min_edge_ratio: float = 0.01) -> bool:
+        """
+        Cheaply estimate whether an image contains text.
+
+        The image is decoded at low resolution and run through an edge filter.
+        Printed or handwritten text produces many sharp edges, while photos of
+        smooth scenes and plain graphics produce few. The check is deliberately
+        permissive: a false positive only costs an OCR call.
+
+        Args:
+            image_path: Path to the image file.
+            edge_threshold: Gray level above which a filtered pixel counts as an edge.
+            min_edge_ratio: Minimum fraction of edge pixels for the image to count as text.
+
+        Returns:
+            True if the image may contain text.
+        """
+        from PIL import ImageFilter
+
+        try:
+            edges = load_image(image_path, max_side=256).convert("L").filter(ImageFilter.FIND_EDGES)
+        except Exception as e:
+            logger.debug(f"Text pre-check failed for {image_path}: {e}")
+            return True
+
+        # The filter marks the outermost pixels as edges on any image
+        if edges.width > 2 and edges.height > 2:
+            edges = edges.crop((1, 1, edges.width - 1, edges.height - 1))
+        histogram = edges.histogram()
+        edge_pixels = sum(histogram[edge_threshold:])
+        total_pixels = max(1, edges.width * edges.height)
+        return edge_pixels / total_pixels >= min_edge_ratio
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker threads.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _timed(func, *args, **kwargs) -> Tuple[Any, float]:
+        """
+        Call a function and measure how long it took.
+
+        Args:
+            func: The function to call.
+            *args: Positional arguments for the function.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            The function's return value and the elapsed seconds.
+        """
+        start_time = time.time()
+        result = func(*args, **kwargs)
+        return result, time.time() - start_time
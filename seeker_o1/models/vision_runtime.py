@@ -0,0 +1,44 @@
+"""
+Torch-side helpers for the vision model.
+
+Kept apart from vision_model so that importing the vision model, or running
+OCR in worker processes, does not pull in torch and transformers.
+"""
+
+import torch
+from transformers import StoppingCriteria
+
+class EventStoppingCriteria(StoppingCriteria):
+    """
+    Stops generation as soon as a threading.Event is set.
+    """
+
+    def __init__(self, stop_event):
+        self.stop_event = stop_event
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return torch.full((input_ids.shape[0],), self.stop_event.is_set(), dtype=torch.bool, device=input_ids.device)
+
+class VisionEncoderForTrace(torch.nn.Module):
+    """
+    Exposes the BLIP vision encoder as a tensor-in, tensor-out module for torch.jit.trace.
+    """
+
+    def __init__(self, vision_model):
+        super().__init__()
+        self.vision_model = vision_model
+
+    def forward(self, pixel_values):
+        return self.vision_model(pixel_values=pixel_values)[0]
+
+class TracedVisionEncoder(torch.nn.Module):
+    """
+    Drop-in replacement for model.vision_model; generate() only reads output[0].
+    """
+
+    def __init__(self, traced):
+        super().__init__()
+        self.traced = traced
+
+    def forward(self, pixel_values, **kwargs):
+        return (self.traced(pixel_values),)
@@ -0,0 +1,541 @@
+"""
+Vision worker module for the seeker-o1 framework.
+
+Runs the vision model in a standalone process that any number of orchestrator
+processes on the same node can share, so the BLIP weights are loaded once per
+node instead of once per orchestrator. Requests from all clients are batched
+inside the worker.
+
+Start the worker with:
+    SEEKER_O1_VISION_AUTHKEY=<secret> python -m seeker_o1.models.vision_server --address 127.0.0.1:6010
+
+Requests are pickled, so the worker and its clients only talk after proving
+they share the same secret key; neither side starts without one.
+"""
+
+from concurrent.futures import Future, wait
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Dict, List, Optional, Tuple, Union
+import argparse
+import io
+import itertools
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ADDRESS = "127.0.0.1:6010"
+AUTHKEY_ENV = "SEEKER_O1_VISION_AUTHKEY"
+
+# Operations the worker batches, mapped to the batched VisionModel method
+BATCHED_OPERATIONS = {
+    "caption": "describe_images",
+    "ocr": "read_texts",
+}
+
+def parse_address(address: Union[str, Tuple[str, int]]) -> Union[str, Tuple[str, int]]:
+    """
+    Parse a worker address.
+
+    Args:
+        address: "host:port" for a TCP socket, a filesystem path for a Unix
+            socket, or an already parsed (host, port) tuple.
+
+    Returns:
+        An address accepted by multiprocessing.connection.
+    """
+    if isinstance(address, (tuple, list)):
+        return (address[0], int(address[1]))
+    host, _, port = address.rpartition(":")
+    if host and port.isdigit() and os.sep not in address:
+        return (host, int(port))
+    return address
+
+def resolve_authkey(authkey: Optional[Union[str, bytes]] = None) -> bytes:
+    """
+    Resolve the shared secret used to authenticate clients.
+
+    Args:
+        authkey: Explicit key. If None, reads SEEKER_O1_VISION_AUTHKEY.
+
+    Returns:
+        The key as bytes.
+
+    Raises:
+        ValueError: If no key is given and the variable is not set.
+    """
+    if authkey is None:
+        authkey = os.getenv(AUTHKEY_ENV)
+    if not authkey:
+        raise ValueError(
+            f"The vision worker needs a shared secret: set {AUTHKEY_ENV} or vision.worker.authkey"
+        )
+    return authkey.encode("utf-8") if isinstance(authkey, str) else authkey
+
+def _encode_image(image) -> Union[str, bytes]:
+    """
+    Turn an image argument into something that can be sent to the worker.
+
+    Paths are sent as absolute paths, since the worker runs on the same node
+    but not in the caller's working directory. In-memory images are sent as
+    PNG bytes.
+
+    Args:
+        image: A path, a DecodedImage or a PIL image.
+
+    Returns:
+        A path or PNG bytes.
+    """
+    source = getattr(image, "source", image)
+    if isinstance(source, str):
+        return os.path.abspath(source)
+    buffer = io.BytesIO()
+    source.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+def _decode_image(payload: Union[str, bytes]):
+    """
+    Turn a request payload back into an image argument for VisionModel.
+
+    Args:
+        payload: A path or PNG bytes.
+
+    Returns:
+        A path or a PIL image.
+    """
+    if isinstance(payload, str):
+        return payload
+    from PIL import Image
+    return Image.open(io.BytesIO(payload))
+
+class _Batcher:
+    """
+    Collects requests for one operation and runs them through the model in batches.
+    """
+
+    def __init__(self, operation: str, method, batch_window: float, max_batch: int):
+        """
+        Initialize a _Batcher instance.
+
+        Args:
+            operation: Name of the operation, used in logs and stats.
+            method: Batched model method taking a list of images.
+            batch_window: Seconds to wait for more requests after the first one arrives.
+            max_batch: Maximum number of requests per batch.
+        """
+        self.operation = operation
+        self.method = method
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.requests: "queue.Queue" = queue.Queue()
+        self.stats = {"requests": 0, "batches": 0}
+        self._thread = threading.Thread(target=self._run, name=f"vision-{operation}", daemon=True)
+        self._thread.start()
+
+    def submit(self, image, reply) -> None:
+        """
+        Queue a request.
+
+        Args:
+            image: The decoded request payload.
+            reply: Callable receiving (result, error) when the request completes.
+        """
+        self.requests.put((image, reply))
+
+    def _run(self) -> None:
+        """
+        Batching loop: wait for a request, gather more for up to batch_window, run them together.
+        """
+        while True:
+            batch = [self.requests.get()]
+            deadline = time.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            images = [image for image, _ in batch]
+            self.stats["requests"] += len(batch)
+            self.stats["batches"] += 1
+            try:
+                results = self.method(images)
+            except Exception as e:
+                logger.error(f"Vision worker {self.operation} batch of {len(batch)} failed: {e}")
+                for _, reply in batch:
+                    reply(None, str(e))
+                continue
+            for (_, reply), result in zip(batch, results):
+                reply(result, None)
+
+class VisionServer:
+    """
+    A standalone process holding one vision model for all clients on a node.
+
+    Each client connection gets a reader thread. Caption and OCR requests from
+    all connections go to one batcher per operation, so concurrent requests
+    share a single describe_images or read_texts call.
+    """
+
+    def __init__(
+        self,
+        address: Union[str, Tuple[str, int]] = DEFAULT_ADDRESS,
+        authkey: Optional[Union[str, bytes]] = None,
+        batch_window: float = 0.02,
+        max_batch: int = 16,
+        vision_model=None,
+        **kwargs
+    ):
+        """
+        Initialize a VisionServer instance.
+
+        Args:
+            address: "host:port" or a Unix socket path to listen on.
+            authkey: Shared secret clients must present. Defaults to SEEKER_O1_VISION_AUTHKEY.
+            batch_window: Seconds to wait for more requests before running a batch.
+            max_batch: Maximum number of requests per batch.
+            vision_model: An already loaded model. If None, a VisionModel is created from kwargs.
+            **kwargs: VisionModel options (batch_size, ocr_workers, inference, ocr_binarize).
+
+        Raises:
+            ValueError: If no authkey is given or set in the environment.
+        """
+        self.address = parse_address(address)
+        self.authkey = resolve_authkey(authkey)
+        self.config = kwargs
+        if vision_model is None:
+            from seeker_o1.models.vision_model import VisionModel
+            vision_model = VisionModel(**kwargs)
+        self.vision_model = vision_model
+        self.batchers = {
+            operation: _Batcher(operation, getattr(vision_model, method), batch_window, max_batch)
+            for operation, method in BATCHED_OPERATIONS.items()
+        }
+        self._listener: Optional[Listener] = None
+        self._stopped = threading.Event()
+
+    def serve_forever(self) -> None:
+        """
+        Accept client connections until close() is called.
+        """
+        self._listener = Listener(self.address, authkey=self.authkey)
+        logger.info(f"Vision worker listening on {self._listener.address}")
+        while not self._stopped.is_set():
+            try:
+                conn = self._listener.accept()
+            except OSError:
+                if self._stopped.is_set():
+                    break
+                raise
+            except Exception as e:
+                # Failed handshakes (wrong authkey, port scanners) must not stop the worker
+                logger.warning(f"Rejected vision client: {e}")
+                continue
+            threading.Thread(target=self._handle_connection, args=(conn,), daemon=True).start()
+
+    def close(self) -> None:
+        """
+        Stop accepting connections.
+        """
+        self._stopped.set()
+        if self._listener is not None:
+            self._listener.close()
+        close_model = getattr(self.vision_model, "close", None)
+        if close_model:
+            close_model()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get request and batch counts per operation.
+
+        Returns:
+            A dictionary of stats per operation, including the mean batch size.
+        """
+        stats = {}
+        for operation, batcher in self.batchers.items():
+            batches = batcher.stats["batches"]
+            stats[operation] = {
+                **batcher.stats,
+                "mean_batch_size": batcher.stats["requests"] / batches if batches else 0.0,
+            }
+        return stats
+
+    def _handle_connection(self, conn: Connection) -> None:
+        """
+        Read requests from one client and dispatch them to the batchers.
+
+        Args:
+            conn: The client connection.
+        """
+        send_lock = threading.Lock()
+
+        def send(message: Dict[str, Any]) -> None:
+            with send_lock:
+                try:
+                    conn.send(message)
+                except (OSError, EOFError):
+                    pass
+
+        with conn:
+            while True:
+                try:
+                    request = conn.recv()
+                except (EOFError, OSError):
+                    break
+
+                request_id = request.get("id")
+                operation = request.get("op")
+                if operation == "stats":
+                    send({"id": request_id, "result": self.get_stats()})
+                    continue
+                if operation not in self.batchers:
+                    send({"id": request_id, "error": f"Unknown operation: {operation}"})
+                    continue
+
+                def reply(result, error, request_id=request_id) -> None:
+                    if error is None:
+                        send({"id": request_id, "result": result})
+                    else:
+                        send({"id": request_id, "error": error})
+
+                try:
+                    image = _decode_image(request["image"])
+                except Exception as e:
+                    reply(None, f"Invalid image: {e}")
+                    continue
+                self.batchers[operation].submit(image, reply)
+
+class VisionClient:
+    """
+    Client for a VisionServer, usable anywhere a VisionModel is.
+
+    The client is thread-safe: concurrent calls share one connection and are
+    matched to their replies by request id, which lets the worker batch them.
+    """
+
+    def __init__(
+        self,
+        address: Union[str, Tuple[str, int]] = DEFAULT_ADDRESS,
+        authkey: Optional[Union[str, bytes]] = None,
+        timeout: Optional[float] = 120.0,
+        **kwargs
+    ):
+        """
+        Initialize a VisionClient instance and connect to the worker.
+
+        Args:
+            address: "host:port" or a Unix socket path of the worker.
+            authkey: Shared secret of the worker. Defaults to SEEKER_O1_VISION_AUTHKEY.
+            timeout: Seconds to wait for a reply, or None to wait forever.
+            **kwargs: Additional configuration options.
+
+        Raises:
+            ValueError: If no authkey is given or set in the environment.
+            ConnectionError: If the worker cannot be reached.
+        """
+        self.address = parse_address(address)
+        self.authkey = resolve_authkey(authkey)
+        self.timeout = timeout
+        self.config = kwargs
+        self._ids = itertools.count()
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._conn: Optional[Connection] = None
+        self._connect()
+
+    def describe_image(self, image_path, stop_event: Optional[threading.Event] = None) -> str:
+        """
+        Caption an image in the worker.
+
+        Args:
+            image_path: A path, DecodedImage or PIL image.
+            stop_event: If set while waiting, returns an empty caption without waiting for the worker.
+
+        Returns:
+            The caption.
+        """
+        future = self._request("caption", image_path)
+        if stop_event is None:
+            return future.result(timeout=self.timeout)
+
+        deadline = None if self.timeout is None else time.time() + self.timeout
+        while not wait([future], timeout=0.05).done:
+            if stop_event.is_set():
+                return ""
+            if deadline is not None and time.time() > deadline:
+                raise TimeoutError("Vision worker did not reply in time")
+        return future.result()
+
+    def describe_images(self, image_paths: List[Any], batch_size: Optional[int] = None) -> List[str]:
+        """
+        Caption several images in the worker.
+
+        Args:
+            image_paths: Paths, DecodedImages or PIL images.
+            batch_size: Ignored; the worker batches requests itself.
+
+        Returns:
+            The captions, in input order.
+        """
+        futures = [self._request("caption", path) for path in image_paths]
+        return [future.result(timeout=self.timeout) for future in futures]
+
+    def read_text(self, image_path) -> str:
+        """
+        Run OCR on an image in the worker.
+
+        Args:
+            image_path: A path, DecodedImage or PIL image.
+
+        Returns:
+            The extracted text.
+        """
+        return self._request("ocr", image_path).result(timeout=self.timeout)
+
+    def read_texts(self, image_paths: List[Any]) -> List[str]:
+        """
+        Run OCR on several images in the worker.
+
+        Args:
+            image_paths: Paths, DecodedImages or PIL images.
+
+        Returns:
+            The extracted text for each image, in input order.
+        """
+        futures = [self._request("ocr", path) for path in image_paths]
+        return [future.result(timeout=self.timeout) for future in futures]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get the worker's batching stats.
+
+        Returns:
+            A dictionary of stats per operation.
+        """
+        return self._request("stats").result(timeout=self.timeout)
+
+    def close(self) -> None:
+        """
+        Close the connection to the worker.
+        """
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    def _connect(self) -> None:
+        """
+        Open the connection and start the reply reader thread.
+
+        Raises:
+            ConnectionError: If the worker cannot be reached.
+        """
+        try:
+            conn = Client(self.address, authkey=self.authkey)
+        except (OSError, EOFError) as e:
+            raise ConnectionError(f"Cannot reach vision worker at {self.address}: {e}") from e
+        self._conn = conn
+        threading.Thread(target=self._read_replies, args=(conn,), name="vision-client", daemon=True).start()
+
+    def _request(self, operation: str, image=None) -> Future:
+        """
+        Send a request to the worker.
+
+        Args:
+            operation: The operation name.
+            image: The image argument, if the operation takes one.
+
+        Returns:
+            A future resolved with the worker's reply.
+        """
+        future: Future = Future()
+        message: Dict[str, Any] = {"id": next(self._ids), "op": operation}
+        if image is not None:
+            message["image"] = _encode_image(image)
+
+        with self._lock:
+            if self._conn is None:
+                self._connect()
+            self._pending[message["id"]] = future
+            try:
+                self._conn.send(message)
+            except (OSError, EOFError) as e:
+                self._pending.pop(message["id"], None)
+                self._conn = None
+                raise ConnectionError(f"Lost connection to vision worker: {e}") from e
+        return future
+
+    def _read_replies(self, conn: Connection) -> None:
+        """
+        Resolve pending futures with replies from the worker.
+
+        Args:
+            conn: The connection to read from.
+        """
+        while True:
+            try:
+                reply = conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                future = self._pending.pop(reply.get("id"), None)
+            if future is None:
+                continue
+            if "error" in reply:
+                future.set_exception(RuntimeError(f"Vision worker error: {reply['error']}"))
+            else:
+                future.set_result(reply["result"])
+
+        # The connection is gone: fail everything still waiting on it
+        with self._lock:
+            if self._conn is conn:
+                self._conn = None
+            pending, self._pending = self._pending, {}
+        for future in pending.values():
+            future.set_exception(ConnectionError("Lost connection to vision worker"))
+
+def main() -> None:
+    """Run a vision worker from the command line."""
+    parser = argparse.ArgumentParser(description="Seeker-o1 shared vision worker")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS, help="host:port or Unix socket path to listen on")
+    parser.add_argument("--config", default="config.yaml", help="Configuration file with a 'vision' section")
+    parser.add_argument("--batch-window", type=float, help="Seconds to wait for more requests before running a batch")
+    parser.add_argument("--max-batch", type=int, help="Maximum number of requests per batch")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    vision_config: Dict[str, Any] = {}
+    if os.path.exists(args.config):
+        import yaml
+        with open(args.config, "r") as f:
+            vision_config = (yaml.safe_load(f) or {}).get("vision", {})
+    worker_config = vision_config.get("worker", {})
+
+    try:
+        authkey = resolve_authkey(worker_config.get("authkey"))
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = VisionServer(
+        address=args.address,
+        authkey=authkey,
+        batch_window=args.batch_window or worker_config.get("batch_window", 0.02),
+        max_batch=args.max_batch or worker_config.get("max_batch", 16),
+        **vision_config.get("model", {})
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,8 @@ class BaseTool(ABC):
     
     name = "base_tool"
     description = "Base class for all tools"
+    # True if the same input always gives the same result, so it needs no review
+    deterministic = False
     
     def __init__(self, **kwargs):
         """
@@ -50,6 +52,38 @@ class BaseTool(ABC):
         # Base implementation is a pass-through
         return True
     
+    def get_intents(self) -> List[Dict[str, Any]]:
+        """
+        Get the task phrasings this tool handles, for rule-based routing.
+        
+        Each intent is a dictionary with a "pattern" (regex searched for in the
+        lowercased task, so it should be written in lowercase), a "build"
+        callable that turns the pattern's capture groups into the tool's input,
+        and optional "flags" and "priority" (lower is tried first).
+        
+        Returns:
+            A list of intent dictionaries.
+        """
+        # Base implementation declares no intents
+        return []
+    
+    def format_result(self, result: Any) -> Optional[str]:
+        """
+        Render a result of this tool as a final answer, without a model call.
+        
+        Agents answer with this template when every observation of their
+        last step has one, and ask a model otherwise.
+        
+        Args:
+            result: What execute() returned, unwrapped from any ToolResult;
+                for errors, a dictionary with "status" and "error".
+            
+        Returns:
+            The answer text, or None if the tool has no template for the result.
+        """
+        # Base implementation has no template
+        return None
+    
     def get_schema(self) -> Dict[str, Any]:
         """
         Get the tool's parameter schema.
@@ -2,12 +2,14 @@
 Tool Collection module for managing collections of tools.
 """
 
-from typing import Dict, List, Any, Optional, Type, Union
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Type, Union
 import importlib
 import inspect
 import logging
 import os
 import pkgutil
+import threading
 
 from seeker_o1.tools.base.tool import BaseTool
 
@@ -22,14 +24,19 @@ class ToolCollection:
     - Loading tools dynamically
     - Tool discovery
     - Tool execution
+    
+    A frozen collection is read-only and can be shared between agents and
+    threads; use copy() to get a private, writable collection from it.
     """
     
     def __init__(self):
         """
         Initialize a ToolCollection instance.
         """
-        self.tools: Dict[str, BaseTool] = {}
-        self.tool_classes: Dict[str, Type[BaseTool]] = {}
+        self.tools: Mapping[str, BaseTool] = {}
+        self.tool_classes: Mapping[str, Type[BaseTool]] = {}
+        self.frozen = False
+        self._lock = threading.RLock()
     
     def register_tool(self, tool: BaseTool) -> None:
         """
@@ -37,8 +44,13 @@ class ToolCollection:
         
         Args:
             tool: The tool instance to register.
+            
+        Raises:
+            RuntimeError: If the collection is frozen.
         """
-        self.tools[tool.name] = tool
+        with self._lock:
+            self._check_writable()
+            self.tools[tool.name] = tool
         logger.info(f"Registered tool: {tool.name}")
     
     def register_tool_class(self, tool_class: Type[BaseTool]) -> None:
@@ -47,11 +59,73 @@ class ToolCollection:
         
         Args:
             tool_class: The tool class to register.
+            
+        Raises:
+            RuntimeError: If the collection is frozen.
         """
         name = getattr(tool_class, "name", tool_class.__name__.lower())
-        self.tool_classes[name] = tool_class
+        with self._lock:
+            self._check_writable()
+            self.tool_classes[name] = tool_class
         logger.info(f"Registered tool class: {name}")
     
+    def freeze(self) -> "ToolCollection":
+        """
+        Make the collection read-only.
+        
+        Tool classes that are registered but not yet instantiated are
+        instantiated first, so lookups never need to write.
+        
+        Returns:
+            The collection itself.
+        """
+        with self._lock:
+            if self.frozen:
+                return self
+            tools = dict(self.tools)
+            for name, tool_class in self.tool_classes.items():
+                if name not in tools:
+                    try:
+                        tools[name] = tool_class()
+                    except Exception as e:
+                        logger.error(f"Error instantiating tool {name}: {e}")
+            self.tools = MappingProxyType(tools)
+            self.tool_classes = MappingProxyType(dict(self.tool_classes))
+            self.frozen = True
+        return self
+    
+    def snapshot(self) -> "ToolCollection":
+        """
+        Get a frozen copy of the collection that shares its tool instances.
+        
+        Returns:
+            A new, frozen ToolCollection.
+        """
+        return self.copy().freeze()
+    
+    def copy(self) -> "ToolCollection":
+        """
+        Get a writable copy of the collection that shares its tool instances.
+        
+        Returns:
+            A new, unfrozen ToolCollection.
+        """
+        collection = ToolCollection()
+        with self._lock:
+            collection.tools = dict(self.tools)
+            collection.tool_classes = dict(self.tool_classes)
+        return collection
+    
+    def _check_writable(self) -> None:
+        """
+        Raise if the collection is frozen.
+        
+        Raises:
+            RuntimeError: If the collection is frozen.
+        """
+        if self.frozen:
+            raise RuntimeError("Cannot modify a frozen ToolCollection; use copy() for a writable one")
+    
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """
         Get a tool by name.
@@ -63,18 +137,22 @@ class ToolCollection:
             The tool instance, or None if not found.
         """
         # Check if the tool is already instantiated
-        if name in self.tools:
-            return self.tools[name]
+        tool = self.tools.get(name)
+        if tool is not None or self.frozen:
+            return tool
         
         # Check if we have the tool class and can instantiate it
-        if name in self.tool_classes:
-            try:
-                tool = self.tool_classes[name]()
-                self.register_tool(tool)
-                return tool
-            except Exception as e:
-                logger.error(f"Error instantiating tool {name}: {e}")
-                return None
+        with self._lock:
+            if name in self.tools:
+                return self.tools[name]
+            if name in self.tool_classes:
+                try:
+                    tool = self.tool_classes[name]()
+                    self.register_tool(tool)
+                    return tool
+                except Exception as e:
+                    logger.error(f"Error instantiating tool {name}: {e}")
+                    return None
         
         # Tool not found
         return None
@@ -7,7 +7,7 @@ This tool provides safe evaluation of mathematical expressions.
 import logging
 import ast
 import operator
-from typing import Dict, Any, Union
+from typing import Dict, Any, Union, List, Optional
 
 from seeker_o1.tools.base.tool import BaseTool
 from seeker_o1.tools.base.tool_result import ToolResult
@@ -21,6 +21,7 @@ class CalculatorTool(BaseTool):
     
     name = "calculator"
     description = "Perform basic arithmetic calculations"
+    deterministic = True
     parameters = {
         "type": "object",
         "properties": {
@@ -42,6 +43,21 @@ class CalculatorTool(BaseTool):
         ast.USub: operator.neg,  # Unary minus
     }
     
+    def get_intents(self) -> List[Dict[str, Any]]:
+        """
+        Get the task phrasings this tool handles.
+        
+        Returns:
+            A list of intent dictionaries for the intent router.
+        """
+        return [
+            {
+                "pattern": r"calculate\s+(.+)$",
+                "build": lambda expression: {"expression": expression.strip()},
+                "priority": 10
+            }
+        ]
+    
     def execute(self, expression: str, **kwargs) -> Union[Dict[str, Any], ToolResult]:
         """
         Execute the calculator tool.
@@ -100,6 +116,24 @@ class CalculatorTool(BaseTool):
             logging.error(f"Error in calculator: {e}")
             return {"status": "error", "error": f"Calculation error: {error_msg}"}
     
+    def format_result(self, result: Any) -> Optional[str]:
+        """
+        Render a calculation as a final answer.
+        
+        Args:
+            result: The calculation result or error.
+            
+        Returns:
+            The answer text, or None for an unknown shape.
+        """
+        if not isinstance(result, dict):
+            return None
+        if result.get("status") == "error" and "error" in result:
+            return f"Calculator error: {result['error']}"
+        if "expression" in result and "result" in result:
+            return f"The result of {result['expression']} is {result['result']}"
+        return None
+    
     def _eval_expr(self, node: ast.AST) -> float:
         """
         Recursively evaluate an AST expression node.
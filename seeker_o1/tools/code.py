@@ -8,7 +8,7 @@ with appropriate safety restrictions.
 import logging
 import re
 import ast
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Optional
 import subprocess
 
 from seeker_o1.tools.base.tool import BaseTool
@@ -64,6 +64,28 @@ class CodeTool(BaseTool):
         "SEEKER-O1 is processing your code - tight security, clean output!"
     ]
     
+    def get_intents(self) -> List[Dict[str, Any]]:
+        """
+        Get the task phrasings this tool handles.
+        
+        Returns:
+            A list of intent dictionaries for the intent router.
+        """
+        patterns = [
+            r"run\s+code\s+```(?:python)?\s*(.+?)```",
+            r"execute\s+```(?:python)?\s*(.+?)```",
+            r"evaluate\s+```(?:python)?\s*(.+?)```"
+        ]
+        return [
+            {
+                "pattern": pattern,
+                "build": lambda code: {"code": code.strip()},
+                "flags": re.DOTALL,
+                "priority": 40
+            }
+            for pattern in patterns
+        ]
+    
     def execute(self, code: str, **kwargs) -> Union[Dict[str, Any], ToolResult]:
         """
         Execute the provided Python code in a restricted environment.
@@ -137,6 +159,24 @@ class CodeTool(BaseTool):
                 
             return {"status": "error", "error": f"Code execution error: {error_msg}"}
     
+    def format_result(self, result: Any) -> Optional[str]:
+        """
+        Render a code run as a final answer, with its output or result.
+        
+        Args:
+            result: The execution result.
+            
+        Returns:
+            The answer text, or None for an unknown shape or an error.
+        """
+        if not isinstance(result, dict) or "code" not in result or not ("result" in result or "output" in result):
+            return None
+        code = result["code"]
+        output = result.get("output", "")
+        if output:
+            return f"I executed your Python code:\n\n```python\n{code}\n```\n\nOutput:\n```\n{output}\n```"
+        return f"I executed your Python code:\n\n```python\n{code}\n```\n\nResult: {result.get('result', 'No direct result')}"
+    
     def _validate_code(self, code: str) -> None:
         """
         Validate code for security concerns.
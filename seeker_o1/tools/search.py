@@ -71,6 +71,23 @@ class SearchTool(BaseTool):
         "SEEKER-O1 is extracting search results from the web..."
     ]
     
+    def get_intents(self) -> List[Dict[str, Any]]:
+        """
+        Get the task phrasings this tool handles.
+        
+        Returns:
+            A list of intent dictionaries for the intent router.
+        """
+        patterns = [
+            r"search(?:\s+for)?\s+(.+)",
+            r"find(?:\s+information(?:\s+about)?)?\s+(.+)",
+            r"look\s+up\s+(.+)"
+        ]
+        return [
+            {"pattern": pattern, "build": lambda query: {"query": query}, "priority": 20}
+            for pattern in patterns
+        ]
+    
     def execute(self, query: str, **kwargs) -> Union[Dict[str, Any], ToolResult]:
         """
         Execute the search tool.
@@ -131,4 +148,23 @@ class SearchTool(BaseTool):
         except Exception as e:
             error_msg = str(e)
             logging.error(f"Error in search tool: {e}")
-            return {"status": "error", "error": f"Search error: {error_msg}"} 
\ No newline at end of file
+            return {"status": "error", "error": f"Search error: {error_msg}"}
+    
+    def format_result(self, result: Any) -> Optional[str]:
+        """
+        Render search results as a final answer, listing the first five.
+        
+        Args:
+            result: The search results.
+            
+        Returns:
+            The answer text, or None for an unknown shape or an error.
+        """
+        if not isinstance(result, dict) or "query" not in result or "results" not in result:
+            return None
+        results = result["results"]
+        result_count = result.get("result_count", len(results))
+        formatted_results = "\n".join([f"- {r}" for r in results[:5]])
+        comment = result.get("comment", "")
+        comment_text = f"\n\n{comment}" if comment else ""
+        return f"I searched for '{result['query']}' and found {result_count} results:\n\n{formatted_results}{comment_text}"
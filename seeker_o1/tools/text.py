@@ -7,7 +7,7 @@ formatting text, and basic analysis.
 
 import logging
 import re
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Optional
 
 from seeker_o1.tools.base.tool import BaseTool
 from seeker_o1.tools.base.tool_result import ToolResult
@@ -21,6 +21,7 @@ class TextTool(BaseTool):
     
     name = "text"
     description = "Process and manipulate text"
+    deterministic = True
     parameters = {
         "type": "object",
         "properties": {
@@ -47,6 +48,30 @@ class TextTool(BaseTool):
         "wordcount": "Seeker_o1 is counting your words one by one..."
     }
     
+    def get_intents(self) -> List[Dict[str, Any]]:
+        """
+        Get the task phrasings this tool handles.
+        
+        Returns:
+            A list of intent dictionaries for the intent router.
+        """
+        patterns = [
+            (r"count\s+characters\s+in\s+['\"](.+)['\"]", "count"),
+            (r"count\s+words\s+in\s+['\"](.+)['\"]", "wordcount"),
+            (r"reverse\s+['\"](.+)['\"]", "reverse"),
+            (r"uppercase\s+['\"](.+)['\"]", "uppercase"),
+            (r"lowercase\s+['\"](.+)['\"]", "lowercase"),
+            (r"capitalize\s+['\"](.+)['\"]", "capitalize"),
+        ]
+        return [
+            {
+                "pattern": pattern,
+                "build": lambda text, operation=operation: {"text": text, "operation": operation},
+                "priority": 30
+            }
+            for pattern, operation in patterns
+        ]
+    
     def execute(self, text: str, operation: str, **kwargs) -> Union[Dict[str, Any], ToolResult]:
         """
         Execute the text tool.
@@ -104,4 +129,33 @@ class TextTool(BaseTool):
         except Exception as e:
             error_msg = str(e)
             logging.error(f"Error in text tool: {e}")
-            return {"status": "error", "error": f"Text processing error: {error_msg}"} 
\ No newline at end of file
+            return {"status": "error", "error": f"Text processing error: {error_msg}"}
+    
+    def format_result(self, result: Any) -> Optional[str]:
+        """
+        Render a text operation as a final answer.
+        
+        Args:
+            result: The text operation result.
+            
+        Returns:
+            The answer text, or None for an unknown shape or an error.
+        """
+        if not isinstance(result, dict) or not {"text", "operation", "result"} <= set(result):
+            return None
+        text = result["text"]
+        operation = result["operation"]
+        operation_description = {
+            "count": "characters in",
+            "reverse": "reversed",
+            "uppercase": "in uppercase",
+            "lowercase": "in lowercase",
+            "capitalize": "capitalized",
+            "wordcount": "words in"
+        }.get(operation, operation)
+        fun_fact = result.get("fun_fact", "")
+        fun_fact_text = f"\n\n{fun_fact}" if fun_fact else ""
+        
+        if operation in ["count", "wordcount"]:
+            return f"I counted {result['result']} {operation_description} '{text}'{fun_fact_text}"
+        return f"I processed '{text}' with {operation} operation:\n\n{result['result']}{fun_fact_text}"
@@ -6,7 +6,7 @@ When SEEKER_O1 needs to do math, it uses this tool to work things out.
 
 import logging
 import random
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Optional
 
 from seeker_o1.tools.base.tool import BaseTool
 from seeker_o1.tools.base.tool_result import ToolResult
@@ -23,6 +23,7 @@ class CalculatorTool(BaseTool):
     
     name = "calculator"
     description = "Perform basic arithmetic calculations"
+    deterministic = True
     parameters = {
         "type": "object",
         "properties": {
@@ -57,6 +58,21 @@ class CalculatorTool(BaseTool):
         "SEEKER_O1 is working it out from behind the scenes..."
     ]
     
+    def get_intents(self) -> List[Dict[str, Any]]:
+        """
+        Get the task phrasings this tool handles.
+        
+        Returns:
+            A list of intent dictionaries for the intent router.
+        """
+        return [
+            {
+                "pattern": r"calculate\s+(.+)$",
+                "build": lambda expression: {"expression": expression.strip()},
+                "priority": 10
+            }
+        ]
+    
     def execute(self, expression: str, **kwargs) -> Union[Dict[str, Any], ToolResult]:
         """
         Execute the calculator tool.
@@ -134,6 +150,24 @@ class CalculatorTool(BaseTool):
             logging.error(f"Error in calculator tool: {e}")
             return ToolResult.error(self.name, f"Calculation error: {error_msg}")
     
+    def format_result(self, result: Any) -> Optional[str]:
+        """
+        Render a calculation as a final answer.
+        
+        Args:
+            result: The calculation result or error.
+            
+        Returns:
+            The answer text, or None for an unknown shape.
+        """
+        if not isinstance(result, dict):
+            return None
+        if result.get("status") == "error" and "error" in result:
+            return f"Calculator error: {result['error']}"
+        if "expression" in result and "result" in result:
+            return f"The result of {result['expression']} is {result['result']}"
+        return None
+    
     def validate_input(self, expression: str = None, **kwargs) -> bool:
         """
         Validate the input parameters.
@@ -16,13 +16,8 @@ from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 from rich.console import Console
 from rich.panel import Panel
-from rich.syntax import Syntax
-from rich.table import Table
 from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.prompt import Prompt
 from rich import box
-from rich.style import Style
 
 from seeker_o1.core.orchestrator import AgentOrchestrator
 
@@ -178,11 +173,21 @@ class CLI(cmd.Cmd):
             if "iterations" in result:
                 iterations = result.get("iterations", 0)
                 details.append(f"[bold]Iterations:[/bold] {iterations}")
+                if result.get("iterations_saved"):
+                    details.append(f"[bold]Iterations saved:[/bold] {result['iterations_saved']} ({result.get('termination_reason')})")
             elif "steps" in result:
                 steps = len(result.get("steps", []))
                 completed_steps = len(result.get("completed_steps", []))
                 details.append(f"[bold]Steps:[/bold] {completed_steps}/{steps} completed")
             
+            # Model calls and where a reused answer came from
+            if "llm_calls" in result:
+                details.append(f"[bold]Model calls:[/bold] {result['llm_calls']}")
+                if "cached" in result:
+                    details.append(f"[bold]Answered from:[/bold] {result['cached']['tier']} result cache")
+                elif "memory" in result:
+                    details.append(f"[bold]Answered from:[/bold] {result['memory']['tier'].replace('_', '-')} memory")
+            
             details_panel = Panel(
                 "\n".join(details),
                 border_style="blue",
@@ -231,7 +236,7 @@ class CLI(cmd.Cmd):
         mode = None
         task = arg.strip()
         
-        if len(parts) > 1 and parts[0] in ["single", "multi", "auto"]:
+        if len(parts) > 1 and parts[0] in ["single", "multi", "auto", "speculative"]:
             mode = parts[0]
             task = parts[1]
         
@@ -245,6 +250,8 @@ class CLI(cmd.Cmd):
         
         # Execute the task with progress indicator
         try:
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+            
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[bold cyan]Processing...[/bold cyan]"),
@@ -272,6 +279,54 @@ class CLI(cmd.Cmd):
             self.console.print(f"[bold red]Error executing task:[/bold red] {e}")
             self.console.print("[italic]Even Seeker-o1 has its limits. Please try again.[/italic]")
     
+    def do_bulk(self, arg: str) -> None:
+        """
+        Run OCR and captioning over a directory or glob of images.
+
+        Results are appended to a JSONL file; rerunning with the same output
+        file skips images that were already processed.
+
+        Usage:
+            bulk <directory_or_glob> <output.jsonl> [workers]
+
+        Example:
+            bulk "./scans/*.png" ./scans.jsonl 4
+
+        Args:
+            arg: Image source, output path, and optional number of worker processes.
+        """
+        # Make sure orchestrator is initialized
+        if not self.orchestrator:
+            self.orchestrator = AgentOrchestrator(config_path=self.config_path)
+
+        parts = arg.strip().split()
+        if len(parts) < 2:
+            self.console.print("[bold red]Error:[/bold red] Usage: bulk <directory_or_glob> <output.jsonl> [workers]")
+            return
+
+        source, output_path = parts[0].strip("\"'"), parts[1]
+        options = {}
+        if len(parts) > 2:
+            try:
+                options["workers"] = int(parts[2])
+            except ValueError:
+                self.console.print(f"[bold red]Error:[/bold red] Invalid worker count: {parts[2]}")
+                return
+
+        self.console.print(f"[bold cyan]Processing images:[/bold cyan] {source} -> {output_path}")
+        try:
+            with self.console.status("[bold cyan]Processing images...[/bold cyan]"):
+                summary = self.orchestrator.process_images(source, output_path, **options)
+        except Exception as e:
+            self.console.print(f"[bold red]Error processing images:[/bold red] {e}")
+            return
+
+        self.console.print(
+            f"[bold green]Done:[/bold green] {summary['processed']} processed, "
+            f"{summary['skipped']} skipped, {summary['failed']} failed "
+            f"in {summary['elapsed']:.1f}s with {summary['workers']} workers"
+        )
+
     def do_agents(self, arg: str) -> None:
         """
         List available agents.
@@ -290,6 +345,7 @@ class CLI(cmd.Cmd):
             return
         
         # Create a table for agents
+        from rich.table import Table
         table = Table(title="Available Agents", box=box.ROUNDED)
         table.add_column("", style="cyan", no_wrap=True)
         table.add_column("Name", style="bold white")
@@ -343,6 +399,7 @@ class CLI(cmd.Cmd):
             return
         
         # Create a table for history
+        from rich.table import Table
         table = Table(title="Task History", box=box.ROUNDED)
         table.add_column("#", style="dim")
         table.add_column("Timestamp", style="cyan")
@@ -384,6 +441,89 @@ class CLI(cmd.Cmd):
         if len(history) > 10:
             self.console.print("[italic]Seeker-o1 has been quite busy, hasn't it?[/italic]")
     
+    def do_stats(self, arg: str) -> None:
+        """
+        Show how tasks were answered.
+        
+        Usage: stats
+        """
+        # Make sure orchestrator is initialized
+        if not self.orchestrator:
+            self.orchestrator = AgentOrchestrator(config_path=self.config_path)
+        
+        answer_stats = self.orchestrator.get_answer_stats()
+        if not answer_stats.get("tasks"):
+            self.console.print("[bold yellow]No tasks answered yet.[/bold yellow]")
+            return
+        
+        lines = [
+            f"[bold]Tasks:[/bold] {answer_stats['tasks']}",
+            f"[bold]Answered without a model call:[/bold] {answer_stats['llm_free']} ({answer_stats['llm_free_percent']:.1f}%)",
+            f"[bold]Model calls:[/bold] {answer_stats['llm_calls']}"
+        ]
+        cache_stats = self.orchestrator.get_result_cache_stats()
+        if cache_stats.get("lookups"):
+            lines.append(f"[bold]Result cache hit rate:[/bold] {cache_stats['hit_rate']:.0%}")
+        memory_stats = self.orchestrator.get_memory_stats()
+        if memory_stats.get("lookups"):
+            lines.append(f"[bold]Memory hit rate:[/bold] {memory_stats['hit_rate']:.0%}")
+        self.console.print(Panel(
+            "\n".join(lines),
+            title="Answer Statistics",
+            border_style="blue",
+            box=box.ROUNDED
+        ))
+    
+    def do_resume(self, arg: str) -> None:
+        """
+        Resume an interrupted task from its last completed step.
+        
+        Usage: resume [run_id]
+        
+        Without a run id, lists the runs that can be resumed.
+        """
+        # Make sure orchestrator is initialized
+        if not self.orchestrator:
+            self.orchestrator = AgentOrchestrator(config_path=self.config_path)
+        
+        run_id = arg.strip()
+        if not run_id:
+            runs = [run for run in self.orchestrator.list_checkpoints() if run["status"] != "completed"]
+            if not runs:
+                self.console.print("[bold yellow]No interrupted tasks to resume.[/bold yellow]")
+                return
+            from rich.table import Table
+            table = Table(title="Resumable Tasks", box=box.ROUNDED)
+            table.add_column("Run ID", style="cyan")
+            table.add_column("Status", style="yellow")
+            table.add_column("Steps", justify="right")
+            table.add_column("Task", style="green")
+            for run in runs:
+                task = run["task"] or ""
+                table.add_row(
+                    run["run_id"],
+                    run["status"],
+                    str(run["steps_completed"]),
+                    task[:60] + "..." if len(task) > 60 else task
+                )
+            self.console.print(table)
+            return
+        
+        self.console.print(f"[bold cyan]Resuming run:[/bold cyan] {run_id}")
+        try:
+            result = self.orchestrator.resume_task(run_id)
+        except Exception as e:
+            self.console.print(f"[bold red]Error resuming task:[/bold red] {e}")
+            return
+        
+        self.display_result(result)
+        self.history.append({
+            "timestamp": time.time(),
+            "task": result.get("task", run_id),
+            "mode": result.get("mode"),
+            "result": result
+        })
+    
     def do_config(self, arg: str) -> None:
         """
         Show current configuration.
@@ -398,6 +538,8 @@ class CLI(cmd.Cmd):
         
         # Display config as syntax highlighted JSON
         try:
+            from rich.syntax import Syntax
+            
             config_json = json.dumps(self.orchestrator.config, indent=2)
             syntax = Syntax(config_json, "json", theme="monokai", line_numbers=True)
             self.console.print(Panel(
@@ -486,6 +628,7 @@ class CLI(cmd.Cmd):
     def display_help(self):
         """Displays help information for the CLI."""
         # Create a table for commands
+        from rich.table import Table
         table = Table(title="Seeker-o1 Commands", box=box.ROUNDED)
         table.add_column("Command", style="cyan")
         table.add_column("Description", style="white")
@@ -493,8 +636,11 @@ class CLI(cmd.Cmd):
         
         # Add rows for each command
         table.add_row("task", "Execute a task", "task [mode] <description>")
+        table.add_row("bulk", "OCR and caption many images", "bulk <dir_or_glob> <output.jsonl> [workers]")
         table.add_row("agents", "List available agents", "agents")
         table.add_row("history", "Show task execution history", "history [limit]")
+        table.add_row("stats", "Show how tasks were answered", "stats")
+        table.add_row("resume", "Resume an interrupted task", "resume [run_id]")
         table.add_row("config", "Show current configuration", "config")
         table.add_row("joke", "Display a random joke", "joke")
         table.add_row("exit/quit", "Exit the application", "exit")
@@ -0,0 +1,135 @@
+import gc
+import gzip
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import threading
+import unittest
+
+from seeker_o1.core.agent.base_agent import BaseAgent
+from seeker_o1.core.agent.history import AgentHistory
+
+class DummyAgent(BaseAgent):
+    def execute(self, task, **kwargs):
+        return {"task": task}
+
+def entry(index, action="step"):
+    return {"timestamp": float(index), "action": action, "details": {"index": index}}
+
+def spilled_lines(path):
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        return handle.readlines()
+
+class TestAgentHistory(unittest.TestCase):
+    def test_ring_buffer_without_spill_drops_oldest(self):
+        history = AgentHistory(capacity=3)
+        for index in range(5):
+            history.append(entry(index))
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history[0]["details"]["index"], 2)
+        self.assertEqual([item["details"]["index"] for item in history[-2:]], [3, 4])
+        self.assertEqual(history.dropped, 2)
+        self.assertEqual(history.total, 5)
+
+    def test_query_reads_spilled_and_memory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "nested", "history.jsonl.gz")
+            history = AgentHistory(capacity=4, spill_path=path, spill_batch=3)
+            for index in range(10):
+                history.append(entry(index, "even" if index % 2 == 0 else "odd"))
+            self.assertEqual(len(history), 4)
+
+            everything = history.query()
+            self.assertEqual([item["details"]["index"] for item in everything], list(range(10)))
+            self.assertEqual(history.spilled, 6)
+            self.assertEqual([item["details"]["index"] for item in history.query(action="odd", limit=2)], [7, 9])
+            self.assertEqual([item["details"]["index"] for item in history.query(since=3, until=6)], [3, 4, 5])
+            self.assertEqual(len(history.query(include_spilled=False)), 4)
+
+    def test_unserializable_details_are_spilled_as_strings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            history = AgentHistory(capacity=1, spill_path=os.path.join(directory, "h.jsonl.gz"), spill_batch=1)
+            history.append({"timestamp": 0.0, "action": "obj", "details": {"value": object()}})
+            history.append(entry(1))
+            spilled = history.query(action="obj")
+            self.assertIsInstance(spilled[0]["details"]["value"], str)
+
+    def test_pending_spill_is_written_on_close_and_collection(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "h.jsonl.gz")
+            history = AgentHistory(capacity=2, spill_path=path, spill_batch=64)
+            for index in range(5):
+                history.append(entry(index))
+            self.assertFalse(os.path.exists(path))
+            history.close()
+            self.assertEqual(history.spilled, 3)
+            self.assertEqual(len(spilled_lines(path)), 3)
+
+            history = AgentHistory(capacity=2, spill_path=path, spill_batch=64)
+            for index in range(4):
+                history.append(entry(index))
+            del history
+            gc.collect()
+            self.assertEqual(len(spilled_lines(path)), 5)
+
+    def test_evictions_after_close_are_still_written_at_collection(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "h.jsonl.gz")
+            history = AgentHistory(capacity=2, spill_path=path, spill_batch=64)
+            for index in range(3):
+                history.append(entry(index))
+            history.close()
+            history.append(entry(3))
+            del history
+            gc.collect()
+            self.assertEqual(len(spilled_lines(path)), 2)
+
+    def test_clear_spills_pending_entries_and_keeps_the_total(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "h.jsonl.gz")
+            history = AgentHistory(capacity=2, spill_path=path, spill_batch=64)
+            for index in range(5):
+                history.append(entry(index))
+            history.clear()
+            self.assertEqual(len(history), 0)
+            self.assertEqual(len(spilled_lines(path)), 3)
+            self.assertEqual((history.spilled, history.dropped, history.total), (3, 2, 5))
+
+    def test_pending_spill_is_written_at_exit(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "h.jsonl.gz")
+            script = textwrap.dedent(f"""
+                from seeker_o1.core.agent.history import AgentHistory
+                history = AgentHistory(capacity=2, spill_path={path!r}, spill_batch=64)
+                for index in range(12):
+                    history.append({{"timestamp": float(index), "action": "step"}})
+            """)
+            root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            subprocess.run([sys.executable, "-c", script], cwd=root, check=True, timeout=60)
+            self.assertEqual(len(spilled_lines(path)), 10)
+
+    def test_concurrent_appends(self):
+        history = AgentHistory(capacity=50)
+        threads = [
+            threading.Thread(target=lambda: [history.append(entry(index)) for index in range(200)])
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(history), 50)
+        self.assertEqual(history.total, 800)
+
+    def test_agent_history_is_bounded_per_agent(self):
+        agent = DummyAgent(history_capacity=2)
+        self.assertEqual(agent.history, [])
+        for index in range(3):
+            agent.log_action("step", {"index": index})
+        self.assertEqual([item["details"]["index"] for item in agent.history], [1, 2])
+        self.assertEqual(agent.get_info()["history_length"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
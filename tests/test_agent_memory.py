@@ -0,0 +1,148 @@
+import shutil
+import tempfile
+import unittest
+
+from seeker_o1.core.agent.agent_memory import AgentMemory
+from seeker_o1.core.agent.hybrid_agent import HybridAgent
+from seeker_o1.core.memory import LongTermMemory, ShortTermMemory
+from seeker_o1.models.base.base_model import BaseModel
+from seeker_o1.models.model_router import ModelRouter
+
+class PromptModel(BaseModel):
+    """Records prompts and answers with a numbered string."""
+
+    def __init__(self, model_name="fake", **kwargs):
+        super().__init__(model_name, **kwargs)
+        self.prompts = []
+
+    def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return f"answer {len(self.prompts)}"
+
+    def generate_with_tools(self, prompt, tools, **kwargs):
+        return {"content": self.generate(prompt, **kwargs), "tool_calls": []}
+
+    def extract_json(self, prompt, **kwargs):
+        return {}
+
+    def get_embedding(self, text, **kwargs):
+        return []
+
+class MemoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def long_term(self):
+        return LongTermMemory(storage_path=self.directory)
+
+class TestAgentMemory(MemoryTestCase):
+    def test_long_term_hits_are_promoted_to_short_term(self):
+        memory = AgentMemory(short_term=ShortTermMemory(), long_term=self.long_term())
+        self.assertTrue(memory.remember("What is 2 + 2?", "single", {"answer": "4"}))
+        self.assertEqual(memory.recall("what is 2+2", "single")["tier"], "short_term")
+        self.assertIsNone(memory.recall("What is 2 + 2?", "multi"))
+        memory.flush()
+
+        # A new session starts with empty short-term memory
+        fresh = AgentMemory(short_term=ShortTermMemory(), long_term=self.long_term())
+        self.assertEqual(fresh.recall("What is 2 + 2?", "single")["tier"], "long_term")
+        record = fresh.recall("What is 2 + 2?", "single")
+        self.assertEqual((record["tier"], record["answer"]), ("short_term", "4"))
+        self.assertEqual(fresh.get_stats()["hit_rate"], 1.0)
+
+    def test_long_term_keeps_one_outcome_per_task(self):
+        long_term = self.long_term()
+        memory = AgentMemory(long_term=long_term)
+        memory.remember("Summarize the report", "auto", {"answer": "first"})
+        memory.remember("summarize the report.", "auto", {"answer": "second"})
+        memory.flush()
+        self.assertEqual(len(long_term.search({"type": "task_result"})), 1)
+        self.assertEqual(memory.recall("Summarize the report", "auto")["answer"], "second")
+        self.assertEqual(memory.get_stats()["writes"], 2)
+
+    def test_only_fresh_confident_answers_are_kept(self):
+        memory = AgentMemory(short_term=ShortTermMemory())
+        self.assertFalse(memory.remember("task", "auto", {"answer": "", "confidence": 1.0}))
+        self.assertFalse(memory.remember("task", "auto", {"answer": "x", "error": "failed"}))
+        self.assertFalse(memory.remember("task", "auto", {"answer": "x", "confidence": 0.2}))
+        self.assertFalse(memory.remember("task", "auto", {"answer": "x", "cached": {"tier": "exact"}}))
+        self.assertFalse(memory.remember("task", "auto", {"answer": "Error: rate limit exceeded"}))
+        self.assertIsNone(memory.recall("task", "auto"))
+
+        stale = AgentMemory(short_term=ShortTermMemory(), max_age=0)
+        stale.remember("task", "auto", {"answer": "x"})
+        self.assertIsNone(stale.recall("task", "auto"))
+
+    def test_failed_model_calls_are_not_persisted(self):
+        long_term = self.long_term()
+        memory = AgentMemory(short_term=ShortTermMemory(), long_term=long_term)
+        self.assertFalse(memory.remember("What is 2 + 2?", "single", {"answer": "Error: connection reset"}))
+        memory.flush()
+        self.assertEqual(long_term.search({"type": "task_result"}), [])
+        self.assertIsNone(AgentMemory(long_term=long_term).recall("What is 2 + 2?", "single"))
+
+    def test_search_scans_the_newest_records(self):
+        memory = AgentMemory(short_term=ShortTermMemory(), max_candidates=5)
+        for index in range(20):
+            memory.remember(f"Unrelated chore number {index}", "auto", {"answer": str(index)})
+        memory.remember("What is the capital of France?", "auto", {"answer": "Paris"})
+        facts = memory.related("What is the capital city of France?")
+        self.assertEqual([fact["answer"] for fact in facts], ["Paris"])
+
+    def test_related_tasks_are_ranked_by_shared_words(self):
+        memory = AgentMemory(short_term=ShortTermMemory(), max_facts=2)
+        memory.remember("What is the capital of France?", "auto", {"answer": "Paris"})
+        memory.remember("What is the population of France?", "auto", {"answer": "68 million"})
+        memory.remember("How do I bake bread?", "auto", {"answer": "With flour"})
+
+        facts = memory.related("What is the capital city of France?")
+        self.assertEqual([fact["answer"] for fact in facts], ["Paris", "68 million"])
+        self.assertEqual(memory.related("What is the capital of France?")[0]["answer"], "68 million")
+
+class TestMemoryAwareAgent(MemoryTestCase):
+    def make_agent(self, model):
+        router = ModelRouter({"provider": "fake", "model_name": "fake"})
+        router.register_model_class("fake", lambda **config: model)
+        return HybridAgent(
+            name="hybrid",
+            model_router=router,
+            short_term_memory=ShortTermMemory(),
+            long_term_memory=self.long_term(),
+            result_cache={"enabled": False}
+        )
+
+    def test_memory_does_not_outlive_the_result_cache(self):
+        router = ModelRouter({"provider": "fake", "model_name": "fake"})
+        router.register_model_class("fake", lambda **config: PromptModel())
+        agent = HybridAgent(name="hybrid", model_router=router, memory={"max_age": 604800},
+                            result_cache={"ttl": 600})
+        self.assertEqual(agent.agent_memory.max_age, 600)
+        self.assertEqual(AgentMemory().max_age, 3600)
+
+    def test_repeated_questions_skip_the_model(self):
+        model = PromptModel()
+        agent = self.make_agent(model)
+        first = agent.execute("What is the capital of France?", mode="single")
+        repeated = agent.execute("what is the capital of france", mode="single")
+        self.assertEqual(len(model.prompts), 1)
+        self.assertEqual(repeated["answer"], first["answer"])
+        self.assertEqual(repeated["llm_calls"], 0)
+        self.assertEqual(repeated["memory"]["tier"], "short_term")
+
+        # Related answers are put in front of the prompt
+        agent.execute("What is the capital of Spain?", mode="single")
+        self.assertIn("What is the capital of France?: answer 1", model.prompts[-1])
+        self.assertTrue(model.prompts[-1].endswith("Task: What is the capital of Spain?"))
+
+        # A new agent, as after a restart, answers from long-term memory
+        agent.agent_memory.flush()
+        restarted = self.make_agent(PromptModel())
+        result = restarted.execute("What is the capital of France?", mode="single")
+        self.assertEqual((result["answer"], result["memory"]["tier"]), ("answer 1", "long_term"))
+        self.assertEqual(restarted.get_answer_stats()["llm_free"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import yaml
+
+from seeker_o1.core.agent.checkpoint import CheckpointStore
+from seeker_o1.core.agent.hybrid_agent import HybridAgent
+from seeker_o1.core.agent.tool_agent import ToolAgent
+from seeker_o1.core.orchestrator import AgentOrchestrator
+
+class RoleAgent(ToolAgent):
+    """Stands in for a specialized agent and records each run."""
+
+    def __init__(self, name, calls, fail=False):
+        super().__init__(name=name)
+        self.calls = calls
+        self.fail = fail
+
+    def execute(self, task, **kwargs):
+        if self.fail:
+            raise RuntimeError("process killed")
+        self.calls.append(self.name)
+        return {"task": task, "answer": f"{self.name} done"}
+
+class StepAgent(ToolAgent):
+    """Takes one numbered step per iteration and stops after three."""
+
+    def __init__(self, name, crash_at=None):
+        super().__init__(name=name)
+        self.crash_at = crash_at
+        self.executed = []
+
+    def _generate_thought(self, context):
+        return "next step"
+
+    def _decide_actions(self, context):
+        return [("step", {"n": len(context["actions"])})]
+
+    def _execute_actions(self, actions):
+        step = actions[0][1]["n"]
+        if step == self.crash_at:
+            raise RuntimeError("process killed")
+        self.executed.append(step)
+        return [{"step": step}]
+
+    def _should_terminate(self, context):
+        return len(context["actions"]) >= 3
+
+    def _generate_with_model(self, context):
+        return f"finished after {len(context['actions'])} steps"
+
+class RoleHybridAgent(HybridAgent):
+    def __init__(self, calls, failing=(), **kwargs):
+        super().__init__(name="hybrid", result_cache={"enabled": False}, **kwargs)
+        self.specialized_agents = {
+            role: RoleAgent(role, calls, fail=role in failing)
+            for role in ("researcher", "planner", "executor", "critic")
+        }
+
+class CheckpointTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = CheckpointStore(directory=self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+class TestCheckpointStore(CheckpointTestCase):
+    def test_runs_are_listed_and_failed_runs_reopen(self):
+        checkpoint = self.store.open("a task", "hybrid", run_id="run-1")
+        checkpoint.save_step("researcher", {"answer": "notes", "context": {"large": True}})
+        checkpoint.fail(RuntimeError("boom"))
+
+        self.assertEqual(self.store.list(status="failed")[0]["steps_completed"], 1)
+        reopened = self.store.open("a task", "hybrid", run_id="run-1")
+        self.assertTrue(reopened.resumed)
+        self.assertEqual(reopened.get_step("researcher"), {"answer": "notes"})
+        self.assertEqual(self.store.load("run-1")["status"], "running")
+
+    def test_finished_runs_are_deleted_unless_kept(self):
+        checkpoint = self.store.open("a task", "hybrid")
+        checkpoint.finish({"answer": "done"})
+        self.assertIsNone(self.store.load(checkpoint.run_id))
+        # A late save, e.g. from a cancelled role, does not bring it back
+        checkpoint.save_step("critic", {"answer": "late"})
+        self.assertEqual(self.store.list(), [])
+
+        keeping = CheckpointStore(directory=self.directory, keep_completed=True)
+        checkpoint = keeping.open("a task", "hybrid")
+        checkpoint.finish({"answer": "done", "context": {}})
+        record = keeping.load(checkpoint.run_id)
+        self.assertEqual(record["status"], "completed")
+        self.assertEqual(record["result"], {"answer": "done"})
+
+    def test_invalid_run_ids_are_rejected(self):
+        for run_id in ("../escape", "nested/run", ".hidden"):
+            with self.assertRaises(ValueError):
+                self.store.open("a task", "hybrid", run_id=run_id)
+
+    def test_completed_step_drops_its_state(self):
+        checkpoint = self.store.open("a task", "hybrid", run_id="run-2")
+        checkpoint.save_state("executor", {"iteration": 0})
+        self.assertTrue(checkpoint.resumed)
+        self.assertEqual(checkpoint.get_state("executor"), {"iteration": 0})
+        checkpoint.save_step("executor", {"answer": "done"})
+        self.assertIsNone(checkpoint.get_state("executor"))
+        self.assertEqual(self.store.load("run-2")["states"], {})
+
+class TestHybridResume(CheckpointTestCase):
+    def test_completed_roles_are_not_rerun(self):
+        calls = []
+        agent = RoleHybridAgent(calls, failing=("executor",), checkpoint_store=self.store,
+                                multi_agent={"pipeline": "sequential"})
+        with self.assertRaises(RuntimeError):
+            agent.execute("plan a trip", mode="multi", run_id="hybrid-run")
+        self.assertEqual(calls, ["researcher", "planner"])
+        record = self.store.load("hybrid-run")
+        self.assertEqual(record["mode"], "multi")
+        self.assertEqual(sorted(record["steps"]), ["planner", "researcher"])
+
+        calls.clear()
+        agent = RoleHybridAgent(calls, checkpoint_store=self.store, multi_agent={"pipeline": "sequential"})
+        result = agent.execute("plan a trip", mode="multi", run_id="hybrid-run")
+        self.assertEqual(calls, ["executor", "critic"])
+        self.assertTrue(result["agent_results"]["researcher"]["resumed"])
+        self.assertEqual(result["answer"], "executor done")
+        self.assertEqual(result["run_id"], "hybrid-run")
+
+    def test_interrupted_role_resumes_after_its_last_iteration(self):
+        calls = []
+        agent = RoleHybridAgent(calls, checkpoint_store=self.store, multi_agent={"pipeline": "sequential"})
+        agent.specialized_agents["executor"] = StepAgent("executor", crash_at=2)
+        with self.assertRaises(RuntimeError):
+            agent.execute("plan a trip", mode="multi", run_id="role-run")
+        self.assertEqual(agent.specialized_agents["executor"].executed, [0, 1])
+        state = self.store.load("role-run")["states"]["executor"]
+        self.assertEqual((state["iteration"], state["done"]), (1, False))
+
+        calls.clear()
+        agent = RoleHybridAgent(calls, checkpoint_store=self.store, multi_agent={"pipeline": "sequential"})
+        executor = agent.specialized_agents["executor"] = StepAgent("executor")
+        result = agent.execute("plan a trip", mode="multi", run_id="role-run")
+        self.assertEqual(calls, ["critic"])
+        self.assertEqual(executor.executed, [2])
+        self.assertEqual(result["agent_results"]["executor"]["answer"], "finished after 3 steps")
+        self.assertIsNone(self.store.load("role-run"))
+
+class TestOrchestratorResume(CheckpointTestCase):
+    def make_orchestrator(self, checkpoints):
+        config_path = os.path.join(self.directory, "config.yaml")
+        with open(config_path, "w") as f:
+            yaml.safe_dump({
+                "agent": {"result_cache": {"enabled": False}},
+                "memory": {"long_term": {"enabled": False}, "agent": {"recall": False}},
+                "multi_agent": {"pipeline": "sequential"},
+                "checkpoints": checkpoints
+            }, f)
+        return AgentOrchestrator(config_path=config_path)
+
+    def test_checkpoints_are_off_by_default(self):
+        orchestrator = self.make_orchestrator({})
+        self.assertIsNone(orchestrator.checkpoint_store)
+        self.assertIsNone(orchestrator.primary_agent.checkpoint_store)
+        self.assertEqual(orchestrator.list_checkpoints(), [])
+
+    def test_interrupted_task_resumes_from_the_last_completed_role(self):
+        orchestrator = self.make_orchestrator({"enabled": True, "directory": self.directory})
+        calls = []
+        agent = orchestrator.primary_agent
+        agent.specialized_agents = {
+            role: RoleAgent(role, calls, fail=role == "executor")
+            for role in ("researcher", "planner", "executor", "critic")
+        }
+        with self.assertRaises(RuntimeError):
+            orchestrator.execute_task("plan a trip", mode="multi", run_id="orchestrated-run")
+        self.assertEqual(orchestrator.list_checkpoints(status="failed")[0]["run_id"], "orchestrated-run")
+
+        calls.clear()
+        agent.specialized_agents["executor"].fail = False
+        result = orchestrator.resume_task("orchestrated-run")
+        self.assertEqual(calls, ["executor", "critic"])
+        self.assertEqual(result["answer"], "executor done")
+        self.assertEqual(orchestrator.list_checkpoints(), [])
+
+if __name__ == "__main__":
+    unittest.main()
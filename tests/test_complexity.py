@@ -0,0 +1,89 @@
+import random
+import re
+import unittest
+
+from seeker_o1.core.agent.complexity import ComplexityScorer
+
+def original_assess_complexity(task):
+    """HybridAgent._assess_complexity before the precompiled scorer."""
+    complexity = 0.0
+    operations = [
+        (r'(calculate|compute|evaluate)', 1.0),
+        (r'(search|find|look up)', 1.0),
+        (r'(count|process|analyze|transform)\s+text', 1.0),
+        (r'run\s+code|execute', 1.5),
+        (r'compare|contrast|evaluate', 2.0),
+        (r'optimize|improve|enhance', 2.5),
+        (r'and|then|after|before', 1.0),
+        (r'if|when|unless|otherwise', 1.5),
+        (r'all|every|each', 1.0),
+        (r'most|best|optimal', 1.5)
+    ]
+    for pattern, score in operations:
+        matches = re.findall(pattern, task.lower())
+        complexity += score * len(matches)
+    words = task.split()
+    complexity += len(words) * 0.1
+    special_chars = sum(1 for c in task if not c.isalnum() and not c.isspace())
+    complexity += special_chars * 0.2
+    tool_keywords = {
+        'calculator': ['calculate', 'compute', 'evaluate', 'math'],
+        'search': ['search', 'find', 'look up', 'query'],
+        'text': ['text', 'string', 'characters', 'words'],
+        'code': ['code', 'execute', 'run', 'python']
+    }
+    tools_needed = 0
+    task_lower = task.lower()
+    for tool_name, keywords in tool_keywords.items():
+        if any(kw in task_lower for kw in keywords):
+            tools_needed += 1
+    complexity += tools_needed * 1.5
+    return min(10.0, complexity)
+
+TASKS = [
+    "",
+    "hello",
+    "Calculate 2 + 2",
+    "search for the best python tutorials and then summarise each one",
+    "If it rains, compare the forecasts; otherwise find a café near Zürich!",
+    "run code ```print(sum(range(10)))``` and evaluate the result",
+    "count text in 'snake_case_name' — how many underscores?",
+    "Optimize the query, improve the index, enhance every report before Friday",
+]
+
+def random_task(rng):
+    vocabulary = ["calculate", "find", "and", "if", "all", "best", "text", "run code", "é", "_", "£",
+                  " ", " ", "٣", "x²", "look up", "Evaluate", "math", "?", "(1+2)*3", "\t"]
+    return " ".join(rng.choice(vocabulary) for _ in range(rng.randint(0, 40)))
+
+class TestComplexityScorer(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.tasks = TASKS + [random_task(rng) for _ in range(300)]
+        self.scorer = ComplexityScorer()
+
+    def test_scores_match_original_algorithm_exactly(self):
+        for task in self.tasks:
+            self.assertEqual(self.scorer.score(task), original_assess_complexity(task), task)
+
+    def test_batch_matches_single_scores(self):
+        self.assertEqual(self.scorer.score_batch(self.tasks), [self.scorer.score(task) for task in self.tasks])
+        self.assertEqual(self.scorer.score_batch([]), [])
+        # Tasks are joined on NUL internally; one inside a task must still count as special
+        with_nul = ["calc\x00ulate this", "İstanbul and then"]
+        self.assertEqual(self.scorer.score_batch(with_nul), [original_assess_complexity(t) for t in with_nul])
+
+    def test_breakdown(self):
+        breakdown = self.scorer.breakdown("Calculate 2 + 2 and then search for it")
+        features = breakdown["features"]
+        self.assertEqual(features["calculation"]["count"], 1)
+        self.assertEqual(features["chaining"]["count"], 2)
+        self.assertEqual(features["special_chars"]["count"], 1)
+        self.assertEqual(features["tools_needed"]["count"], 2)
+        self.assertEqual(breakdown["score"], self.scorer.score("Calculate 2 + 2 and then search for it"))
+
+    def test_modes_batch(self):
+        self.assertEqual(self.scorer.modes_batch(["hi", TASKS[-1]]), ["single", "multi"])
+
+if __name__ == "__main__":
+    unittest.main()
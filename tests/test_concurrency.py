@@ -0,0 +1,91 @@
+import random
+import re
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from seeker_o1.core.agent.hybrid_agent import HybridAgent
+from seeker_o1.core.agent.tool_agent import ToolAgent
+
+class InterleavingAgent(ToolAgent):
+    """Runs "run <steps> <tag>" for that many iterations of two parallel actions each."""
+
+    def __init__(self, **kwargs):
+        super().__init__(name="shared", **kwargs)
+        self.seen = []
+        self.seen_lock = threading.Lock()
+
+    def _decide_actions(self, context):
+        steps = int(context["task"].split()[1])
+        action_input = {"iteration": self.current_iteration, "steps": steps}
+        return [("step", dict(action_input)), ("echo", dict(action_input))]
+
+    def _execute_action(self, action_name, action_input):
+        time.sleep(random.uniform(0, 0.002))
+        with self.seen_lock:
+            self.seen.append((self.current_execution.task, action_input["iteration"], self.current_iteration))
+        return {
+            "status": "success",
+            "result": action_name,
+            "terminal": action_input["iteration"] >= action_input["steps"] - 1
+        }
+
+    def _generate_with_model(self, context):
+        time.sleep(random.uniform(0, 0.002))
+        return context["task"]
+
+class EchoRoleAgent(ToolAgent):
+    """A specialized agent that answers with the job id in its prompt."""
+
+    def _decide_actions(self, context):
+        return [("echo", {"text": context["task"]})]
+
+    def _execute_action(self, action_name, action_input):
+        time.sleep(random.uniform(0, 0.003))
+        return {"status": "success", "result": action_input["text"], "terminal": True}
+
+    def _generate_with_model(self, context):
+        job = re.search(r"job-\d+", context["task"]).group()
+        return f"{self.name} finished {job}"
+
+class TestReentrantAgents(unittest.TestCase):
+    def test_concurrent_runs_keep_their_own_iterations(self):
+        agent = InterleavingAgent(max_iterations=10)
+        tasks = [f"run {1 + index % 4} task-{index}" for index in range(32)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(agent.execute, tasks))
+
+        for task, result in zip(tasks, results):
+            steps = int(task.split()[1])
+            self.assertEqual(result["task"], task)
+            self.assertEqual(result["answer"].split("\n\n")[0], task)
+            self.assertEqual(result["iterations"], steps - 1)
+            self.assertEqual(result["termination_reason"], "success")
+            seen = [(planned, current) for seen_task, planned, current in agent.seen if seen_task == task]
+            # Both actions of every iteration ran on pool threads that saw their own run
+            self.assertEqual(sorted(planned for planned, _ in seen), sorted(list(range(steps)) * 2))
+            self.assertTrue(all(planned == current for planned, current in seen))
+
+        self.assertEqual(agent.get_active_runs(), [])
+        self.assertEqual(agent.get_info()["state"]["status"], "completed")
+
+    def test_shared_hybrid_agent_serves_concurrent_multi_agent_tasks(self):
+        agent = HybridAgent(name="hybrid", result_cache={"enabled": False},
+                            multi_agent={"pipeline": "sequential", "early_exit": {"enabled": False}})
+        agent.specialized_agents = {
+            role: EchoRoleAgent(name=role, max_iterations=2)
+            for role in ("researcher", "planner", "executor", "critic")
+        }
+        tasks = [f"Research and compare the options for job-{index}, then write a plan." for index in range(24)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda task: agent.execute(task, mode="multi"), tasks))
+
+        for index, result in enumerate(results):
+            self.assertEqual(result["answer"], f"executor finished job-{index}")
+            for role, role_result in result["agent_results"].items():
+                self.assertEqual(role_result["answer"], f"{role} finished job-{index}")
+        self.assertEqual(agent.get_active_runs(), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+from seeker_o1.core.agent.handoff import HandoffCompactor, estimate_tokens
+
+FILLER = "It is a language that many people like to use for many things. "
+
+RESEARCH = (
+    "Python was created by Guido van Rossum and first released in 1991. "
+    + FILLER * 20
+    + "Ruby was created by Yukihiro Matsumoto in 1995.\n"
+    + "- Django is the most popular Python web framework.\n"
+    + "- Rails is the main Ruby framework.\n"
+    + "Some filler sentence about nothing in particular here. " * 15
+)
+
+class RecordingModel:
+    def __init__(self, reply):
+        self.reply = reply
+        self.prompts = []
+
+    def generate(self, prompt, **kwargs):
+        self.prompts.append((prompt, kwargs))
+        return self.reply
+
+class TestHandoffCompactor(unittest.TestCase):
+    def test_short_text_passes_through(self):
+        compactor = HandoffCompactor(model=RecordingModel("unused"))
+        self.assertEqual(compactor.compact("Short answer.", "researcher"), "Short answer.")
+        self.assertEqual(compactor.get_stats()["passthrough"], 1)
+
+    def test_extractive_selection_keeps_facts_within_budget(self):
+        model = RecordingModel("unused")
+        compactor = HandoffCompactor(budgets={"researcher": 120}, model=model)
+        compacted = compactor.compact(RESEARCH, "researcher", query="Compare the history of Python and Ruby")
+
+        self.assertLessEqual(estimate_tokens(compacted), 120)
+        for fact in ("1991", "Yukihiro Matsumoto", "Django", "Rails"):
+            self.assertIn(fact, compacted)
+        # The repeated filler sentence is kept at most once
+        self.assertLessEqual(compacted.count("many people like"), 1)
+        self.assertIn("[...]", compacted)
+        self.assertEqual(model.prompts, [])
+        self.assertEqual(compactor.get_stats()["extractive"], 1)
+
+    def test_sentences_stay_in_original_order(self):
+        compactor = HandoffCompactor(budgets={"planner": 60}, llm_fallback=False)
+        text = "Step 1: load 10 files. " + FILLER * 10 + "Step 2: merge the results into 1 report."
+        compacted = compactor.compact(text, "planner")
+        self.assertLess(compacted.index("Step 1"), compacted.index("Step 2"))
+
+    def test_model_only_used_when_no_sentence_fits(self):
+        model = RecordingModel("A short summary of the data.")
+        compactor = HandoffCompactor(budgets={"executor": 50}, model=model)
+        blob = "x" * 1000
+        self.assertEqual(compactor.compact(blob, "executor", query="task"), "A short summary of the data.")
+        self.assertEqual(len(model.prompts), 1)
+        self.assertEqual(model.prompts[0][1]["max_tokens"], 50)
+
+        compactor = HandoffCompactor(budgets={"executor": 50}, llm_fallback=False)
+        truncated = compactor.compact(blob, "executor")
+        self.assertLessEqual(estimate_tokens(truncated), 50)
+        self.assertEqual(compactor.get_stats()["truncated"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import time
+import unittest
+
+from seeker_o1.core.agent.hybrid_agent import HybridAgent
+from seeker_o1.core.agent.tool_agent import ToolAgent
+
+class TimedAgent(ToolAgent):
+    """Stands in for a specialized agent: sleeps, then echoes its prompt."""
+
+    def __init__(self, name, delay, calls, signals=None):
+        super().__init__(name=name)
+        self.delay = delay
+        self.calls = calls
+        self.signals = signals or {}
+
+    def execute(self, task, **kwargs):
+        start = time.time()
+        time.sleep(self.delay)
+        self.calls.append((self.name, task, start, time.time()))
+        return {"task": task, "answer": f"{self.name} done", **self.signals}
+
+class TimedHybridAgent(HybridAgent):
+    def __init__(self, delays, **kwargs):
+        super().__init__(name="hybrid", **kwargs)
+        self.calls = []
+        self.delays = delays
+        self.specialized_agents = {
+            role: TimedAgent(role, delay, self.calls) for role, delay in delays.items()
+        }
+
+    def _clone_role_agent(self, role, index):
+        return TimedAgent(f"{role}-{index}", self.delays.get(f"{role}-{index}", self.delays[role]), self.calls)
+
+class SpeculativeHybridAgent(TimedHybridAgent):
+    """Answers single-agent calls with a fixed string instead of a model call."""
+
+    def __init__(self, delays, single_answer, **kwargs):
+        super().__init__(delays, **kwargs)
+        self.single_answer = single_answer
+
+    def _execute_single_agent(self, task):
+        time.sleep(0.05)
+        return {"task": task, "answer": self.single_answer, "mode": "single"}
+
+TASK = "Find the history of Python and then compare it with Ruby. Also list the most popular web frameworks."
+
+class TestConcurrentPipeline(unittest.TestCase):
+    def test_research_fans_out_and_planner_starts_on_partial_research(self):
+        delays = {"researcher": 0.05, "researcher-1": 0.3, "researcher-2": 0.3,
+                  "planner": 0.05, "executor": 0.05, "critic": 0.05}
+        agent = TimedHybridAgent(delays, multi_agent={"pipeline": "concurrent", "research_fanout": 3})
+        start = time.time()
+        result = agent._execute_multi_agent(TASK)
+        elapsed = time.time() - start
+
+        research = result["agent_results"]["researcher"]
+        self.assertEqual(len(research["subqueries"]), 3)
+        # Sub-queries ran in parallel, so the whole run is far below the 0.85s sequential sum
+        self.assertLess(elapsed, 0.6)
+
+        calls = {name: (task, started, finished) for name, task, started, finished in agent.calls}
+        self.assertLess(calls["planner"][1], calls["researcher-1"][2])
+        self.assertIn("Additional research", calls["executor"][0])
+
+        for role in ("researcher", "planner", "executor", "critic"):
+            self.assertIn("elapsed", result["agent_results"][role])
+            self.assertIn("started", result["agent_results"][role])
+        self.assertEqual(result["answer"], "executor done")
+        self.assertEqual(result["mode"], "multi")
+
+    def test_sequential_pipeline_reports_timings(self):
+        delays = {role: 0.01 for role in ("researcher", "planner", "executor", "critic")}
+        agent = TimedHybridAgent(delays, multi_agent={"pipeline": "sequential"})
+        result = agent._execute_multi_agent(TASK)
+        self.assertEqual([call[0] for call in agent.calls], ["researcher", "planner", "executor", "critic"])
+        self.assertGreater(result["agent_results"]["critic"]["started"],
+                           result["agent_results"]["researcher"]["started"])
+
+    def test_split_research_queries(self):
+        self.assertEqual(HybridAgent._split_research_queries("tell me a joke", 3), ["tell me a joke"])
+        parts = HybridAgent._split_research_queries("Search A for x. Search B for y. Search C for z. Search D for w.", 3)
+        self.assertEqual(parts, ["Search A for x.", "Search B for y.", "Search C for z. Search D for w."])
+
+class TestEarlyExit(unittest.TestCase):
+    DELAYS = {role: 0.01 for role in ("researcher", "planner", "executor", "critic")}
+
+    def test_critic_skipped_for_deterministic_result(self):
+        for pipeline in ("concurrent", "sequential"):
+            agent = TimedHybridAgent(self.DELAYS, multi_agent={"pipeline": pipeline})
+            agent.specialized_agents["executor"].signals = {"deterministic": True, "confidence": 1.0}
+            result = agent._execute_multi_agent(TASK)
+            self.assertEqual(result["skipped_stages"], ["critic"])
+            self.assertNotIn("critic", [call[0] for call in agent.calls])
+            self.assertEqual(agent.get_early_exit_stats(), {"runs": 1, "planner_skipped": 0, "critic_skipped": 1})
+
+    def test_critic_runs_below_confidence_threshold(self):
+        agent = TimedHybridAgent(self.DELAYS, multi_agent={"early_exit": {"critic_confidence": 0.8}})
+        agent.specialized_agents["executor"].signals = {"confidence": 0.5}
+        self.assertEqual(agent._execute_multi_agent(TASK)["skipped_stages"], [])
+        agent.specialized_agents["executor"].signals = {"confidence": 0.8}
+        self.assertEqual(agent._execute_multi_agent(TASK)["skipped_stages"], ["critic"])
+
+    def test_planner_skipped_for_single_tool_task(self):
+        for pipeline in ("concurrent", "sequential"):
+            agent = TimedHybridAgent(self.DELAYS, multi_agent={"pipeline": pipeline})
+            agent.specialized_agents["executor"].load_tool("text")
+            result = agent._execute_multi_agent("reverse 'hello world'")
+            self.assertEqual(result["skipped_stages"], ["planner"])
+            self.assertEqual([call[0] for call in agent.calls], ["researcher", "executor", "critic"])
+
+            # Multi-part tasks and disabled early exit keep the planner
+            self.assertEqual(agent._execute_multi_agent(TASK)["skipped_stages"], [])
+            agent.multi_agent_config["early_exit"] = {"enabled": False}
+            self.assertEqual(agent._execute_multi_agent("reverse 'hello world'")["skipped_stages"], [])
+
+class TestSpeculativeExecution(unittest.TestCase):
+    DELAYS = {role: 0.1 for role in ("researcher", "planner", "executor", "critic")}
+
+    def test_accepted_single_answer_cancels_pipeline(self):
+        agent = SpeculativeHybridAgent(self.DELAYS, "Python was created by Guido van Rossum in 1991.")
+        result = agent.execute(TASK, mode="speculative")
+        self.assertEqual(result["mode"], "single")
+        self.assertEqual(result["speculation"]["winner"], "single")
+
+        # The pipeline stops before the planner once the single answer is accepted
+        time.sleep(0.3)
+        self.assertNotIn("planner", [call[0] for call in agent.calls])
+        stats = agent.get_speculation_stats()
+        self.assertEqual((stats["single_wins"], stats["multi_wins"]), (1, 0))
+
+    def test_rejected_single_answer_waits_for_pipeline(self):
+        agent = SpeculativeHybridAgent(self.DELAYS, "I'm sorry, I cannot help with that.")
+        result = agent.execute(TASK, mode="speculative")
+        self.assertEqual(result["mode"], "multi")
+        self.assertEqual(result["answer"], "executor done")
+        self.assertEqual(result["speculation"]["winner"], "multi")
+
+        stats = agent.get_speculation_stats()
+        self.assertEqual(stats["multi_wins"], 1)
+        self.assertIsNotNone(stats["mean_multi_elapsed"])
+        self.assertEqual(sum(bucket["multi"] for bucket in stats["by_complexity"].values()), 1)
+
+    def test_auto_mode_races_only_when_enabled(self):
+        agent = SpeculativeHybridAgent(
+            self.DELAYS, "Short?", multi_agent={"speculative": {"enabled": True, "min_answer_length": 3}}
+        )
+        result = agent.execute(TASK)
+        self.assertEqual(result["speculation"]["winner"], "multi")
+
+        agent = SpeculativeHybridAgent(self.DELAYS, "A long enough answer to accept.")
+        result = agent.execute(TASK)
+        self.assertNotIn("speculation", result)
+        self.assertEqual(agent.get_speculation_stats()["runs"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
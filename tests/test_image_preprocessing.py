@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from PIL import Image, ImageDraw, JpegImagePlugin
+
+from seeker_o1.models.image_preprocessing import (
+    CAPTION_SIZE, DecodedImage, load_image, prepare_for_caption, prepare_for_ocr
+)
+
+class TestImagePreprocessing(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def save(self, image, name, **params):
+        path = os.path.join(self.tmpdir.name, name)
+        image.save(path, **params)
+        return path
+
+    def test_large_jpegs_are_decoded_in_draft_mode(self):
+        path = self.save(Image.new("RGB", (2000, 1000), "gray"), "large.jpg", quality=90)
+        draft = JpegImagePlugin.JpegImageFile.draft
+        with mock.patch.object(JpegImagePlugin.JpegImageFile, "draft", autospec=True, side_effect=draft) as spy:
+            image = load_image(path, max_side=300)
+        spy.assert_called_once()
+        self.assertEqual(spy.call_args.args[2], (300, 150))
+        self.assertEqual(image.size, (300, 150))
+
+        with mock.patch.object(JpegImagePlugin.JpegImageFile, "draft", autospec=True, side_effect=draft) as spy:
+            self.assertEqual(load_image(path).size, (2000, 1000))
+        spy.assert_not_called()
+
+    def test_exif_orientation_is_applied(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotated 90 degrees clockwise
+        path = self.save(Image.new("RGB", (40, 20), "white"), "rotated.jpg", exif=exif.tobytes())
+        self.assertEqual(load_image(path).size, (20, 40))
+        self.assertEqual(load_image(path, max_side=10).size, (5, 10))
+
+    def test_images_are_bounded_to_the_longest_side(self):
+        path = self.save(Image.new("RGB", (1000, 500), "white"), "wide.png")
+        self.assertEqual(load_image(path, max_side=256).size, (256, 128))
+        self.assertEqual(load_image(path, max_side=4000).size, (1000, 500))
+        self.assertEqual(prepare_for_caption(Image.new("RGBA", (800, 1600))).size, (CAPTION_SIZE // 2, CAPTION_SIZE))
+        self.assertEqual(prepare_for_ocr(Image.new("RGB", (3000, 1500)), max_side=1000).size, (1000, 500))
+
+    def test_binarisation_is_opt_in_and_evens_out_lighting(self):
+        # Text on a background that darkens from left to right
+        image = Image.linear_gradient("L").rotate(90).resize((200, 100)).point(lambda value: 255 - value // 2)
+        draw = ImageDraw.Draw(image)
+        draw.rectangle((20, 40, 30, 60), fill=0)
+        draw.rectangle((170, 40, 180, 60), fill=60)
+
+        gray = prepare_for_ocr(image)
+        self.assertEqual(gray.mode, "L")
+        self.assertEqual(DecodedImage(image).for_ocr().mode, "L")
+
+        bilevel = prepare_for_ocr(image, binarize=True)
+        self.assertEqual(bilevel.mode, "1")
+        self.assertEqual(bilevel.getpixel((25, 50)), 0)
+        self.assertEqual(bilevel.getpixel((175, 50)), 0)
+        # Both ends of the background come out white
+        self.assertEqual(bilevel.getpixel((5, 5)), 255)
+        self.assertEqual(bilevel.getpixel((195, 95)), 255)
+
+if __name__ == "__main__":
+    unittest.main()
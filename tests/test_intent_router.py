@@ -0,0 +1,92 @@
+import re
+import threading
+import unittest
+
+from seeker_o1.core.agent.intent_router import IntentRouter
+from seeker_o1.core.agent.tool_agent import ToolAgent
+
+class TestIntentRouter(unittest.TestCase):
+    def test_priority_wins_over_leftmost_match(self):
+        router = IntentRouter()
+        router.register("search", r"find\s+(.+)", lambda query: {"query": query}, priority=20)
+        router.register("calculator", r"calculate\s+(.+)$", lambda expr: {"expression": expr}, priority=10)
+        self.assertEqual(
+            router.route("find a way to calculate 2 + 2"),
+            ("calculator", {"expression": "2 + 2"})
+        )
+        self.assertEqual(router.route("find cats"), ("search", {"query": "cats"}))
+        self.assertIsNone(router.route("tell me a joke"))
+
+    def test_ties_keep_registration_order_and_groups_are_per_intent(self):
+        router = IntentRouter()
+        router.register("first", r"(a)(b)?c", lambda a, b: {"a": a, "b": b})
+        router.register("second", r"x(y)", lambda y: {"y": y})
+        self.assertEqual(router.route("xy ac"), ("first", {"a": "a", "b": None}))
+        self.assertEqual(router.route("xy"), ("second", {"y": "y"}))
+
+    def test_flags_are_scoped_to_their_intent(self):
+        router = IntentRouter()
+        router.register("code", r"run\s+```(.+?)```", lambda code: {"code": code}, flags=re.DOTALL)
+        router.register("line", r"say\s+(.+)$", lambda text: {"text": text})
+        self.assertEqual(router.route("run ```a\nb```"), ("code", {"code": "a\nb"}))
+        self.assertIsNone(router.route("say hello\nworld"))
+        with self.assertRaises(ValueError):
+            router.register("bad", r"x", lambda: {}, flags=re.ASCII)
+
+    def test_route_all_keeps_unrouted_clauses_with_their_neighbour(self):
+        router = IntentRouter()
+        router.register("search", r"search\s+for\s+(.+)", lambda query: {"query": query}, priority=20)
+        router.register("calculator", r"calculate\s+(.+)$", lambda expr: {"expression": expr}, priority=10)
+        self.assertEqual(router.route_all("search for salt and pepper and calculate 2+2"), [
+            ("search", {"query": "salt and pepper"}),
+            ("calculator", {"expression": "2+2"}),
+        ])
+        self.assertEqual(router.route_all("search for salt and pepper"), [("search", {"query": "salt and pepper"})])
+        self.assertEqual(router.route_all("tell me a joke"), [])
+
+    def test_concurrent_routes_while_registering(self):
+        router = IntentRouter()
+        router.register("calculator", r"calculate\s+(.+)$", lambda expr: {"expression": expr})
+        errors = []
+        done = threading.Event()
+
+        def route():
+            try:
+                while not done.is_set():
+                    self.assertEqual(router.route("calculate 2+2"), ("calculator", {"expression": "2+2"}))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=route) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for index in range(200):
+            router.register(f"tool{index}", rf"word{index}\s+(\w+)", lambda word: {"word": word}, priority=200)
+        done.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(router.route("word199 cats"), ("tool199", {"word": "cats"}))
+
+class TestToolAgentRouting(unittest.TestCase):
+    def test_decisions_from_tool_intents(self):
+        agent = ToolAgent(name="router-test", tools=["calculator", "text", "code"])
+        self.assertEqual(agent._decide_action({"task": "Calculate 2 + 2"}), ("calculator", {"expression": "2 + 2"}))
+        self.assertEqual(
+            agent._decide_action({"task": "reverse 'Stressed'"}),
+            ("text", {"text": "stressed", "operation": "reverse"})
+        )
+        self.assertEqual(
+            agent._decide_action({"task": "run code ```python\nprint(1)\n```"}),
+            ("code", {"code": "print(1)"})
+        )
+        self.assertEqual(agent._decide_action({"task": "hello"})[0], "dummy_action")
+
+    def test_router_is_rebuilt_when_tools_change(self):
+        agent = ToolAgent(name="router-test")
+        self.assertEqual(agent._decide_action({"task": "calculate 1 + 1"})[0], "dummy_action")
+        agent.load_tool("calculator")
+        self.assertEqual(agent._decide_action({"task": "calculate 1 + 1"})[0], "calculator")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ["torch", "transformers", "pytesseract", "PIL", "openai", "yaml", "rich.syntax"]
+
+def modules_loaded_by(statement):
+    code = f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))"
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, cwd=REPO_ROOT)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr)
+    return set(json.loads(completed.stdout.strip().splitlines()[-1]))
+
+class TestLazyImports(unittest.TestCase):
+    def test_cli_entry_point_does_not_load_heavy_dependencies(self):
+        loaded = modules_loaded_by("import seeker_o1.main")
+        self.assertEqual([name for name in HEAVY_MODULES if name in loaded], [])
+
+    def test_orchestrator_does_not_load_vision_stack(self):
+        loaded = modules_loaded_by("from seeker_o1.core.orchestrator import AgentOrchestrator")
+        self.assertNotIn("torch", loaded)
+        self.assertNotIn("seeker_o1.models.vision_model", loaded)
+
+    def test_vision_model_module_does_not_load_torch(self):
+        loaded = modules_loaded_by("import seeker_o1.models.vision_model")
+        self.assertNotIn("torch", loaded)
+        self.assertNotIn("transformers", loaded)
+
+if __name__ == "__main__":
+    unittest.main()
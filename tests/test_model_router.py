@@ -0,0 +1,76 @@
+import unittest
+
+from seeker_o1.core.agent.hybrid_agent import HybridAgent
+from seeker_o1.models.base.base_model import BaseModel
+from seeker_o1.models.model_router import ModelRouter
+
+class FakeModel(BaseModel):
+    """Records generate calls instead of calling an API."""
+
+    instances = 0
+
+    def __init__(self, model_name="fake-large", **kwargs):
+        super().__init__(model_name, **kwargs)
+        FakeModel.instances += 1
+        self.calls = []
+
+    def generate(self, prompt, **kwargs):
+        self.calls.append(kwargs)
+        return f"{self.model_name} answer"
+
+    def generate_with_tools(self, prompt, tools, **kwargs):
+        return {"content": self.generate(prompt, **kwargs), "tool_calls": []}
+
+    def extract_json(self, prompt, **kwargs):
+        return {}
+
+    def get_embedding(self, text, **kwargs):
+        return []
+
+def fake_router():
+    router = ModelRouter({"provider": "fake", "model_name": "fake-large"})
+    router.register_model_class("fake", FakeModel)
+    return router
+
+class TestModelRouter(unittest.TestCase):
+    def test_models_are_cached_by_config(self):
+        router = fake_router()
+        FakeModel.instances = 0
+        small = router.resolve_model({"name": "fake-small"})
+        self.assertEqual(small.model_name, "fake-small")
+        self.assertIs(router.resolve_model({"name": "fake-small"}), small)
+        self.assertIs(router.resolve_model(None), router.get_default_model())
+        self.assertEqual(FakeModel.instances, 2)
+
+class TestRoleConfiguration(unittest.TestCase):
+    def test_roles_get_their_own_model_budget_and_timeout(self):
+        router = fake_router()
+        agent = HybridAgent(name="hybrid", model_router=router, result_cache={"enabled": False})
+        agent.configure_specialized_agent("critic", {
+            "name": "critic-agent",
+            "model": {"name": "fake-small"},
+            "max_tokens": 50,
+            "timeout": 5,
+            "max_iterations": 1
+        })
+
+        critic = agent.get_specialized_agent("critic")
+        self.assertEqual(critic.name, "critic-agent")
+        result = critic.execute("tell me a story")
+        self.assertEqual(result["answer"], "fake-small answer")
+        self.assertEqual(critic._get_model().calls, [{"max_tokens": 50, "timeout": 5}])
+
+        # Unconfigured roles use the default model; parallel copies share the role's model
+        self.assertIs(agent.get_specialized_agent("researcher")._get_model(), router.get_default_model())
+        self.assertIs(agent._clone_role_agent("critic", 1)._get_model(), critic._get_model())
+
+    def test_reconfiguring_replaces_the_agent(self):
+        agent = HybridAgent(name="hybrid", model_router=fake_router(), result_cache={"enabled": False})
+        first = agent.get_specialized_agent("planner")
+        agent.configure_specialized_agent("planner", {"max_iterations": 3})
+        second = agent.get_specialized_agent("planner")
+        self.assertIsNot(first, second)
+        self.assertEqual(second.max_iterations, 3)
+
+if __name__ == "__main__":
+    unittest.main()
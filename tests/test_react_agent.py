@@ -0,0 +1,274 @@
+import threading
+import time
+import unittest
+
+from seeker_o1.core.agent.react_agent import FINAL_ANSWER_ACTION, ReactAgent
+from seeker_o1.core.agent.tool_agent import ToolAgent
+from seeker_o1.models.base.base_model import BaseModel
+from seeker_o1.models.model_router import ModelRouter
+
+class RecordingModel(BaseModel):
+    """Records prompts and answers each with a fixed string."""
+
+    def __init__(self, model_name="fake", **kwargs):
+        super().__init__(model_name, **kwargs)
+        self.prompts = []
+
+    def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return "model answer"
+
+    def generate_with_tools(self, prompt, tools, **kwargs):
+        return {"content": self.generate(prompt, **kwargs), "tool_calls": []}
+
+    def extract_json(self, prompt, **kwargs):
+        return {}
+
+    def get_embedding(self, text, **kwargs):
+        return []
+
+def recording_router(model):
+    router = ModelRouter({"provider": "fake", "model_name": "fake"})
+    router.register_model_class("fake", lambda **config: model)
+    return router
+
+class ScriptedAgent(ReactAgent):
+    """Takes actions from a script and returns canned observations."""
+
+    def __init__(self, actions, observations, **kwargs):
+        super().__init__(name="scripted", **kwargs)
+        self.script = list(actions)
+        self.canned = list(observations)
+        self.executed = 0
+
+    def _decide_action(self, context):
+        return self.script[min(self.current_iteration, len(self.script) - 1)]
+
+    def _execute_action(self, action_name, action_input):
+        observation = self.canned[min(self.executed, len(self.canned) - 1)]
+        self.executed += 1
+        return observation
+
+    def _generate_final_answer(self, context):
+        return "generated"
+
+class TestTermination(unittest.TestCase):
+    def test_stops_on_successful_observation(self):
+        agent = ScriptedAgent([("lookup", {"q": "a"})], [{"status": "success", "result": 1}])
+        result = agent.execute("task")
+        self.assertEqual(agent.executed, 1)
+        self.assertEqual(result["termination_reason"], "success")
+        self.assertEqual(result["iterations_saved"], 9)
+
+    def test_non_terminal_success_continues(self):
+        agent = ScriptedAgent(
+            [("lookup", {"q": "a"}), ("lookup", {"q": "b"})],
+            [{"status": "success", "terminal": False}, {"status": "success"}]
+        )
+        result = agent.execute("task")
+        self.assertEqual(agent.executed, 2)
+        self.assertEqual(result["iterations_saved"], 8)
+
+    def test_stops_on_repeated_action(self):
+        agent = ScriptedAgent([("lookup", {"q": "a"})], [{"status": "error", "error": "down"}])
+        result = agent.execute("task")
+        self.assertEqual(agent.executed, 2)
+        self.assertEqual(result["termination_reason"], "repeated_action")
+        self.assertEqual(len(result["context"]["observations"]), 2)
+
+    def test_final_answer_action_is_not_executed(self):
+        agent = ScriptedAgent(
+            [("lookup", {"q": "a"}), (FINAL_ANSWER_ACTION, {"answer": "42"})],
+            [{"status": "error", "error": "down"}]
+        )
+        result = agent.execute("task")
+        self.assertEqual(agent.executed, 1)
+        self.assertEqual(result["answer"], "42")
+        self.assertEqual(result["termination_reason"], "final_answer")
+
+    def test_max_iterations_still_bounds_the_loop(self):
+        script = [("lookup", {"q": index}) for index in range(5)]
+        agent = ScriptedAgent(script, [{"status": "error"}], max_iterations=3)
+        result = agent.execute("task")
+        self.assertEqual(agent.executed, 3)
+        self.assertEqual(result["termination_reason"], "max_iterations")
+        self.assertEqual(result["iterations_saved"], 0)
+
+class SlowBatchAgent(ReactAgent):
+    """Decides several actions per iteration; each one sleeps before answering."""
+
+    def __init__(self, batch, **kwargs):
+        super().__init__(name="batch", **kwargs)
+        self.batch = batch
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _decide_actions(self, context):
+        return self.batch
+
+    def _execute_action(self, action_name, action_input):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(action_input["delay"])
+        with self.lock:
+            self.running -= 1
+        return {"status": "success", "result": action_name}
+
+    def _generate_final_answer(self, context):
+        self.answer_calls = getattr(self, "answer_calls", 0) + 1
+        size = context["batch_sizes"][-1]
+        return "\n\n".join(observation["result"] for observation in context["observations"][-size:])
+
+class PartlyTemplatedAgent(ReactAgent):
+    """Runs two lookups and a calculation at once; only the calculation has a template."""
+
+    def _decide_actions(self, context):
+        return [("lookup", {"q": "a"}), ("calc", {"expression": "2 + 2"}), ("lookup", {"q": "b"})]
+
+    def _execute_action(self, action_name, action_input):
+        if action_name == "calc":
+            return {"status": "success", "result": 4}
+        return {"status": "success", "result": f"page {action_input['q']}"}
+
+    def _format_observation(self, action_name, observation):
+        return f"The result is {observation['result']}" if action_name == "calc" else None
+
+class TestParallelActions(unittest.TestCase):
+    def test_actions_run_concurrently_and_fold_in_call_order(self):
+        batch = [("slow", {"delay": 0.2}), ("fast", {"delay": 0.01}), ("medium", {"delay": 0.1})]
+        agent = SlowBatchAgent(batch)
+        start = time.time()
+        result = agent.execute("task")
+        self.assertLess(time.time() - start, 0.3)
+        self.assertEqual(agent.peak, 3)
+        self.assertEqual([observation["result"] for observation in result["context"]["observations"]],
+                         ["slow", "fast", "medium"])
+        self.assertEqual(result["answer"], "slow\n\nfast\n\nmedium")
+        self.assertEqual(agent.answer_calls, 1)
+        self.assertEqual(result["iterations_saved"], 9)
+
+    def test_untemplated_parts_share_one_model_call(self):
+        model = RecordingModel()
+        agent = PartlyTemplatedAgent(name="partly", model_router=recording_router(model))
+        result = agent.execute("look up a and b and add 2 + 2")
+        self.assertEqual(result["llm_calls"], 1)
+        self.assertEqual(len(model.prompts), 1)
+        self.assertEqual(result["answer"], "model answer\n\nThe result is 4")
+        # The model sees the untemplated observations, not the templated one
+        self.assertIn("page a", model.prompts[0])
+        self.assertIn("page b", model.prompts[0])
+        self.assertNotIn("calc", model.prompts[0])
+
+    def test_pool_is_bounded(self):
+        agent = SlowBatchAgent([(f"a{index}", {"delay": 0.05}) for index in range(4)], max_parallel_actions=2)
+        agent.execute("task")
+        self.assertEqual(agent.peak, 2)
+
+    def test_tool_agent_splits_clauses_across_tools(self):
+        agent = ToolAgent(name="tools", tools=["calculator", "text"])
+        actions = agent._decide_actions({"task": "Calculate 2 + 2 and reverse 'abc'"})
+        self.assertEqual(actions, [("calculator", {"expression": "2 + 2"}),
+                                   ("text", {"text": "abc", "operation": "reverse"})])
+        self.assertEqual(agent._decide_actions({"task": "calculate 2 + 2"}), [("calculator", {"expression": "2 + 2"})])
+
+        agent.config["parallel_actions"] = False
+        self.assertEqual(len(agent._decide_actions({"task": "Calculate 2 + 2 and reverse 'abc'"})), 1)
+
+class CountingAgent(ReactAgent):
+    """Runs a different, failing lookup every iteration with a large observation."""
+
+    def _decide_action(self, context):
+        return "lookup", {"page": self.current_iteration}
+
+    def _execute_action(self, action_name, action_input):
+        return {"status": "success", "terminal": False, "result": "x" * 5000}
+
+    def _generate_final_answer(self, context):
+        return context["observations"][-1]["result"][:10]
+
+class TestContextCompaction(unittest.TestCase):
+    def test_context_stays_flat_and_large_observations_are_referenced(self):
+        sizes = {}
+        for iterations in (20, 60):
+            agent = CountingAgent(name="counting", max_iterations=iterations)
+            result = agent.execute("read every page")
+            context = result["context"]
+            self.assertEqual(len(context["batch_sizes"]), 3)
+            self.assertEqual(context["steps_folded"], iterations - 3)
+            self.assertEqual(result["iterations_saved"], 0)
+            self.assertTrue(all("ref" in observation for observation in context["observations"]))
+            # The final answer sees the full stored observation
+            self.assertEqual(result["answer"], "x" * 10)
+            sizes[iterations] = len(agent.render_context(context))
+        # Once the summary reaches its cap, longer runs do not grow the prompt
+        self.assertLess(abs(sizes[60] - sizes[20]), 0.1 * sizes[20])
+
+    def test_summary_is_capped(self):
+        agent = CountingAgent(name="counting", max_iterations=30,
+                              context_compaction={"max_summary_chars": 600, "keep_steps": 2})
+        context = agent.execute("read every page")["context"]
+        self.assertLessEqual(sum(len(line) for line in context["summary"]), 600)
+        self.assertTrue(context["summary"][-1].startswith("Step 28:"))
+
+    def test_model_prompt_is_the_compacted_context(self):
+        model = RecordingModel()
+
+        class ModelCountingAgent(CountingAgent):
+            _generate_final_answer = ReactAgent._generate_final_answer
+
+        agent = ModelCountingAgent(name="counting", max_iterations=8, model_router=recording_router(model))
+        result = agent.execute("read every page")
+        self.assertEqual(result["answer"], "model answer")
+        self.assertEqual(len(model.prompts), 1)
+        prompt = model.prompts[0]
+        self.assertTrue(prompt.startswith("Task: read every page"))
+        self.assertIn("Earlier steps:\nStep 1:", prompt)
+        self.assertEqual(prompt.count("Observation:"), 3)
+        # Observations stored by reference reach the model in full
+        self.assertIn("x" * 5000, prompt)
+
+    def test_compaction_can_be_disabled(self):
+        agent = CountingAgent(name="counting", max_iterations=6, context_compaction={"enabled": False})
+        context = agent.execute("read every page")["context"]
+        self.assertEqual(len(context["batch_sizes"]), 6)
+        self.assertEqual(context["summary"], [])
+
+class OfflineToolAgent(ToolAgent):
+    """Counts model calls and answers them with a fixed string."""
+
+    def _generate_with_model(self, context):
+        context["llm_calls"] = context.get("llm_calls", 0) + 1
+        return "model answer"
+
+class TestAnswerTemplates(unittest.TestCase):
+    def test_deterministic_results_are_answered_without_a_model(self):
+        agent = OfflineToolAgent(name="tools", tools=["calculator", "text"])
+        result = agent.execute("calculate 2 + 2")
+        self.assertEqual(result["answer"], "The result of 2 + 2 is 4")
+        self.assertEqual(result["llm_calls"], 0)
+
+        result = agent.execute("Calculate 2 + 2 and reverse 'abc'")
+        self.assertEqual(result["answer"], "The result of 2 + 2 is 4\n\nI processed 'abc' with reverse operation:\n\ncba")
+        self.assertEqual(result["llm_calls"], 0)
+
+    def test_calculator_error_is_templated(self):
+        agent = OfflineToolAgent(name="tools", tools=["calculator"])
+        result = agent.execute("calculate 1 / 0")
+        self.assertTrue(result["answer"].startswith("Calculator error:"))
+        self.assertEqual(result["llm_calls"], 0)
+
+    def test_model_is_called_without_a_template(self):
+        agent = OfflineToolAgent(name="tools", tools=["calculator"], max_iterations=2)
+        agent.execute("calculate 3 * 3")
+        result = agent.execute("tell me a story")
+        self.assertEqual(result["answer"], "model answer")
+        self.assertEqual(result["llm_calls"], 1)
+
+        stats = agent.get_answer_stats()
+        self.assertEqual((stats["tasks"], stats["llm_free"], stats["llm_calls"]), (2, 1, 1))
+        self.assertEqual(stats["llm_free_percent"], 50.0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,203 @@
+import threading
+import time
+import unittest
+
+from seeker_o1.core.agent.hybrid_agent import HybridAgent
+from seeker_o1.core.agent.result_cache import ResultCache, normalize_task
+from seeker_o1.models.base.base_model import ERROR_ANSWER_PREFIX, BaseModel
+from seeker_o1.models.model_router import ModelRouter
+
+def bag_of_words(text):
+    """Embeds a text as word counts over a small vocabulary."""
+    vocabulary = ["what", "is", "the", "capital", "of", "france", "city", "main", "calculate", "sum", "weather"]
+    words = text.replace("?", " ").split()
+    return [float(words.count(word)) for word in vocabulary]
+
+class CountingHybridAgent(HybridAgent):
+    """Answers single-agent calls without a model and counts them."""
+
+    def __init__(self, **kwargs):
+        super().__init__(name="hybrid", **kwargs)
+        self.runs = 0
+
+    def _execute_single_agent(self, task):
+        self.runs += 1
+        return {"task": task, "answer": f"answer {self.runs}", "mode": "single"}
+
+class FailingModel(BaseModel):
+    """Fails every call the way OpenAIModel does: with an error answer."""
+
+    calls = 0
+
+    def generate(self, prompt, **kwargs):
+        FailingModel.calls += 1
+        return f"{ERROR_ANSWER_PREFIX}Connection error."
+
+    def generate_with_tools(self, prompt, tools, **kwargs):
+        return {"content": self.generate(prompt), "tool_calls": []}
+
+    def extract_json(self, prompt, **kwargs):
+        return {}
+
+    def get_embedding(self, text, **kwargs):
+        return []
+
+class TestResultCache(unittest.TestCase):
+    def test_normalization_ignores_case_and_spacing(self):
+        self.assertEqual(normalize_task("Calculate 2 + 2"), normalize_task("calculate 2+2"))
+        self.assertEqual(normalize_task("  What is   the capital of France? "), "what is the capital of france")
+        self.assertNotEqual(normalize_task("calculate 2+2"), normalize_task("calculate 2+3"))
+
+    def test_normalization_keeps_quoted_literals(self):
+        self.assertNotEqual(normalize_task("count characters in 'a , b'"), normalize_task("count characters in 'a,b'"))
+        self.assertNotEqual(normalize_task('reverse "ABC"'), normalize_task('reverse "abc"'))
+        self.assertEqual(normalize_task("Count  characters in 'a , b'."), "count characters in 'a , b'")
+        self.assertEqual(normalize_task("what's 2 + 2"), "what's 2+2")
+
+    def test_exact_hit_is_marked_and_keyed_by_mode(self):
+        cache = ResultCache()
+        self.assertTrue(cache.store("Calculate 2 + 2", "single", {"task": "Calculate 2 + 2", "answer": "4"}))
+
+        hit = cache.lookup("calculate 2+2", "single")
+        self.assertEqual(hit["answer"], "4")
+        self.assertEqual(hit["task"], "calculate 2+2")
+        self.assertEqual(hit["cached"]["tier"], "exact")
+        self.assertEqual(hit["cached"]["original_task"], "Calculate 2 + 2")
+        self.assertIsNone(cache.lookup("calculate 2+2", "multi"))
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["exact_hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_failed_results_are_not_stored(self):
+        cache = ResultCache()
+        self.assertFalse(cache.store("task", "auto", {"answer": ""}))
+        self.assertFalse(cache.store("task", "auto", {"answer": "x", "error": "boom"}))
+        self.assertIsNone(cache.lookup("task"))
+
+    def test_store_keeps_a_copy_and_does_not_wait_for_embeddings(self):
+        release = threading.Event()
+
+        def slow_embed(text):
+            release.wait(5)
+            return bag_of_words(text)
+
+        cache = ResultCache(semantic={"threshold": 0.75}, embed=slow_embed)
+        result = {"answer": "Paris", "sources": ["atlas"]}
+        start = time.time()
+        cache.store("What is the capital of France?", "auto", result)
+        self.assertLess(time.time() - start, 1)
+        result["answer"] = "changed"
+        result["sources"].append("changed")
+
+        hit = cache.lookup("What is the capital of France?", "auto")
+        self.assertEqual((hit["answer"], hit["sources"]), ("Paris", ["atlas"]))
+        hit["sources"].append("changed")
+        self.assertEqual(cache.lookup("What is the capital of France?", "auto")["sources"], ["atlas"])
+        release.set()
+        cache.flush()
+        self.assertEqual(cache.lookup("what is the main city of france", "auto")["answer"], "Paris")
+
+    def test_entries_expire(self):
+        cache = ResultCache(ttl=0.05)
+        cache.store("task", "auto", {"answer": "x"})
+        time.sleep(0.1)
+        self.assertIsNone(cache.lookup("task"))
+        self.assertEqual(cache.get_stats()["expired"], 1)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResultCache(max_entries=2)
+        cache.store("one", "auto", {"answer": "1"})
+        cache.store("two", "auto", {"answer": "2"})
+        cache.lookup("one")
+        cache.store("three", "auto", {"answer": "3"})
+        self.assertIsNone(cache.lookup("two"))
+        self.assertIsNotNone(cache.lookup("one"))
+
+    def test_semantic_hit_above_threshold(self):
+        cache = ResultCache(semantic={"threshold": 0.75}, embed=bag_of_words)
+        cache.store("What is the capital of France?", "auto", {"answer": "Paris"})
+        cache.flush()
+
+        hit = cache.lookup("what is the main city of france", "auto")
+        self.assertEqual(hit["answer"], "Paris")
+        self.assertEqual(hit["cached"]["tier"], "semantic")
+        self.assertGreaterEqual(hit["cached"]["similarity"], 0.75)
+        self.assertIsNone(cache.lookup("what is the weather", "auto"))
+        self.assertEqual(cache.get_stats()["semantic_hits"], 1)
+
+    def test_semantic_tier_never_matches_different_numbers(self):
+        cache = ResultCache(semantic={"threshold": 0.5}, embed=bag_of_words)
+        cache.store("calculate the sum of 2 and 2", "auto", {"answer": "4"})
+        cache.flush()
+        self.assertIsNone(cache.lookup("calculate the sum of 2 and 3", "auto"))
+        self.assertEqual(cache.lookup("calculate the sum of 2 and 2 please", "auto")["answer"], "4")
+
+    def test_transient_embedding_failure_skips_only_that_call(self):
+        failures = ["timeout"]
+
+        def flaky_embed(text):
+            if failures:
+                raise RuntimeError(failures.pop())
+            return bag_of_words(text)
+
+        cache = ResultCache(semantic={"threshold": 0.75}, embed=flaky_embed)
+        cache.store("what is the capital of france", "auto", {"answer": "Paris"})
+        cache.flush()
+        self.assertTrue(cache.semantic_enabled)
+        self.assertEqual(cache.get_stats()["embed_failures"], 1)
+        cache.store("what is the capital of spain", "auto", {"answer": "Madrid"})
+        cache.flush()
+        self.assertEqual(cache.lookup("tell me the capital of spain")["answer"], "Madrid")
+
+    def test_repeated_embedding_failures_disable_semantic_tier(self):
+        def failing_embed(text):
+            raise RuntimeError("no embeddings")
+
+        cache = ResultCache(semantic={"max_failures": 2}, embed=failing_embed)
+        cache.store("task", "auto", {"answer": "x"})
+        cache.flush()
+        self.assertTrue(cache.semantic_enabled)
+        cache.store("another task", "auto", {"answer": "y"})
+        cache.flush()
+        self.assertFalse(cache.semantic_enabled)
+        self.assertEqual(cache.lookup("Task")["cached"]["tier"], "exact")
+
+class TestHybridAgentResultCache(unittest.TestCase):
+    def test_repeated_task_is_answered_from_cache(self):
+        agent = CountingHybridAgent(result_cache={"semantic": {"enabled": False}})
+        first = agent.execute("Calculate 2 + 2", mode="single")
+        second = agent.execute("calculate 2+2", mode="single")
+
+        self.assertEqual(agent.runs, 1)
+        self.assertNotIn("cached", first)
+        self.assertEqual(second["answer"], first["answer"])
+        self.assertEqual(second["cached"]["tier"], "exact")
+        self.assertEqual(agent.get_result_cache_stats()["exact_hits"], 1)
+
+        agent.execute("calculate 2+2", mode="single", bypass_cache=True)
+        self.assertEqual(agent.runs, 2)
+
+    def test_failed_model_calls_are_not_cached(self):
+        router = ModelRouter({"provider": "failing", "model_name": "failing"})
+        router.register_model_class("failing", FailingModel)
+        agent = HybridAgent(name="hybrid", model_router=router, result_cache={"semantic": {"enabled": False}})
+        FailingModel.calls = 0
+
+        first = agent.execute("What is the capital of France?", mode="single")
+        self.assertEqual(first["error"], "Error: Connection error.")
+        second = agent.execute("What is the capital of France?", mode="single")
+        self.assertNotIn("cached", second)
+        self.assertEqual(FailingModel.calls, 2)
+        self.assertEqual(agent.get_result_cache_stats()["stores"], 0)
+        self.assertFalse(ResultCache().store("task", "auto", {"answer": "Error: timed out"}))
+
+    def test_cache_can_be_disabled(self):
+        agent = CountingHybridAgent(result_cache={"enabled": False})
+        agent.execute("Calculate 2 + 2", mode="single")
+        agent.execute("Calculate 2 + 2", mode="single")
+        self.assertEqual(agent.runs, 2)
+        self.assertEqual(agent.get_result_cache_stats(), {})
+
+if __name__ == "__main__":
+    unittest.main()
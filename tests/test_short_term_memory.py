@@ -0,0 +1,34 @@
+import time
+import unittest
+
+from seeker_o1.core.memory import ShortTermMemory
+
+class TestShortTermMemory(unittest.TestCase):
+    def test_add_returns_identifier(self):
+        memory = ShortTermMemory(capacity=100)
+        identifier = memory.add({"name": "fact", "value": 1})
+        self.assertEqual(memory.get(identifier), {"name": "fact", "value": 1})
+        self.assertEqual(memory.search({"name": "fact"})[0]["id"], identifier)
+        self.assertEqual(memory.get_all(), [{"name": "fact", "value": 1}])
+
+    def test_evicts_least_recently_used(self):
+        memory = ShortTermMemory(capacity=2)
+        first = memory.add({"name": "first"})
+        time.sleep(0.01)
+        second = memory.add({"name": "second"})
+        time.sleep(0.01)
+        memory.get(first)
+        third = memory.add("plain value")
+        self.assertIsNotNone(memory.get(first))
+        self.assertIsNone(memory.get(second))
+        self.assertEqual(memory.get(third), "plain value")
+
+    def test_expired_items_are_pruned(self):
+        memory = ShortTermMemory(capacity=100, ttl=0)
+        identifier = memory.add({"name": "old"})
+        time.sleep(0.01)
+        self.assertIsNone(memory.get(identifier))
+        self.assertEqual(memory.get_all(), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from seeker_o1.core.agent.hybrid_agent import HybridAgent
+from seeker_o1.core.agent.tool_agent import ToolAgent
+from seeker_o1.tools.base import ToolCollection
+from seeker_o1.tools.calculator import CalculatorTool
+from seeker_o1.tools.text import TextTool
+
+class TestFrozenToolCollection(unittest.TestCase):
+    def test_snapshot_is_read_only_and_shares_instances(self):
+        collection = ToolCollection()
+        calculator = CalculatorTool()
+        collection.register_tool(calculator)
+        collection.register_tool_class(TextTool)
+
+        snapshot = collection.snapshot()
+        self.assertTrue(snapshot.frozen)
+        self.assertIs(snapshot.get_tool("calculator"), calculator)
+        # Registered classes are instantiated up front
+        self.assertIsInstance(snapshot.tools["text"], TextTool)
+        with self.assertRaises(RuntimeError):
+            snapshot.register_tool(TextTool())
+        with self.assertRaises(TypeError):
+            snapshot.tools["other"] = calculator
+        self.assertFalse(collection.frozen)
+
+    def test_agent_copies_shared_collection_before_loading(self):
+        shared = ToolCollection()
+        shared.register_tool(CalculatorTool())
+        shared.freeze()
+        first = ToolAgent(name="first", tool_collection=shared, tools=["calculator"])
+        second = ToolAgent(name="second", tool_collection=shared)
+        self.assertIs(first.tools, shared)
+
+        self.assertTrue(second.load_tool("text"))
+        self.assertIsNot(second.tools, shared)
+        self.assertEqual(sorted(second.tools.tools), ["calculator", "text"])
+        self.assertEqual(list(shared.tools), ["calculator"])
+
+class TestLazySpecializedAgents(unittest.TestCase):
+    def test_agents_are_created_on_first_use_with_shared_tools(self):
+        agent = HybridAgent(name="hybrid", tools=["calculator", "text"])
+        self.assertEqual(agent.specialized_agents, {})
+
+        executor = agent.get_specialized_agent("executor")
+        critic = agent.get_specialized_agent("critic")
+        self.assertIs(agent.get_specialized_agent("executor"), executor)
+        self.assertIs(executor.tools, critic.tools)
+        self.assertTrue(executor.tools.frozen)
+        self.assertIs(executor.tools.get_tool("calculator"), agent.tools.get_tool("calculator"))
+        self.assertEqual(sorted(agent.specialized_agents), ["critic", "executor"])
+
+if __name__ == "__main__":
+    unittest.main()
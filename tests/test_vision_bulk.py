@@ -0,0 +1,139 @@
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from PIL import Image, ImageDraw
+
+from seeker_o1.models import vision_bulk
+from seeker_o1.models.vision_bulk import bulk_process, iter_image_paths, load_completed_paths
+from seeker_o1.models.vision_cache import VisionCache
+
+def make_image(path, shade):
+    image = Image.new("RGB", (64, 48), "white")
+    ImageDraw.Draw(image).rectangle([8, 8, 40, 30], fill=(shade, shade, shade))
+    image.save(path, "PNG")
+
+class LockedCache:
+    """A vision cache whose database is always locked."""
+
+    def lookup(self, path):
+        raise sqlite3.OperationalError("database is locked")
+
+    def store(self, path, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+class FlakyPool:
+    """Runs images in-process; the first pool dies on b.png and stays broken."""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.broken = False
+        FlakyPool.instances.append(self)
+
+    def submit(self, function, path):
+        if self.broken:
+            raise BrokenProcessPool("pool is broken")
+        future = Future()
+        if os.path.basename(path) == "b.png" and len(FlakyPool.instances) == 1:
+            self.broken = True
+            future.set_exception(BrokenProcessPool("worker died"))
+        else:
+            future.set_result({"path": path, "text": "ok", "timings": {}})
+        return future
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+class TestVisionBulk(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.image_dir = os.path.join(self.tmpdir.name, "scans")
+        os.makedirs(os.path.join(self.image_dir, "nested"))
+        self.paths = [
+            os.path.join(self.image_dir, "a.png"),
+            os.path.join(self.image_dir, "b.png"),
+            os.path.join(self.image_dir, "nested", "c.png"),
+        ]
+        for shade, path in enumerate(self.paths):
+            make_image(path, shade * 60)
+        with open(os.path.join(self.image_dir, "notes.txt"), "w") as f:
+            f.write("not an image")
+
+        # Pre-populate the cache so workers never need Tesseract or BLIP
+        self.cache_path = os.path.join(self.tmpdir.name, "cache.db")
+        cache = VisionCache(storage_path=self.cache_path)
+        for path in self.paths:
+            cache.store(path, text=f"text of {os.path.basename(path)}")
+        self.vision_config = {"cache": {"enabled": True, "storage_path": self.cache_path}}
+        self.output_path = os.path.join(self.tmpdir.name, "out", "results.jsonl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_iter_image_paths_directory_and_glob(self):
+        self.assertEqual(list(iter_image_paths(self.image_dir)), sorted(self.paths))
+        pattern = os.path.join(self.image_dir, "*.png")
+        self.assertEqual(list(iter_image_paths(pattern)), sorted(self.paths[:2]))
+
+    def test_load_completed_paths_ignores_failures_and_truncated_lines(self):
+        path = os.path.join(self.tmpdir.name, "partial.jsonl")
+        with open(path, "w") as f:
+            f.write(json.dumps({"path": "done.png", "text": "ok"}) + "\n")
+            f.write(json.dumps({"path": "failed.png", "error": "boom"}) + "\n")
+            f.write('{"path": "trunc')
+        self.assertEqual(load_completed_paths(path), {"done.png"})
+
+    def test_streams_records_and_resumes(self):
+        summary = bulk_process(self.image_dir, self.output_path, workers=2, max_in_flight=1,
+                               caption=False, vision_config=self.vision_config)
+        self.assertEqual(summary["processed"], 3)
+        self.assertEqual(summary["failed"], 0)
+
+        with open(self.output_path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(sorted(record["path"] for record in records), sorted(self.paths))
+        for record in records:
+            self.assertEqual(record["hash"], VisionCache.content_hash(record["path"]))
+            self.assertEqual(record["text"], f"text of {os.path.basename(record['path'])}")
+            self.assertIn("total", record["timings"])
+
+        summary = bulk_process(self.image_dir, self.output_path, workers=1,
+                               caption=False, vision_config=self.vision_config)
+        self.assertEqual(summary["processed"], 0)
+        self.assertEqual(summary["skipped"], 3)
+        with open(self.output_path) as f:
+            self.assertEqual(len(f.readlines()), 3)
+
+    def test_cache_errors_do_not_fail_an_image(self):
+        vision_bulk._init_worker({}, caption=False, workers=1)
+        vision_bulk._worker_state["vision_cache"] = LockedCache()
+        with mock.patch("seeker_o1.models.vision_model._ocr_image", return_value="scanned text"), \
+                self.assertLogs(vision_bulk.logger, "WARNING") as logs:
+            record = vision_bulk._process_image(self.paths[0])
+        self.assertNotIn("error", record)
+        self.assertEqual(record["text"], "scanned text")
+        self.assertEqual(len(logs.records), 2)
+
+    def test_a_dead_worker_fails_its_images_and_restarts_the_pool(self):
+        for max_in_flight in (1, 3):
+            FlakyPool.instances = []
+            output_path = os.path.join(self.tmpdir.name, f"flaky-{max_in_flight}.jsonl")
+            with mock.patch.object(vision_bulk, "ProcessPoolExecutor", FlakyPool), \
+                    self.assertLogs(vision_bulk.logger, "WARNING"):
+                summary = bulk_process(self.image_dir, output_path, workers=1, max_in_flight=max_in_flight)
+            self.assertEqual((summary["processed"], summary["failed"], summary["restarts"]), (2, 1, 1))
+            with open(output_path) as f:
+                records = {os.path.basename(record["path"]): record for record in map(json.loads, f)}
+            self.assertIn("Worker process died", records["b.png"]["error"])
+            self.assertEqual(records["c.png"]["text"], "ok")
+            # The failed image is retried when the run is resumed
+            self.assertEqual(load_completed_paths(output_path), set(self.paths) - {self.paths[1]})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageDraw
+
+from seeker_o1.models.vision_cache import VisionCache
+
+def make_image(path, size=(120, 80), fmt="PNG"):
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([10, 10, size[0] // 2, size[1] // 2], fill="black")
+    draw.ellipse([size[0] // 2, size[1] // 3, size[0] - 5, size[1] - 5], fill="gray")
+    image.save(path, fmt)
+
+class TestVisionCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "cache.db")
+        self.image_path = os.path.join(self.tmpdir.name, "image.png")
+        make_image(self.image_path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_miss_then_hit(self):
+        cache = VisionCache(storage_path=self.db_path)
+        self.assertIsNone(cache.lookup(self.image_path))
+        cache.store(self.image_path, text="x = 2")
+        entry = cache.lookup(self.image_path)
+        self.assertEqual(entry["text"], "x = 2")
+        self.assertIsNone(entry["caption"])
+        self.assertEqual(cache.get_stats()["hits"], 1)
+
+    def test_fields_are_merged(self):
+        cache = VisionCache(storage_path=self.db_path)
+        cache.store(self.image_path, text="")
+        cache.store(self.image_path, caption="a black square")
+        entry = cache.lookup(self.image_path)
+        self.assertEqual(entry["text"], "")
+        self.assertEqual(entry["caption"], "a black square")
+
+    def test_persists_across_instances(self):
+        VisionCache(storage_path=self.db_path).store(self.image_path, caption="shapes")
+        entry = VisionCache(storage_path=self.db_path).lookup(self.image_path)
+        self.assertEqual(entry["caption"], "shapes")
+
+    def test_near_duplicate_match(self):
+        resized_path = os.path.join(self.tmpdir.name, "resized.jpg")
+        with Image.open(self.image_path) as image:
+            image.resize((240, 160)).save(resized_path, "JPEG", quality=70)
+
+        exact = VisionCache(storage_path=self.db_path)
+        exact.store(self.image_path, caption="shapes")
+        self.assertIsNone(exact.lookup(resized_path))
+
+        fuzzy = VisionCache(storage_path=self.db_path, perceptual_hash=True)
+        fuzzy.store(self.image_path, caption="shapes")
+        self.assertEqual(fuzzy.lookup(resized_path)["caption"], "shapes")
+
+    def test_difference_hash_compares_right_neighbours(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            value = VisionCache.difference_hash(self.image_path)
+
+        with Image.open(self.image_path) as image:
+            pixels = image.convert("L").resize((9, 8)).tobytes()
+        bits = "".join(
+            "1" if pixels[row * 9 + col] > pixels[row * 9 + col + 1] else "0"
+            for row in range(8) for col in range(8)
+        )
+        self.assertEqual(value, f"{int(bits, 2):016x}")
+
+    def test_counters_are_exact_under_concurrent_lookups(self):
+        cache = VisionCache(storage_path=self.db_path)
+        cache.store(self.image_path, text="x")
+        missing = os.path.join(self.tmpdir.name, "other.png")
+        make_image(missing, size=(60, 60))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda index: cache.lookup(self.image_path if index % 2 else missing), range(200)))
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_rate"]), (100, 100, 0.5))
+
+if __name__ == "__main__":
+    unittest.main()
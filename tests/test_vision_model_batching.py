@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+
+from PIL import Image
+
+from seeker_o1.models import vision_model
+from seeker_o1.models.vision_model import VisionModel
+
+def fake_ocr(image, binarize=False):
+    # Module-level so OCR worker processes can unpickle it
+    if image == "broken.png":
+        raise OSError("cannot identify image file")
+    return f"text of {image}"
+
+class StubProcessor:
+    """Turns images into their widths and widths back into captions."""
+
+    def __call__(self, images=None, return_tensors=None):
+        batch = images if isinstance(images, list) else [images]
+        return {"widths": [image.width for image in batch]}
+
+    def batch_decode(self, out, skip_special_tokens=True):
+        return [f"{width} wide" for width in out]
+
+    def decode(self, out, skip_special_tokens=True):
+        return f"{out} wide"
+
+class StubCaptioner:
+    """Stands in for BLIP; fails any batch holding a 13 pixel wide image."""
+
+    def __init__(self):
+        self.batches = []
+
+    def generate(self, widths, **kwargs):
+        self.batches.append(list(widths))
+        if 13 in widths:
+            raise RuntimeError("corrupt pixel data")
+        return widths
+
+def make_model(ocr_workers=2, batch_size=2):
+    # Skips __init__, which downloads the BLIP weights
+    model = VisionModel.__new__(VisionModel)
+    model.batch_size = batch_size
+    model.ocr_workers = ocr_workers
+    model.ocr_binarize = False
+    model._ocr_pool = None
+    model.inference = dict(vision_model.DEFAULT_INFERENCE_PROFILE)
+    model.processor = StubProcessor()
+    model.model = StubCaptioner()
+    return model
+
+class TestBatchedCaptioning(unittest.TestCase):
+    def test_captions_keep_input_order_across_batches(self):
+        model = make_model(batch_size=2)
+        images = [Image.new("RGB", (width, 8)) for width in (10, 11, 12, 14, 15)]
+        self.assertEqual(model.describe_images(images), ["10 wide", "11 wide", "12 wide", "14 wide", "15 wide"])
+        self.assertEqual(model.model.batches, [[10, 11], [12, 14], [15]])
+
+    def test_a_failing_image_only_loses_its_own_caption(self):
+        model = make_model(batch_size=3)
+        images = [Image.new("RGB", (width, 8)) for width in (10, 13, 12, 14)]
+        with self.assertLogs(vision_model.logger, "WARNING"):
+            captions = model.describe_images(images)
+        self.assertEqual(captions, ["10 wide", "", "12 wide", "14 wide"])
+        # The failed batch is retried image by image; the next batch is unaffected
+        self.assertEqual(model.model.batches, [[10, 13, 12], [10], [13], [12], [14]])
+
+class TestBatchedOcr(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(vision_model, "_ocr_image", fake_ocr)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_texts_keep_input_order_and_failures_are_empty(self):
+        model = make_model(ocr_workers=2)
+        self.addCleanup(model.close)
+        paths = ["a.png", "broken.png", "c.png", "d.png"]
+        with self.assertLogs(vision_model.logger, "WARNING"):
+            texts = model.read_texts(paths)
+        self.assertEqual(texts, ["text of a.png", "", "text of c.png", "text of d.png"])
+        self.assertIsNotNone(model._ocr_pool)
+
+    def test_a_single_image_is_read_in_process(self):
+        model = make_model(ocr_workers=4)
+        self.assertEqual(model.read_texts(["a.png"]), ["text of a.png"])
+        with self.assertLogs(vision_model.logger, "WARNING"):
+            self.assertEqual(model.read_texts(["broken.png"]), [""])
+        self.assertEqual(model.read_texts([]), [])
+        self.assertIsNone(model._ocr_pool)
+
+        serial = make_model(ocr_workers=1)
+        self.assertEqual(serial.read_texts(["a.png", "b.png"]), ["text of a.png", "text of b.png"])
+        self.assertIsNone(serial._ocr_pool)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from PIL import Image, ImageDraw
+
+from seeker_o1.models.vision_pipeline import VisionPipeline
+
+class FakeVisionModel:
+    """Answers OCR at once and captions only after being released or stopped."""
+
+    def __init__(self, text="Invoice 42"):
+        self.text = text
+        self.read = []
+        self.caption_started = threading.Event()
+        self.caption_stopped = threading.Event()
+        self.release_caption = threading.Event()
+
+    def read_text(self, image):
+        self.read.append(image)
+        return self.text
+
+    def describe_image(self, image, stop_event=None):
+        self.caption_started.set()
+        while not self.release_caption.wait(0.01):
+            if stop_event is not None and stop_event.is_set():
+                self.caption_stopped.set()
+                return ""
+        return "a plain square"
+
+class TestVisionPipeline(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.plain = os.path.join(self.tmpdir.name, "plain.png")
+        Image.new("RGB", (200, 200), "white").save(self.plain)
+        self.text = os.path.join(self.tmpdir.name, "text.png")
+        image = Image.new("RGB", (200, 200), "white")
+        draw = ImageDraw.Draw(image)
+        for row in range(10, 190, 12):
+            draw.text((10, row), "Invoice 42 total due", fill="black")
+        image.save(self.text)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_usable_ocr_text_is_selected_and_stops_captioning(self):
+        model = FakeVisionModel()
+        pipeline = VisionPipeline(model)
+        result = pipeline.run(self.text)
+        self.assertEqual((result["source"], result["text"], result["caption"]), ("ocr", "Invoice 42", None))
+        self.assertIn("ocr", result["timings"])
+        self.assertNotIn("caption", result["timings"])
+        if model.caption_started.is_set():
+            self.assertTrue(model.caption_stopped.wait(2))
+        pipeline.shutdown()
+
+    def test_caption_is_used_when_ocr_text_is_unusable(self):
+        model = FakeVisionModel(text=" . ")
+        model.release_caption.set()
+        pipeline = VisionPipeline(model, text_precheck=False)
+        result = pipeline.run(self.text)
+        self.assertEqual((result["source"], result["caption"]), ("caption", "a plain square"))
+        self.assertEqual(set(result["timings"]), {"precheck", "ocr", "caption", "total"})
+        pipeline.shutdown()
+
+    def test_ocr_is_skipped_for_images_without_edges(self):
+        model = FakeVisionModel()
+        model.release_caption.set()
+        pipeline = VisionPipeline(model)
+        self.assertFalse(pipeline.has_text(self.plain))
+        self.assertTrue(pipeline.has_text(self.text))
+        result = pipeline.run(self.plain)
+        self.assertEqual(model.read, [])
+        self.assertEqual((result["source"], result["text"]), ("caption", None))
+        self.assertNotIn("ocr", result["timings"])
+        pipeline.shutdown()
+
+    def test_timings_are_written_by_the_calling_thread_only(self):
+        model = FakeVisionModel(text="")
+        model.release_caption.set()
+        pipeline = VisionPipeline(model, text_precheck=False)
+        callers = []
+        real_timed = VisionPipeline._timed
+
+        def timed(func, *args, **kwargs):
+            callers.append(threading.current_thread().name)
+            return real_timed(func, *args, **kwargs)
+
+        with mock.patch.object(VisionPipeline, "_timed", staticmethod(timed)):
+            result = pipeline.run(self.text)
+        self.assertTrue(all(name.startswith("vision") for name in callers))
+        self.assertGreaterEqual(result["timings"]["total"], result["timings"]["caption"])
+        pipeline.shutdown()
+
+if __name__ == "__main__":
+    unittest.main()
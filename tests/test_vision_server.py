@@ -0,0 +1,109 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from PIL import Image
+
+from seeker_o1.models.vision_server import (
+    AUTHKEY_ENV, VisionClient, VisionServer, _encode_image, parse_address, resolve_authkey
+)
+
+class RecordingVisionModel:
+    """Stands in for the BLIP model and records how requests were batched."""
+
+    def __init__(self):
+        self.caption_batches = []
+        self.ocr_batches = []
+
+    def describe_images(self, images):
+        self.caption_batches.append(len(images))
+        return [f"caption of {self._name(image)}" for image in images]
+
+    def read_texts(self, images):
+        self.ocr_batches.append(len(images))
+        if any(os.path.basename(self._name(image)) == "broken" for image in images):
+            raise ValueError("unreadable image")
+        return [f"text of {self._name(image)}" for image in images]
+
+    @staticmethod
+    def _name(image):
+        return image if isinstance(image, str) else f"{image.width}x{image.height}"
+
+class TestVisionServer(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.address = os.path.join(self.tmpdir.name, "vision.sock")
+        self.model = RecordingVisionModel()
+        self.server = VisionServer(address=self.address, authkey="test", batch_window=0.2,
+                                   vision_model=self.model)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        for _ in range(100):
+            if os.path.exists(self.address):
+                break
+            threading.Event().wait(0.01)
+
+    def tearDown(self):
+        self.server.close()
+        self.tmpdir.cleanup()
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address("127.0.0.1:6010"), ("127.0.0.1", 6010))
+        self.assertEqual(parse_address("/tmp/vision.sock"), "/tmp/vision.sock")
+
+    def test_an_authkey_is_required(self):
+        with mock.patch.dict(os.environ, {AUTHKEY_ENV: ""}):
+            with self.assertRaises(ValueError):
+                resolve_authkey()
+            with self.assertRaises(ValueError):
+                VisionServer(address=self.address + ".other", vision_model=self.model)
+            with self.assertRaises(ValueError):
+                VisionClient(address=self.address)
+        with mock.patch.dict(os.environ, {AUTHKEY_ENV: "test"}):
+            client = VisionClient(address=self.address)
+            self.assertEqual(client.read_text("/ok.png"), "text of /ok.png")
+            client.close()
+
+    def test_relative_paths_are_sent_as_absolute_paths(self):
+        self.assertEqual(_encode_image("scans/page.png"), os.path.abspath("scans/page.png"))
+        client = VisionClient(address=self.address, authkey="test")
+        self.assertEqual(client.describe_image("page.png"), f"caption of {os.path.abspath('page.png')}")
+        client.close()
+
+    def test_concurrent_requests_from_several_clients_are_batched(self):
+        clients = [VisionClient(address=self.address, authkey="test") for _ in range(2)]
+        paths = [os.path.abspath(f"image{i}.png") for i in range(6)]
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            captions = list(executor.map(
+                lambda item: clients[item[0] % 2].describe_image(item[1]), enumerate(paths)
+            ))
+        self.assertEqual(captions, [f"caption of {path}" for path in paths])
+        self.assertEqual(sum(self.model.caption_batches), 6)
+        self.assertLess(len(self.model.caption_batches), 6)
+
+        self.assertEqual(clients[0].read_texts(["/a.png", "/b.png"]), ["text of /a.png", "text of /b.png"])
+        self.assertEqual(clients[0].describe_images([Image.new("RGB", (4, 3))]), ["caption of 4x3"])
+        stats = clients[1].get_stats()
+        self.assertEqual(stats["caption"]["requests"], 7)
+        for client in clients:
+            client.close()
+
+    def test_errors_are_returned_to_the_caller(self):
+        client = VisionClient(address=self.address, authkey="test")
+        with self.assertRaises(RuntimeError):
+            client.read_text("broken")
+        self.assertEqual(client.read_text("/fine.png"), "text of /fine.png")
+        client.close()
+
+    def test_wrong_authkey_is_rejected(self):
+        with self.assertRaises(Exception):
+            VisionClient(address=self.address, authkey="wrong")
+        client = VisionClient(address=self.address, authkey="test")
+        self.assertEqual(client.read_text("/ok.png"), "text of /ok.png")
+        client.close()
+
+if __name__ == "__main__":
+    unittest.main()